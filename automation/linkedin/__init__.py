@@ -1 +1,3 @@
-from .profile_page import ProfilePage
\ No newline at end of file
+from .profile_page import ProfilePage
+from .search_results_page import SearchResultsPage
+from .status_store import RelationshipStatus, RelationshipStatusStore
@@ -1,8 +1,14 @@
 import logging
 from playwright.async_api import Page, Locator
+from automation.tracing import span, traced
 from .selectors.profile_page import LinkedInProfilePageSelectors
+from .selectors.core.keys.profile_page import ProfilePageKey
 from urllib.parse import urlparse
 from enum import Enum
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .status_store import RelationshipStatusStore
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +25,10 @@ class FollowingStatus(Enum):
 
 
 class ProfilePage:
-    def __init__(self, page: Page, profile_url: str):
+    # Human-like pause before confirming an action (benchmarks set this to 0)
+    action_delay_ms = 10000
+
+    def __init__(self, page: Page, profile_url: str, status_store: Optional["RelationshipStatusStore"] = None):
         self.page = page
 
         if not self._is_valid_linkedin_profile_url(profile_url):
@@ -28,36 +37,64 @@ class ProfilePage:
 
         self.profile_url = profile_url
         self.profile = LinkedInProfilePageSelectors(self.page)
+        self.status_store = status_store
+        self._snapshot = None
         logger.debug("Initialized ProfilePage for: %s", profile_url)
 
     # ─────────────────────────────────────────────────────────────
     # Public Methods
     # ─────────────────────────────────────────────────────────────
 
+    @traced("profile.load")
     async def load(self):
         logger.debug("Loading profile page: %s", self.profile_url)
         await self.page.goto(self.profile_url, wait_until="load")
+        self._snapshot = None
         logger.info("Profile page loaded: %s", self.profile_url)
 
+    async def get_detail_page_urls(self) -> dict[str, str]:
+        """
+        Collect this profile's "Show all" detail page links.
+
+        Returns:
+            Mapping of section slug (e.g. "experience") to absolute URL.
+        """
+        hrefs = await self.profile.show_all_links().evaluate_all(
+            "links => links.map(link => link.href)"
+        )
+        profile_id = urlparse(self.profile_url).path.strip("/").split("/")[1].lower()
+
+        detail_urls = {}
+        for href in hrefs:
+            parsed = urlparse(href)
+            paths = [p for p in parsed.path.strip("/").split("/") if p]
+            # EX: /in/zackspear/details/experience/
+            if len(paths) == 4 and paths[0] == "in" and paths[1].lower() == profile_id and paths[2] == "details":
+                detail_urls.setdefault(paths[3], f"{parsed.scheme}://{parsed.netloc}{parsed.path}")
+
+        logger.debug("Found %d detail pages: %s", len(detail_urls), list(detail_urls))
+        return detail_urls
+
+    @traced("profile.action", action="follow")
     async def follow_profile(self):
         following_status = await self._get_following_status()
         logger.debug("Current following status: %s", following_status)
 
         if following_status == FollowingStatus.NOT_FOLLOWING:
             logger.info("Following profile")
-            follow_btn = self.profile.follow_button()
-            await self._click_or_expand_more_menu(follow_btn, "Follow")
+            if await self._click_or_expand_more_menu(ProfilePageKey.FOLLOW_BUTTON, "Follow"):
+                self._record_status(following=FollowingStatus.FOLLOWING)
         else:
             logger.info("Already following this profile")
 
+    @traced("profile.action", action="unfollow")
     async def unfollow_profile(self):
         following_status = await self._get_following_status()
         logger.debug("Current following status: %s", following_status)
 
         if following_status == FollowingStatus.FOLLOWING:
             logger.info("Unfollowing profile")
-            unfollow_btn = self.profile.unfollow_button()
-            await self._click_or_expand_more_menu(unfollow_btn, "Unfollow")
+            await self._click_or_expand_more_menu(ProfilePageKey.UNFOLLOW_BUTTON, "Unfollow")
 
             dialog = await self._wait_for_dialog("clicking Unfollow")
             if not dialog:
@@ -65,21 +102,25 @@ class ProfilePage:
             confirm_unfollow_btn = self.profile.dialog_unfollow_button()
             if await confirm_unfollow_btn.is_visible():
                 await confirm_unfollow_btn.click()
+                self._record_status(following=FollowingStatus.NOT_FOLLOWING)
                 logger.info("Profile unfollowed successfully")
         else:
             logger.info("Already not following this profile")
 
+    @traced("profile.action", action="connect")
     async def send_connection_request(self, note: str = ""):
         connection_status = await self._get_connection_status()
         logger.debug("Current connection status: %s", connection_status)
 
         if connection_status == ConnectionStatus.NOT_CONNECTED:
             logger.info("Sending connection request")
-            await self._send_connection_request(note)
-            logger.info("Connection request sent successfully")
+            if await self._send_connection_request(note):
+                self._record_status(connection=ConnectionStatus.PENDING)
+                logger.info("Connection request sent successfully")
         else:
             logger.info("Cannot send connection request - status is %s", connection_status)
 
+    @traced("profile.action", action="withdraw")
     async def withdraw_connection_request(self):
         connection_status = await self._get_connection_status()
         logger.debug("Current connection status: %s", connection_status)
@@ -89,11 +130,10 @@ class ProfilePage:
             return
 
         logger.info("Withdrawing connection request")
-        pending_btn = self.profile.pending_button()
 
-        await self.page.wait_for_timeout(10000)
+        await self._action_delay()
 
-        if not await self._click_or_expand_more_menu(pending_btn, "Pending"):
+        if not await self._click_or_expand_more_menu(ProfilePageKey.PENDING_BUTTON, "Pending"):
             return
 
         dialog = await self._wait_for_dialog("clicking Pending")
@@ -103,6 +143,7 @@ class ProfilePage:
         withdraw_btn = self.profile.withdraw_button()
         if await withdraw_btn.is_visible():
             await withdraw_btn.click()
+            self._record_status(connection=ConnectionStatus.NOT_CONNECTED)
             logger.info("Connection request withdrawn successfully")
         else:
             logger.error("Could not find 'Withdraw' button")
@@ -111,16 +152,15 @@ class ProfilePage:
     # Private Methods
     # ─────────────────────────────────────────────────────────────
 
-    async def _send_connection_request(self, note: str = ""):
-        connect_btn = self.profile.connect_button()
-
-        if not await self._click_or_expand_more_menu(connect_btn, "Connect"):
-            return
+    async def _send_connection_request(self, note: str = "") -> bool:
+        """Returns True once the request was sent."""
+        if not await self._click_or_expand_more_menu(ProfilePageKey.CONNECT_BUTTON, "Connect"):
+            return False
 
         dialog = await self._wait_for_dialog("clicking Connect")
         if not dialog:
             logger.error("Connection dialog did not appear")
-            return
+            return False
 
         if note:
             logger.debug("Sending connection request with note")
@@ -128,18 +168,20 @@ class ProfilePage:
             if await add_note_btn.is_visible():
                 await add_note_btn.click()
                 await self.profile.message_input().fill(note)
-                await self.page.wait_for_timeout(10000)
+                await self._action_delay()
                 await self.profile.send_button().click()
-            else:
-                logger.warning("'Add a note' button not found")
-        else:
-            logger.debug("Sending connection request without note")
-            await self.page.wait_for_timeout(10000)
-            send_without_note_btn = self.profile.send_without_note_button()
-            if await send_without_note_btn.is_visible():
-                await send_without_note_btn.click()
-            else:
-                logger.warning("'Send without a note' button not found")
+                return True
+            logger.warning("'Add a note' button not found")
+            return False
+
+        logger.debug("Sending connection request without note")
+        await self._action_delay()
+        send_without_note_btn = self.profile.send_without_note_button()
+        if await send_without_note_btn.is_visible():
+            await send_without_note_btn.click()
+            return True
+        logger.warning("'Send without a note' button not found")
+        return False
 
     @staticmethod
     def _is_valid_linkedin_profile_url(profile_url: str) -> bool:
@@ -157,29 +199,43 @@ class ProfilePage:
 
         return len(paths) == 2 and paths[0] == "in"
 
-    async def _click_or_expand_more_menu(self, button: Locator, button_name: str) -> bool:
+    async def _click_or_expand_more_menu(self, key: ProfilePageKey, button_name: str) -> bool:
         """
         Click button directly, or expand More menu first if needed.
 
+        Visibility comes from the action-bar snapshot, so no extra
+        round trip is spent on is_visible().
+
         Returns:
             True if button was clicked successfully, False otherwise.
         """
-        if await button.is_visible():
+        snapshot = await self._action_bar_snapshot()
+        button = self.profile.get(key)
+
+        # Any click changes the action bar, so the snapshot is stale from here
+        self._snapshot = None
+
+        if snapshot[key]["visible"]:
             logger.debug("Clicking '%s' button", button_name)
-            await button.click()
+            with span("profile.click", button=button_name, via="action_bar"):
+                await button.click()
             return True
 
         logger.debug("Button '%s' not visible, expanding More menu", button_name)
-        await self.profile.more_menu_button().click()
-
-        try:
-            await button.wait_for(state="visible", timeout=5000)
-            await button.click()
-            logger.debug("Clicked '%s' button from More menu", button_name)
-            return True
-        except Exception:
-            logger.error("Could not find '%s' even in More menu", button_name)
-            return False
+        with span("profile.more_menu", button=button_name) as current:
+            await self.profile.more_menu_button().click()
+
+            try:
+                await button.wait_for(state="visible", timeout=5000)
+                with span("profile.click", button=button_name, via="more_menu"):
+                    await button.click()
+                logger.debug("Clicked '%s' button from More menu", button_name)
+                return True
+            except Exception:
+                logger.error("Could not find '%s' even in More menu", button_name)
+                if current:
+                    current.set(found=False)
+                return False
 
     async def _wait_for_dialog(self, context: str = "action") -> Locator | None:
         """
@@ -193,24 +249,66 @@ class ProfilePage:
         """
         logger.debug("Waiting for dialog after %s", context)
         dialog = self.profile.dialog()
-        try:
-            await dialog.wait_for(state="visible", timeout=5000)
-            logger.debug("Dialog appeared successfully")
-            return dialog
-        except Exception:
-            logger.warning("Dialog did not appear after %s", context)
-            return None
+        with span("profile.wait_for_dialog", trigger=context) as current:
+            try:
+                await dialog.wait_for(state="visible", timeout=5000)
+                logger.debug("Dialog appeared successfully")
+                return dialog
+            except Exception:
+                logger.warning("Dialog did not appear after %s", context)
+                if current:
+                    current.set(found=False)
+                return None
+
+    async def _action_delay(self):
+        """Human-like pause before confirming, traced separately from real work."""
+        with span("profile.action_delay", delay_ms=self.action_delay_ms):
+            await self.page.wait_for_timeout(self.action_delay_ms)
+
+    async def _action_bar_snapshot(self) -> dict:
+        """
+        Return the action-bar snapshot, probing the page only when needed.
+
+        The snapshot is reused until the next load() or click.
+        """
+        if self._snapshot is None:
+            with span("profile.action_bar_snapshot"):
+                self._snapshot = await self.profile.action_bar_snapshot()
+            logger.debug("Action bar snapshot: %s", self._snapshot)
+        return self._snapshot
 
     async def _get_connection_status(self) -> ConnectionStatus:
-        if await self.profile.connect_button().count():
-            return ConnectionStatus.NOT_CONNECTED
+        snapshot = await self._action_bar_snapshot()
 
-        if await self.profile.pending_button().count():
-            return ConnectionStatus.PENDING
+        if snapshot[ProfilePageKey.CONNECT_BUTTON]["count"]:
+            status = ConnectionStatus.NOT_CONNECTED
+        elif snapshot[ProfilePageKey.PENDING_BUTTON]["count"]:
+            status = ConnectionStatus.PENDING
+        else:
+            status = ConnectionStatus.CONNECTED
 
-        return ConnectionStatus.CONNECTED
+        # CONNECTED is only inferred from missing buttons (e.g. an action bar that
+        # has not rendered yet), so it is stored only if "Remove connection" was seen
+        if status != ConnectionStatus.CONNECTED or snapshot[ProfilePageKey.REMOVE_CONNECTION_BUTTON]["count"]:
+            self._record_status(connection=status)
+        return status
 
     async def _get_following_status(self) -> FollowingStatus:
-        if await self.profile.follow_button().count():
-            return FollowingStatus.NOT_FOLLOWING
-        return FollowingStatus.FOLLOWING
+        snapshot = await self._action_bar_snapshot()
+
+        if snapshot[ProfilePageKey.FOLLOW_BUTTON]["count"]:
+            status = FollowingStatus.NOT_FOLLOWING
+        else:
+            status = FollowingStatus.FOLLOWING
+
+        # Likewise FOLLOWING is stored only if the Unfollow button was seen
+        if status != FollowingStatus.FOLLOWING or snapshot[ProfilePageKey.UNFOLLOW_BUTTON]["count"]:
+            self._record_status(following=status)
+        return status
+
+    def _record_status(
+        self, connection: Optional[ConnectionStatus] = None, following: Optional[FollowingStatus] = None
+    ):
+        """Remember an observed (or just caused) status in the status store, if any."""
+        if self.status_store is not None:
+            self.status_store.record(self.profile_url, connection=connection, following=following)
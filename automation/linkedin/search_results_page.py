@@ -0,0 +1,122 @@
+import json
+import logging
+from playwright.async_api import Page
+from automation.tracing import span, traced
+from .selectors.search_results_page import LinkedInSearchResultsPageSelectors
+from .selectors.core.keys.search_results_page import SearchResultsPageKey
+from urllib.parse import urlencode
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SEARCH_URL = "https://www.linkedin.com/search/results/people/"
+
+# LinkedIn stops paginating people search after 100 pages of 10 results
+MAX_PAGES = 100
+RESULTS_PER_PAGE = 10
+
+
+class SearchResultsPage:
+    """
+    One page of a LinkedIn people search.
+
+    Args:
+        page: Playwright page
+        query: Search keywords
+        filters: Facets as in the search URL, e.g.
+            {"network": ["F", "S"], "geoUrn": ["102713980"]}; list values are
+            encoded the way LinkedIn does (a JSON array).
+        page_index: 1-based result page
+
+    Usage:
+        search = SearchResultsPage(page, "data engineer", {"network": ["S"]}, page_index=2)
+        await search.load()
+        if await search.wait_for_results():
+            last_page = await search.last_page_index(max_pages=10)
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        query: str,
+        filters: Optional[Dict[str, Union[str, List[str]]]] = None,
+        page_index: int = 1,
+    ):
+        if not query.strip():
+            logger.error("Empty search query")
+            raise ValueError("Search query must not be empty.")
+        if not 1 <= page_index <= MAX_PAGES:
+            raise ValueError(f"page_index must be between 1 and {MAX_PAGES}.")
+
+        self.page = page
+        self.query = query
+        self.filters = filters or {}
+        self.page_index = page_index
+        self.url = self.build_url(query, self.filters, page_index)
+        self.results = LinkedInSearchResultsPageSelectors(self.page)
+        logger.debug("Initialized SearchResultsPage %d for: %s", page_index, query)
+
+    @staticmethod
+    def build_url(query: str, filters: Dict[str, Union[str, List[str]]], page_index: int = 1) -> str:
+        params = {"keywords": query}
+        for name, value in filters.items():
+            params[name] = json.dumps(value, separators=(",", ":")) if isinstance(value, list) else value
+        if filters:
+            params["origin"] = "FACETED_SEARCH"
+        if page_index > 1:
+            params["page"] = str(page_index)
+        return f"{SEARCH_URL}?{urlencode(params)}"
+
+    # ─────────────────────────────────────────────────────────────
+    # Public Methods
+    # ─────────────────────────────────────────────────────────────
+
+    @traced("search.load")
+    async def load(self):
+        logger.debug("Loading search page: %s", self.url)
+        await self.page.goto(self.url, wait_until="load")
+        self.results.clear_cache()
+        logger.info("Search page %d loaded: %s", self.page_index, self.query)
+
+    async def wait_for_results(self, timeout_ms: int = 15000) -> int:
+        """
+        Wait until the result cards (or the empty state) render.
+
+        Returns:
+            Number of result cards; 0 past the last page or on timeout.
+        """
+        with span("search.wait_for_results", page_index=self.page_index):
+            try:
+                await self.results.result_card().or_(self.results.no_results()).first.wait_for(timeout=timeout_ms)
+            except Exception:
+                logger.warning("No results rendered within %dms on page %d", timeout_ms, self.page_index)
+                return 0
+            snapshot = await self.results.results_snapshot()
+
+        count = snapshot[SearchResultsPageKey.RESULT_CARD]["count"]
+        logger.debug("Search page %d shows %d results", self.page_index, count)
+        return count
+
+    async def total_results(self) -> int:
+        """Result count from the "About 1,200 results" header (0 if absent)."""
+        header = self.results.results_count()
+        if not await header.count():
+            return 0
+        digits = "".join(ch for ch in await header.first.inner_text() if ch.isdigit())
+        return int(digits) if digits else 0
+
+    async def last_page_index(self, max_pages: int = MAX_PAGES) -> int:
+        """
+        Last page worth visiting, from the result count.
+
+        Without a count, max_pages if a Next button is shown (callers stop at
+        the first empty page), else this page.
+        """
+        total = await self.total_results()
+        if not total:
+            return min(max_pages, MAX_PAGES) if await self.has_next_page() else self.page_index
+        return max(1, min(max_pages, MAX_PAGES, -(-total // RESULTS_PER_PAGE)))
+
+    async def has_next_page(self) -> bool:
+        snapshot = await self.results.snapshot([SearchResultsPageKey.NEXT_BUTTON])
+        return snapshot[SearchResultsPageKey.NEXT_BUTTON]["visible"]
@@ -1,11 +1,69 @@
 import logging
 from playwright.async_api import Page, Locator
-from typing import Union
+from typing import Union, Dict, List, Any, Iterable
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+# Evaluated in the page by BasePage.snapshot(). Mirrors get(): fallback
+# selectors are unioned like .or_(), and children are searched inside every
+# parent match. Like Playwright's XPath engine, an XPath starting with "/" is
+# made relative ("." prefix) when evaluated against an element.
+SNAPSHOT_SCRIPT = """
+(plan) => {
+    const nodes = {};
+    const query = (xpath, root) => {
+        if (xpath.startsWith('/') && root.nodeType !== Node.DOCUMENT_NODE) {
+            xpath = '.' + xpath;
+        }
+        const result = document.evaluate(
+            xpath, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const found = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            found.push(result.snapshotItem(i));
+        }
+        return found;
+    };
+    const resolve = (name) => {
+        if (name in nodes) {
+            return nodes[name];
+        }
+        const entry = plan[name];
+        const roots = entry.parent === null ? [document] : resolve(entry.parent);
+        const matched = new Set();
+        for (const root of roots) {
+            for (const xpath of entry.selectors) {
+                for (const node of query(xpath, root)) {
+                    matched.add(node);
+                }
+            }
+        }
+        nodes[name] = [...matched];
+        return nodes[name];
+    };
+    const isVisible = (el) => {
+        const style = window.getComputedStyle(el);
+        if (style.visibility !== 'visible') {
+            return false;
+        }
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const snapshot = {};
+    for (const name of Object.keys(plan)) {
+        const found = resolve(name);
+        snapshot[name] = {
+            count: found.length,
+            visible: found.some((el) => el.nodeType === Node.ELEMENT_NODE && isVisible(el)),
+        };
+    }
+    return snapshot;
+}
+"""
+
+
 class BasePage:
     def __init__(self, page: Page, registry: dict):
         self.page = page
@@ -61,6 +119,49 @@ class BasePage:
         self._locator_cache[key] = locator
         return locator
 
+    async def snapshot(self, keys: Iterable[Enum]) -> Dict[Enum, Dict[str, Any]]:
+        """
+        Probe several keys in a single page evaluation.
+
+        Resolves every key (and its parent hierarchy) inside the page instead
+        of issuing one count()/is_visible() round trip per locator.
+
+        Args:
+            keys: Enum keys from the registry
+
+        Returns:
+            Mapping of key to {"count": int, "visible": bool}
+        """
+        keys = list(keys)
+        plan = self._build_snapshot_plan(keys)
+        logger.debug("Taking snapshot of %d keys (%d with parents)", len(keys), len(plan))
+
+        raw = await self.page.evaluate(SNAPSHOT_SCRIPT, plan)
+        return {key: raw[key.value] for key in keys}
+
+    def _build_snapshot_plan(self, keys: List[Enum]) -> Dict[str, Dict[str, Any]]:
+        """Collect registry entries for keys and their parents, keyed by enum value."""
+        plan = {}
+        pending = list(keys)
+        while pending:
+            key = pending.pop()
+            if key.value in plan:
+                continue
+
+            entry = self.registry.get(key)
+            if not entry or not entry.get("selectors"):
+                logger.error("No selectors defined for key: %s", key)
+                raise ValueError(f"No selectors defined for key: {key}")
+
+            parent_key = entry.get("parent")
+            plan[key.value] = {
+                "selectors": list(entry["selectors"]),
+                "parent": parent_key.value if parent_key is not None else None,
+            }
+            if parent_key is not None:
+                pending.append(parent_key)
+        return plan
+
     def clear_cache(self):
         """Clear the locator cache. Call after navigation if needed."""
         logger.debug("Locator cache cleared (%d entries)", len(self._locator_cache))
@@ -14,6 +14,9 @@ class ProfilePageKey(Enum):
     
     # Menus
     MORE_MENU_BUTTON = "more_menu_trigger"
+
+    # Links
+    SHOW_ALL_LINK = "show_all_link"
     
     # Dialogs
     DIALOG = "dialog"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+class SearchResultsPageKey(Enum):
+    # Main Sections
+    RESULTS_LIST = "results_list"
+    RESULTS_COUNT = "results_count"
+    NO_RESULTS = "no_results"
+
+    # Result cards (scoped to RESULTS_LIST)
+    RESULT_CARD = "result_card"
+
+    # Pagination
+    NEXT_BUTTON = "next_button"
@@ -62,6 +62,14 @@ PROFILE_PAGE_SELECTORS = {
         "parent": ProfilePageKey.PROFILE_CARD
     },
 
+    # "Show all" links to /in/<id>/details/<section>/ pages
+    ProfilePageKey.SHOW_ALL_LINK: {
+        "selectors": [
+            "//main//a[contains(@href, '/details/')]",
+        ],
+        "parent": None
+    },
+
     # Dialogs (global)
     ProfilePageKey.DIALOG: {
         "selectors": [
@@ -0,0 +1,44 @@
+from .keys.search_results_page import SearchResultsPageKey
+
+SEARCH_RESULTS_PAGE_SELECTORS = {
+    # Results list (Root element - no parent)
+    SearchResultsPageKey.RESULTS_LIST: {
+        "selectors": [
+            "//ul[contains(@class,'reusable-search__entity-result-list')]",
+            "//main//div[contains(@class,'search-results-container')]//ul[@role='list']",
+            "//main//ul[@role='list'][li//a[contains(@href,'/in/')]]",
+        ],
+        "parent": None
+    },
+    SearchResultsPageKey.RESULTS_COUNT: {
+        "selectors": [
+            "//div[contains(@class,'search-results__cluster-title-suffix')]",
+            "//main//h2[contains(normalize-space(.),'results')]",
+        ],
+        "parent": None
+    },
+    SearchResultsPageKey.NO_RESULTS: {
+        "selectors": [
+            "//section[contains(@class,'search-reusable-search-no-results')]",
+            "//main//h2[contains(normalize-space(.),'No results found')]",
+        ],
+        "parent": None
+    },
+
+    # Cards scoped to RESULTS_LIST
+    SearchResultsPageKey.RESULT_CARD: {
+        "selectors": [
+            "/li",
+        ],
+        "parent": SearchResultsPageKey.RESULTS_LIST
+    },
+
+    # Pagination (no parent - searched from page root)
+    SearchResultsPageKey.NEXT_BUTTON: {
+        "selectors": [
+            "//button[contains(@class,'artdeco-pagination__button--next') and not(@disabled)]",
+            "//button[@aria-label='Next' and not(@disabled)]",
+        ],
+        "parent": None
+    },
+}
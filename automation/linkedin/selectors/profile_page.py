@@ -1,4 +1,5 @@
 from playwright.async_api import Page, Locator
+from typing import Dict, Any
 from .core.profile_page import PROFILE_PAGE_SELECTORS
 from .core.keys.profile_page import ProfilePageKey
 from .base_page import BasePage
@@ -16,10 +17,34 @@ class LinkedInProfilePageSelectors(BasePage):
     The get() method is also available for less common selectors:
         selectors.get(ProfilePageKey.REMOVE_CONNECTION_BUTTON)
     """
+
+    # Keys probed together by action_bar_snapshot()
+    ACTION_BAR_KEYS = [
+        ProfilePageKey.CONNECT_BUTTON,
+        ProfilePageKey.PENDING_BUTTON,
+        ProfilePageKey.MESSAGE_BUTTON,
+        ProfilePageKey.FOLLOW_BUTTON,
+        ProfilePageKey.UNFOLLOW_BUTTON,
+        ProfilePageKey.REMOVE_CONNECTION_BUTTON,
+        ProfilePageKey.MORE_MENU_BUTTON,
+    ]
     
     def __init__(self, page: Page):
         super().__init__(page, PROFILE_PAGE_SELECTORS)
 
+    # ─────────────────────────────────────────────────────────────
+    # Snapshot
+    # ─────────────────────────────────────────────────────────────
+
+    async def action_bar_snapshot(self) -> Dict[ProfilePageKey, Dict[str, Any]]:
+        """
+        Returns count/visibility of every action-bar button in one round trip.
+
+        Buttons rendered inside the collapsed More menu show up with
+        count > 0 and visible == False.
+        """
+        return await self.snapshot(self.ACTION_BAR_KEYS)
+
     # ─────────────────────────────────────────────────────────────
     # Connection Status Buttons
     # ─────────────────────────────────────────────────────────────
@@ -52,6 +77,14 @@ class LinkedInProfilePageSelectors(BasePage):
         """Returns the Unfollow button locator."""
         return self.get(ProfilePageKey.UNFOLLOW_BUTTON)
 
+    # ─────────────────────────────────────────────────────────────
+    # Links
+    # ─────────────────────────────────────────────────────────────
+
+    def show_all_links(self) -> Locator:
+        """Returns the "Show all" detail page links locator."""
+        return self.get(ProfilePageKey.SHOW_ALL_LINK)
+
     # ─────────────────────────────────────────────────────────────
     # Dialog & Dialog Actions
     # ─────────────────────────────────────────────────────────────
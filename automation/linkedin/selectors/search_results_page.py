@@ -0,0 +1,61 @@
+from playwright.async_api import Page, Locator
+from typing import Dict, Any
+from .core.search_results_page import SEARCH_RESULTS_PAGE_SELECTORS
+from .core.keys.search_results_page import SearchResultsPageKey
+from .base_page import BasePage
+
+
+class LinkedInSearchResultsPageSelectors(BasePage):
+    """
+    Selector class for LinkedIn people search results pages.
+
+    Usage:
+        selectors = LinkedInSearchResultsPageSelectors(page)
+        await selectors.result_card().first.wait_for()
+    """
+
+    # Keys probed together by results_snapshot()
+    RESULTS_KEYS = [
+        SearchResultsPageKey.RESULT_CARD,
+        SearchResultsPageKey.NO_RESULTS,
+        SearchResultsPageKey.NEXT_BUTTON,
+    ]
+
+    def __init__(self, page: Page):
+        super().__init__(page, SEARCH_RESULTS_PAGE_SELECTORS)
+
+    # ─────────────────────────────────────────────────────────────
+    # Snapshot
+    # ─────────────────────────────────────────────────────────────
+
+    async def results_snapshot(self) -> Dict[SearchResultsPageKey, Dict[str, Any]]:
+        """Returns card count, empty state and pagination in one round trip."""
+        return await self.snapshot(self.RESULTS_KEYS)
+
+    # ─────────────────────────────────────────────────────────────
+    # Results
+    # ─────────────────────────────────────────────────────────────
+
+    def results_list(self) -> Locator:
+        """Returns the results list locator."""
+        return self.get(SearchResultsPageKey.RESULTS_LIST)
+
+    def results_count(self) -> Locator:
+        """Returns the "About N results" header locator."""
+        return self.get(SearchResultsPageKey.RESULTS_COUNT)
+
+    def no_results(self) -> Locator:
+        """Returns the "No results found" empty state locator."""
+        return self.get(SearchResultsPageKey.NO_RESULTS)
+
+    def result_card(self) -> Locator:
+        """Returns the result cards locator."""
+        return self.get(SearchResultsPageKey.RESULT_CARD)
+
+    # ─────────────────────────────────────────────────────────────
+    # Pagination
+    # ─────────────────────────────────────────────────────────────
+
+    def next_button(self) -> Locator:
+        """Returns the enabled Next button locator."""
+        return self.get(SearchResultsPageKey.NEXT_BUTTON)
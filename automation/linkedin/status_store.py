@@ -0,0 +1,142 @@
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Optional
+from crawl.urls import profile_key
+from .profile_page import ConnectionStatus, FollowingStatus
+
+logger = logging.getLogger(__name__)
+
+# Known statuses that make an action a no-op: action -> (status field, statuses)
+NO_OP_STATUSES = {
+    "follow": ("following", {FollowingStatus.FOLLOWING}),
+    "unfollow": ("following", {FollowingStatus.NOT_FOLLOWING}),
+    "connect": ("connection", {ConnectionStatus.CONNECTED, ConnectionStatus.PENDING}),
+    "withdraw": ("connection", {ConnectionStatus.NOT_CONNECTED, ConnectionStatus.CONNECTED}),
+}
+
+
+@dataclass
+class RelationshipStatus:
+    """Last known statuses of one profile; None when unknown or expired."""
+
+    connection: Optional[ConnectionStatus] = None
+    following: Optional[FollowingStatus] = None
+
+
+class RelationshipStatusStore:
+    """
+    Last known ConnectionStatus / FollowingStatus per profile.
+
+    Each status has its own timestamp and is trusted for ttl seconds, so an
+    action runner can skip profiles where the action is a certain no-op
+    (e.g. withdrawing from a profile known to be NOT_CONNECTED) without
+    loading them. Profiles are keyed by crawl.profile_key(), so any URL form
+    of a profile hits the same row.
+
+    Usage:
+        with RelationshipStatusStore("bin/state/relationships.sqlite") as store:
+            if not store.is_no_op(url, "withdraw"):
+                profile = ProfilePage(page, url, status_store=store)
+                await profile.load()
+                await profile.withdraw_connection_request()
+    """
+
+    def __init__(self, path: str, ttl: float = 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS relationship ("
+            " key TEXT PRIMARY KEY,"
+            " connection TEXT, connection_at REAL,"
+            " following TEXT, following_at REAL"
+            ") WITHOUT ROWID"
+        )
+        self.db.commit()
+        logger.debug("RelationshipStatusStore opened at %s (ttl %.0fs)", path, ttl)
+
+    @classmethod
+    def from_config(cls, crawl_config: dict) -> Optional["RelationshipStatusStore"]:
+        """Build a store from the [crawl] config table, or None if disabled."""
+        ttl_hours = crawl_config.get("status_ttl_hours", 24)
+        if not ttl_hours:
+            return None
+        return cls(
+            crawl_config.get("status_store_path", "./bin/state/relationships.sqlite"),
+            ttl=ttl_hours * 3600,
+        )
+
+    def get(self, profile_url: str) -> RelationshipStatus:
+        """Statuses of a profile that are younger than the TTL."""
+        key = profile_key(profile_url)
+        row = self.db.execute(
+            "SELECT connection, connection_at, following, following_at FROM relationship WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return RelationshipStatus()
+
+        connection, connection_at, following, following_at = row
+        now = time.time()
+        return RelationshipStatus(
+            connection=ConnectionStatus(connection) if connection and now - connection_at < self.ttl else None,
+            following=FollowingStatus(following) if following and now - following_at < self.ttl else None,
+        )
+
+    def is_no_op(self, profile_url: str, action: str) -> bool:
+        """
+        True when a fresh status shows action would change nothing.
+
+        Args:
+            action: "follow", "unfollow", "connect" or "withdraw"
+        """
+        if action not in NO_OP_STATUSES:
+            raise ValueError(f"Unknown action: {action}")
+        field, no_op = NO_OP_STATUSES[action]
+        known = getattr(self.get(profile_url), field)
+        if known in no_op:
+            logger.info("Skipping %s for %s: last known status is %s", action, profile_url, known.value)
+            return True
+        return False
+
+    def record(
+        self,
+        profile_url: str,
+        connection: Optional[ConnectionStatus] = None,
+        following: Optional[FollowingStatus] = None,
+    ):
+        """Store the statuses that were observed (or caused) just now; None leaves a status as is."""
+        key = profile_key(profile_url)
+        now = time.time()
+        with self.db:
+            self.db.execute("INSERT OR IGNORE INTO relationship (key) VALUES (?)", (key,))
+            if connection is not None:
+                self.db.execute(
+                    "UPDATE relationship SET connection = ?, connection_at = ? WHERE key = ?",
+                    (connection.value, now, key),
+                )
+            if following is not None:
+                self.db.execute(
+                    "UPDATE relationship SET following = ?, following_at = ? WHERE key = ?",
+                    (following.value, now, key),
+                )
+        logger.debug("Recorded status for %s: connection=%s following=%s", key, connection, following)
+
+    def forget(self, profile_url: str):
+        """Drop what is known about a profile (e.g. after an action failed midway)."""
+        with self.db:
+            self.db.execute("DELETE FROM relationship WHERE key = ?", (profile_key(profile_url),))
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self) -> "RelationshipStatusStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,226 @@
+"""
+Lightweight spans for automation steps.
+
+Spans nest through a ContextVar, so concurrent pages in one event loop get
+separate traces. Finished spans are appended to a JSONL file, one span per
+line, in the OTLP/JSON span shape (traceId, spanId, parentSpanId,
+startTimeUnixNano, ...), so they can be loaded into any OpenTelemetry
+tooling later. Tracing is off until configure() is called; disabled spans
+cost one attribute check.
+
+Usage:
+    from automation import tracing
+
+    tracing.configure("bin/traces/spans.jsonl")
+    with tracing.span("profile.load", url=url):
+        await page.goto(url)
+
+    python -m automation.tracing summary bin/traces/spans.jsonl
+"""
+
+import argparse
+import contextvars
+import functools
+import json
+import logging
+import math
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else ""
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error = ""
+
+    def set(self, **attributes: Any):
+        """Add attributes known only after the span started (e.g. outcome)."""
+        self.attributes.update(attributes)
+
+    def to_otlp(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(val)} for key, val in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+
+
+def _otlp_value(val: Any) -> dict:
+    if isinstance(val, bool):
+        return {"boolValue": val}
+    if isinstance(val, int):
+        return {"intValue": str(val)}
+    if isinstance(val, float):
+        return {"doubleValue": val}
+    return {"stringValue": str(val)}
+
+
+class JsonlExporter:
+    """Appends finished spans to a JSONL file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_otlp()) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_exporter: Optional[JsonlExporter] = None
+
+
+def configure(path: Optional[str]):
+    """Start exporting spans to path (None turns tracing off)."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+    _exporter = JsonlExporter(path) if path else None
+    if path:
+        logger.info("Tracing automation spans to %s", path)
+
+
+def configure_from_config(config: dict):
+    """Apply the [tracing] table of config.toml."""
+    tracing_config = config.get("tracing", {})
+    if tracing_config.get("enabled", False):
+        configure(tracing_config.get("path", "./bin/traces/spans.jsonl"))
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time the block as a child of the current span. Yields None when tracing is off."""
+    if _exporter is None:
+        yield None
+        return
+
+    current = Span(name, _current.get(), attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current.reset(token)
+        _exporter.export(current)
+
+
+def traced(name: str, **attributes: Any):
+    """Decorator: run an async method inside span(name)."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name, **attributes):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ─────────────────────────────────────────────────────────────
+# Summary
+# ─────────────────────────────────────────────────────────────
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def summarize(path: str) -> Dict[str, Dict[str, float]]:
+    """
+    Latency percentiles (ms) per span name, and per step within each action.
+
+    Steps are also reported as "<span>[<action>]" using the nearest ancestor
+    span that carries an "action" attribute.
+    """
+    records = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                record["attributes"] = {
+                    a["key"]: next(iter(a["value"].values())) for a in record.get("attributes", [])
+                }
+                records[record["spanId"]] = record
+
+    def action_of(record: dict) -> Optional[str]:
+        while record is not None:
+            if "action" in record["attributes"]:
+                return record["attributes"]["action"]
+            record = records.get(record["parentSpanId"])
+        return None
+
+    durations: Dict[str, List[float]] = {}
+    for record in records.values():
+        ms = (int(record["endTimeUnixNano"]) - int(record["startTimeUnixNano"])) / 1e6
+        durations.setdefault(record["name"], []).append(ms)
+        action = action_of(record)
+        if action is not None:
+            durations.setdefault(f"{record['name']}[{action}]", []).append(ms)
+
+    summary = {}
+    for name, values in durations.items():
+        values.sort()
+        summary[name] = {
+            "count": len(values),
+            "p50": _percentile(values, 50),
+            "p90": _percentile(values, 90),
+            "p99": _percentile(values, 99),
+            "max": values[-1],
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize automation traces")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    summary_parser = subparsers.add_parser("summary", help="Latency percentiles per step and action")
+    summary_parser.add_argument("path")
+    args = parser.parse_args()
+
+    summary = summarize(args.path)
+    print(f"{'span':<48} {'count':>6} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'max ms':>10}")
+    for name, stats in sorted(summary.items()):
+        print(
+            f"{name:<48} {stats['count']:>6} {stats['p50']:>10.1f} {stats['p90']:>10.1f}"
+            f" {stats['p99']:>10.1f} {stats['max']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import argparse
+import asyncio
+import glob
+import json
+import logging
+import os
+import tempfile
+import time
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, BrowserContext, Route
+
+from browser import load_config
+from automation import tracing
+from automation.linkedin.profile_page import ProfilePage
+from crawl import ResponseClass, classify_response
+from save_loaded_page import parse_linkedin_profile
+from benchmarks.standin_server import StandinServer
+
+logger = logging.getLogger(__name__)
+
+LINKEDIN_HOST = "www.linkedin.com"
+
+
+async def route_to_standin(context: BrowserContext, base_url: str):
+    """Send www.linkedin.com traffic to the stand-in and block every other host."""
+
+    async def handle(route: Route):
+        parsed = urlparse(route.request.url)
+        if parsed.netloc != LINKEDIN_HOST:
+            await route.abort()
+            return
+
+        target = base_url + parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        response = await route.fetch(url=target)
+        await route.fulfill(response=response)
+
+    await context.route("**/*", handle)
+
+
+async def run_capture_benchmark(
+    context: BrowserContext, names: list, concurrency: int, output_dir: str
+) -> dict:
+    """Capture every profile through save_loaded_page.parse_linkedin_profile."""
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def capture(name: str):
+        nonlocal failures
+        async with semaphore:
+            try:
+                page = await parse_linkedin_profile(
+                    context,
+                    profile_url=f"https://{LINKEDIN_HOST}/in/{name}/",
+                    output_path=os.path.join(output_dir, f"{name}.html"),
+                    settle_ms=0,
+                )
+                await page.close()
+            except Exception as e:
+                failures += 1
+                logger.warning("Capture failed for %s: %s", name, e)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(capture(name) for name in names))
+    elapsed = time.perf_counter() - start
+
+    captured = len(names) - failures
+    return {
+        "profiles": captured,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "profiles_per_min": round(captured / elapsed * 60, 1) if elapsed else 0.0,
+    }
+
+
+async def run_action_benchmark(context: BrowserContext, names: list, concurrency: int) -> dict:
+    """
+    Run connect / withdraw / follow / unfollow through ProfilePage on every profile.
+
+    An action counts only when its page load was not hit by an injected
+    error; those are skipped and reported as error_injected.
+    """
+    ProfilePage.action_delay_ms = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    actions = error_injected = failures = 0
+
+    async def act(name: str):
+        nonlocal actions, error_injected, failures
+        async with semaphore:
+            page = await context.new_page()
+            try:
+                profile = ProfilePage(page, f"https://{LINKEDIN_HOST}/in/{name}/")
+                for action in (
+                    profile.send_connection_request,
+                    profile.withdraw_connection_request,
+                    profile.follow_profile,
+                    profile.unfollow_profile,
+                ):
+                    try:
+                        async with page.expect_response(lambda r: r.request.is_navigation_request()) as navigation:
+                            await profile.load()
+                        response = await navigation.value
+                        if classify_response(response.status, page.url) != ResponseClass.OK:
+                            error_injected += 1
+                            continue
+                        await action()
+                        actions += 1
+                    except Exception as e:
+                        failures += 1
+                        logger.warning("%s failed for %s: %s", action.__name__, name, e)
+            finally:
+                await page.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(act(name) for name in names))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "actions": actions,
+        "error_injected": error_injected,
+        "failures": failures,
+        "seconds": round(elapsed, 3),
+        "actions_per_min": round(actions / elapsed * 60, 1) if elapsed else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark against the stand-in server")
+    parser.add_argument("--profiles-dir", default="bin/profiles")
+    parser.add_argument("--count", type=int, default=0, help="Profiles to use (0 = all, repeated to reach count)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--dialog-delay-ms", type=int, default=0)
+    parser.add_argument("--skip-actions", action="store_true")
+    parser.add_argument("--trace", metavar="PATH", help="Write automation spans to this JSONL file")
+    args = parser.parse_args()
+    tracing.configure(args.trace)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    names = sorted(
+        os.path.splitext(os.path.basename(path))[0]
+        for path in glob.glob(os.path.join(args.profiles_dir, "*.html"))
+    )
+    if not names:
+        logger.error("No saved profiles found in %s", args.profiles_dir)
+        return
+    if args.count:
+        names = (names * (args.count // len(names) + 1))[: args.count]
+
+    server = StandinServer(
+        ("127.0.0.1", 0),
+        args.profiles_dir,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        dialog_delay_ms=args.dialog_delay_ms,
+    )
+    server.start()
+
+    browser_config = load_config().get("browser", {})
+    report = {}
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=browser_config.get("args", []))
+            context = await browser.new_context()
+            await route_to_standin(context, server.base_url)
+
+            with tempfile.TemporaryDirectory() as output_dir:
+                report["capture"] = await run_capture_benchmark(context, names, args.concurrency, output_dir)
+            if not args.skip_actions:
+                report["actions"] = await run_action_benchmark(context, names, args.concurrency)
+
+            await browser.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        report["server"] = server.stats
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,311 @@
+"""
+XPath cost linter and timing regression check for the selector registries.
+
+Lint flags XPath shapes that are known to be slow (document-wide scans,
+text() matching inside descendant predicates, ancestor walks). Timing
+resolves every registry key against a corpus of saved pages, the same way
+the owning layer does, and compares the median cost and the match counts
+with a checked-in baseline. The default corpus (benchmarks/corpus) is a
+small set of synthetic pages covering the current and fallback layouts,
+checked in with the baseline it was measured from.
+
+Exit status is non-zero when a key got slower than --threshold, matches a
+different number of nodes than before, has no baseline entry for a key or
+file, or a lint finding is not in the baseline. Existing findings are recorded in the baseline so only new
+costly shapes fail the build.
+
+Timings use lxml (via parsel) for both registries. For the automation
+registry this is a proxy for the browser's document.evaluate(), good for
+spotting relative regressions.
+
+Usage:
+    python -m benchmarks.selector_bench
+    python -m benchmarks.selector_bench --update-baseline
+    python -m benchmarks.selector_bench --corpus bin/profiles --baseline my_baseline.json
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from scrapy import Selector
+
+from extractors.linkedin.selectors.core.registry import PROFILE_REGISTRY
+from extractors.linkedin.selectors.core.search_registry import SEARCH_RESULTS_REGISTRY
+from automation.linkedin.selectors.core.profile_page import PROFILE_PAGE_SELECTORS
+from automation.linkedin.selectors.core.search_results_page import SEARCH_RESULTS_PAGE_SELECTORS
+
+logger = logging.getLogger(__name__)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "selector_baseline.json")
+DEFAULT_CORPUS = os.path.join(BENCH_DIR, "corpus")
+
+
+@dataclass
+class RegistrySpec:
+    registry: dict
+    # "first": first fallback that matches wins (extractors.core.BaseSelector)
+    # "union": fallbacks are unioned like Locator.or_() (automation BasePage)
+    mode: str
+    # Playwright evaluates "/..." against an element as "./..."; parsel does not
+    relative_to_parent: bool
+
+
+REGISTRIES: Dict[str, RegistrySpec] = {
+    "PROFILE_REGISTRY": RegistrySpec(PROFILE_REGISTRY, "first", relative_to_parent=False),
+    "SEARCH_RESULTS_REGISTRY": RegistrySpec(SEARCH_RESULTS_REGISTRY, "first", relative_to_parent=False),
+    "PROFILE_PAGE_SELECTORS": RegistrySpec(PROFILE_PAGE_SELECTORS, "union", relative_to_parent=True),
+    "SEARCH_RESULTS_PAGE_SELECTORS": RegistrySpec(SEARCH_RESULTS_PAGE_SELECTORS, "union", relative_to_parent=True),
+}
+
+
+# ─────────────────────────────────────────────────────────────
+# Lint
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class Finding:
+    registry: str
+    key: str
+    rule: str
+    xpath: str
+
+    @property
+    def id(self) -> str:
+        return f"{self.registry}:{self.key}:{self.rule}:{self.xpath}"
+
+
+# (rule, pattern, why, only when the XPath runs against the whole document)
+LINT_RULES = [
+    (
+        "text-in-descendant-predicate",
+        re.compile(r"\[[^\]]*\.//[^\]]*contains\(\s*text\(\)"),
+        "contains(text(), ...) inside a descendant predicate tests every text node under every candidate",
+        False,
+    ),
+    (
+        "ancestor-axis",
+        re.compile(r"ancestor(-or-self)?::"),
+        "ancestor:: walks back up from every match; anchor on the container instead",
+        False,
+    ),
+    (
+        "descendant-predicate-on-root-scan",
+        re.compile(r"^\(?//[\w*]+\[\s*\.//"),
+        "document-wide scan whose predicate searches each candidate's whole subtree",
+        True,
+    ),
+]
+
+
+def _selectors(entry: dict) -> List[str]:
+    selectors = entry.get("selectors", [])
+    return [selectors] if isinstance(selectors, str) else list(selectors)
+
+
+def lint(name: str, spec: RegistrySpec) -> List[Finding]:
+    findings = []
+    for key, entry in spec.registry.items():
+        scoped = entry.get("parent") is not None
+        for xpath in _selectors(entry):
+            document_wide = not scoped or (xpath.startswith("/") and not spec.relative_to_parent)
+            for rule, pattern, _, root_only in LINT_RULES:
+                if pattern.search(xpath) and (document_wide or not root_only):
+                    findings.append(Finding(name, key.value, rule, xpath))
+            if scoped and xpath.startswith("/") and not spec.relative_to_parent:
+                # parsel evaluates it from the document root despite the parent
+                findings.append(Finding(name, key.value, "absolute-under-parent", xpath))
+            elif not scoped and xpath.startswith("//") and len(_selectors(entry)) > 1:
+                findings.append(Finding(name, key.value, "root-scan-fallback", xpath))
+    return findings
+
+
+RULE_HELP = {rule: message for rule, _, message, _ in LINT_RULES}
+RULE_HELP["absolute-under-parent"] = "starts with '/' under a parent: searches the whole document, not the parent"
+RULE_HELP["root-scan-fallback"] = "root-level '//' fallback: rescans the whole document whenever earlier selectors miss"
+
+
+# ─────────────────────────────────────────────────────────────
+# Timing
+# ─────────────────────────────────────────────────────────────
+
+class _Resolver:
+    """
+    Resolves registry keys against one document with the owning layer's semantics.
+
+    "first" mirrors BaseSelector: a parent resolves to its first node and a
+    key to every match of its first matching fallback (resolve_all).
+    """
+
+    def __init__(self, selector: Selector, spec: RegistrySpec):
+        self.selector = selector
+        self.spec = spec
+        self.nodes: Dict[object, List[Selector]] = {}
+
+    def query(self, key) -> List[Selector]:
+        """Evaluate the key's own selectors against its (already resolved) parents."""
+        entry = self.spec.registry[key]
+        parent = entry.get("parent")
+        roots = [self.selector] if parent is None else self.resolve(parent)
+        if self.spec.mode == "first":
+            roots = roots[:1]
+
+        found = []
+        for root in roots:
+            for xpath in _selectors(entry):
+                if parent is not None and self.spec.relative_to_parent and xpath.startswith("/"):
+                    xpath = "." + xpath
+                matches = root.xpath(xpath)
+                if matches:
+                    found.extend(matches)
+                    if self.spec.mode == "first":
+                        return found
+        return found
+
+    def resolve(self, key) -> List[Selector]:
+        if key not in self.nodes:
+            self.nodes[key] = self.query(key)
+        return self.nodes[key]
+
+
+def time_corpus(files: List[str], repeat: int) -> Dict[str, dict]:
+    """Per registry key: median cost (ms) across files and match count per file."""
+    samples: Dict[str, List[float]] = {}
+    matches: Dict[str, Dict[str, int]] = {}
+
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            selector = Selector(text=f.read())
+        file_name = os.path.basename(path)
+
+        for name, spec in REGISTRIES.items():
+            resolver = _Resolver(selector, spec)
+            for key in spec.registry:
+                parent = spec.registry[key].get("parent")
+                if parent is not None:
+                    resolver.resolve(parent)
+
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    found = resolver.query(key)
+                    best = min(best, time.perf_counter() - start)
+
+                key_id = f"{name}:{key.value}"
+                samples.setdefault(key_id, []).append(best * 1000)
+                matches.setdefault(key_id, {})[file_name] = len(found)
+
+    return {
+        key_id: {"median_ms": round(statistics.median(values), 4), "matches": matches[key_id]}
+        for key_id, values in samples.items()
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# Baseline comparison
+# ─────────────────────────────────────────────────────────────
+
+def compare(
+    current: Dict[str, dict], baseline: Dict[str, dict], threshold: float, min_delta_ms: float
+) -> List[str]:
+    """Describe every key that got slower, whose matches changed or that the baseline lacks."""
+    problems = []
+    for key_id in sorted(baseline.keys() - current.keys()):
+        problems.append(f"{key_id}: in the baseline but no longer measured")
+    for key_id, now in current.items():
+        before = baseline.get(key_id)
+        if before is None:
+            problems.append(f"{key_id}: no baseline entry (run with --update-baseline)")
+            continue
+
+        delta = now["median_ms"] - before["median_ms"]
+        if delta > min_delta_ms and now["median_ms"] > before["median_ms"] * (1 + threshold):
+            problems.append(f"{key_id}: median {before['median_ms']:.3f} ms -> {now['median_ms']:.3f} ms")
+
+        for file_name, count in now["matches"].items():
+            expected = before["matches"].get(file_name)
+            if expected is None:
+                problems.append(f"{key_id}: {file_name} has no baseline match count")
+            elif expected != count:
+                problems.append(f"{key_id}: {file_name} matched {expected} -> {count} nodes")
+        for file_name in sorted(before["matches"].keys() - now["matches"].keys()):
+            problems.append(f"{key_id}: {file_name} is in the baseline but not in the corpus")
+    return problems
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lint and time the XPath selector registries")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Directory of saved profile and search HTML")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown per key")
+    parser.add_argument("--min-delta-ms", type=float, default=0.05, help="Ignore slowdowns smaller than this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lint-only", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    findings = [f for name, spec in REGISTRIES.items() for f in lint(name, spec)]
+    baseline = load_baseline(args.baseline) or {}
+    known = set(baseline.get("lint", []))
+    new_findings = [f for f in findings if f.id not in known]
+
+    for f in findings:
+        marker = "NEW " if f.id not in known else ""
+        print(f"{marker}{f.registry}:{f.key} [{f.rule}] {f.xpath}\n    {RULE_HELP[f.rule]}")
+    print(f"\n{len(findings)} lint findings ({len(new_findings)} new)")
+
+    timings = {}
+    if not args.lint_only:
+        files = sorted(glob.glob(os.path.join(args.corpus, "*.html")))
+        if not files:
+            logger.error("No HTML files in corpus %s", args.corpus)
+            sys.exit(2)
+
+        logger.info("Timing %d files x %d repeats", len(files), args.repeat)
+        timings = time_corpus(files, args.repeat)
+        for key_id, result in sorted(timings.items(), key=lambda item: -item[1]["median_ms"])[:15]:
+            print(f"{result['median_ms']:9.3f} ms  {key_id}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {"lint": sorted(f.id for f in findings), "timings": timings or baseline.get("timings", {})},
+                f,
+                indent=2,
+            )
+        logger.info("Baseline written to %s", args.baseline)
+        return
+
+    problems = [f"new lint finding: {f.id}" for f in new_findings]
+    if timings:
+        problems += compare(timings, baseline.get("timings", {}), args.threshold, args.min_delta_ms)
+
+    if problems:
+        print("\nRegressions:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from automation.linkedin.selectors.core.profile_page import PROFILE_PAGE_SELECTORS
+from automation.linkedin.selectors.core.keys.profile_page import ProfilePageKey
+
+logger = logging.getLogger(__name__)
+
+
+# Injected into every served profile. Renders the action bar for the
+# server-side relationship state, inside the node PROFILE_CARD resolves to
+# (or a synthetic card when the saved page has none), and simulates the
+# More menu and the Connect / Withdraw / Unfollow dialogs.
+STANDIN_SCRIPT = """
+<script>
+(() => {
+    const cfg = window.__STANDIN__;
+    const state = cfg.state;
+
+    const action = (label, onClick) => {
+        const button = document.createElement('button');
+        const span = document.createElement('span');
+        span.textContent = label;
+        button.appendChild(span);
+        button.addEventListener('click', onClick);
+        return button;
+    };
+    const closeDialog = () => {
+        const open = document.getElementById('standin-dialog');
+        if (open) {
+            open.remove();
+        }
+    };
+    const dialog = (build) => {
+        setTimeout(() => {
+            closeDialog();
+            const box = document.createElement('div');
+            box.id = 'standin-dialog';
+            box.setAttribute('role', 'dialog');
+            build(box);
+            document.body.appendChild(box);
+        }, cfg.dialogDelayMs);
+    };
+    const commit = () => {
+        closeDialog();
+        fetch('/__standin/state/' + cfg.profile, {method: 'POST', body: JSON.stringify(state)});
+        render();
+    };
+
+    let bar = document.evaluate(
+        cfg.cardXPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (!bar) {
+        const card = document.createElement('section');
+        card.className = 'artdeco-card';
+        card.innerHTML = '<ul><li>500+ connections</li></ul>';
+        bar = document.createElement('div');
+        card.appendChild(bar);
+        (document.querySelector('main') || document.body).prepend(card);
+    }
+
+    const sendRequest = () => { state.connection = 'pending'; commit(); };
+    const openConnect = () => dialog((box) => {
+        box.appendChild(action('Add a note', () => {
+            const input = document.createElement('textarea');
+            input.name = 'message';
+            box.appendChild(input);
+            box.appendChild(action('Send', sendRequest));
+        }));
+        box.appendChild(action('Send without a note', sendRequest));
+    });
+    const openWithdraw = () => dialog((box) => {
+        box.appendChild(action('Withdraw', () => { state.connection = 'not_connected'; commit(); }));
+    });
+    const openUnfollow = () => dialog((box) => {
+        box.appendChild(action('Unfollow', () => { state.following = false; commit(); }));
+    });
+
+    const render = () => {
+        bar.replaceChildren();
+        const menu = document.createElement('div');
+        menu.style.display = 'none';
+
+        if (state.connection === 'not_connected') {
+            bar.appendChild(action('Connect', openConnect));
+        } else if (state.connection === 'pending') {
+            bar.appendChild(action('Pending', openWithdraw));
+        } else {
+            bar.appendChild(action('Message', () => {}));
+            menu.appendChild(action('Remove connection', () => { state.connection = 'not_connected'; commit(); }));
+        }
+
+        if (state.following) {
+            menu.appendChild(action('Unfollow', openUnfollow));
+        } else {
+            bar.appendChild(action('Follow', () => { state.following = true; commit(); }));
+        }
+
+        bar.appendChild(action('More', () => {
+            menu.style.display = menu.style.display === 'none' ? 'block' : 'none';
+        }));
+        bar.appendChild(menu);
+    };
+    render();
+})();
+</script>
+"""
+
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+BODY_END = re.compile(r"</body\s*>", re.IGNORECASE)
+PROFILE_PATH = re.compile(r"^/in/([^/]+)/?$")
+DETAILS_PATH = re.compile(r"^/in/([^/]+)/details/([^/]+)/?$")
+STATE_PATH = re.compile(r"^/__standin/state/([^/]+)/?$")
+
+DEFAULT_STATE = {"connection": "not_connected", "following": False}
+
+
+class StandinServer(ThreadingHTTPServer):
+    """
+    Local stand-in for www.linkedin.com, serving saved profile captures.
+
+    /in/<name>/ serves <profiles_dir>/<name>.html and /in/<name>/details/<s>/
+    serves <name>.details/<s>.html (the layout save_loaded_page writes).
+    Page scripts are stripped and STANDIN_SCRIPT simulates the action bar,
+    with relationship state kept per profile on the server.
+
+    Args:
+        profiles_dir: Directory of saved captures
+        latency_ms: Delay added to every response
+        error_rate: Fraction of requests answered with an error status
+        error_statuses: Status codes used for injected errors
+        dialog_delay_ms: Delay before a simulated dialog appears
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple,
+        profiles_dir: str,
+        latency_ms: int = 0,
+        error_rate: float = 0.0,
+        error_statuses: tuple = (429, 999),
+        dialog_delay_ms: int = 0,
+    ):
+        super().__init__(address, StandinRequestHandler)
+        self.profiles_dir = profiles_dir
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.dialog_delay_ms = dialog_delay_ms
+        self.states: dict = {}
+        self.stats = {"requests": 0, "served": 0, "errors": 0, "not_found": 0, "actions": 0}
+        self._lock = threading.Lock()
+        self._page_cache: dict = {}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> threading.Thread:
+        """Serve in a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        logger.info("Stand-in server listening on %s", self.base_url)
+        return thread
+
+    def count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def load_page(self, relative_path: str) -> str | None:
+        """Read a saved capture with its scripts stripped (cached)."""
+        if relative_path in self._page_cache:
+            return self._page_cache[relative_path]
+
+        path = os.path.join(self.profiles_dir, relative_path)
+        if not os.path.isfile(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            html = SCRIPT_TAG.sub("", f.read())
+        self._page_cache[relative_path] = html
+        return html
+
+    def render_profile(self, name: str, html: str) -> str:
+        """Inject the stand-in config and action-bar script into a page."""
+        config = {
+            "profile": name,
+            "state": self.states.setdefault(name, dict(DEFAULT_STATE)),
+            "cardXPath": PROFILE_PAGE_SELECTORS[ProfilePageKey.PROFILE_CARD]["selectors"][0],
+            "dialogDelayMs": self.dialog_delay_ms,
+        }
+        injected = f"<script>window.__STANDIN__ = {json.dumps(config)};</script>{STANDIN_SCRIPT}"
+        if BODY_END.search(html):
+            return BODY_END.sub(lambda m: injected + m.group(0), html, count=1)
+        return html + injected
+
+
+class StandinRequestHandler(BaseHTTPRequestHandler):
+    server: StandinServer
+
+    def do_GET(self):
+        if not self._before_request():
+            return
+
+        path = self.path.split("?", 1)[0]
+        match = PROFILE_PATH.match(path)
+        if match:
+            name = match.group(1)
+            html = self.server.load_page(f"{name}.html")
+            if html is not None:
+                return self._send(200, self.server.render_profile(name, html))
+
+        match = DETAILS_PATH.match(path)
+        if match:
+            html = self.server.load_page(os.path.join(f"{match.group(1)}.details", f"{match.group(2)}.html"))
+            if html is not None:
+                return self._send(200, html)
+
+        self.server.count("not_found")
+        self._send(404, "Not found")
+
+    def do_POST(self):
+        match = STATE_PATH.match(self.path)
+        if not match:
+            return self._send(404, "Not found")
+
+        length = int(self.headers.get("Content-Length", 0))
+        state = json.loads(self.rfile.read(length) or b"{}")
+        self.server.states[match.group(1)] = {**DEFAULT_STATE, **state}
+        self.server.count("actions")
+        self._send(204, "")
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _before_request(self) -> bool:
+        """Apply injected latency and errors. Returns False if the request failed."""
+        self.server.count("requests")
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        if random.random() < self.server.error_rate:
+            self.server.count("errors")
+            self._send(random.choice(self.server.error_statuses), "Request failed")
+            return False
+        return True
+
+    def _send(self, status: int, body: str):
+        data = body.encode("utf-8")
+        if status == 200:
+            self.server.count("served")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve saved profiles as a local LinkedIn stand-in")
+    parser.add_argument("--profiles-dir", default="bin/profiles")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--dialog-delay-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    server = StandinServer(
+        (args.host, args.port),
+        args.profiles_dir,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        dialog_delay_ms=args.dialog_delay_ms,
+    )
+    logger.info("Stand-in server listening on %s", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
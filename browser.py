@@ -1,11 +1,25 @@
-from playwright.async_api import async_playwright, BrowserContext, Playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+import argparse
+import asyncio
+import json
 import tomllib
 import sys
 import os
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ENDPOINT_FILE = "./bin/browser/endpoint.json"
+
+# Contexts attached to a `browser.py serve` daemon -> pages they had at attach
+# time; close_browser() leaves those (and the daemon) running
+_attached: "weakref.WeakKeyDictionary[BrowserContext, list[Page]]" = weakref.WeakKeyDictionary()
+
+# Attached contexts -> (api_recorder, http_cache) that close_browser() removes
+# again, so they do not pile up on the daemon's context across runs
+_hooks: "weakref.WeakKeyDictionary[BrowserContext, tuple]" = weakref.WeakKeyDictionary()
+
 
 def load_config():
     logger.debug("Loading config from config.toml")
@@ -21,12 +35,46 @@ def load_config():
         sys.exit(1)
 
 
-async def launch_browser(p: Playwright) -> BrowserContext:
+async def launch_browser(p: Playwright, api_recorder=None, http_cache=None) -> BrowserContext:
+    """
+    Attach to the running browser daemon, or launch the persistent browser
+    context described by config.toml.
+
+    Close the returned context with close_browser(), which leaves a daemon running.
+
+    Args:
+        p: Running Playwright instance
+        api_recorder: Optional capture.ApiResponseRecorder; when given it
+            listens to the responses of every page in the context.
+        http_cache: Optional capture.HttpCache; when given every request
+            of the context is routed through it.
+    """
     config = load_config()
     browser_config = config.get("browser", {})
     context_config = config.get("context", {})
 
-    args = browser_config.get("args", [])
+    context = await attach_browser(p) if browser_config.get("attach", False) else None
+    if context is None:
+        context = await _launch_persistent_context(p, browser_config, context_config)
+
+    if api_recorder is not None:
+        api_recorder.attach(context)
+
+    if http_cache is not None:
+        await http_cache.attach(context)
+
+    if is_attached(context):
+        _hooks[context] = (api_recorder, http_cache)
+
+    logger.debug("Browser context created successfully")
+    return context
+
+
+async def _launch_persistent_context(
+    p: Playwright, browser_config: dict, context_config: dict, extra_args: list[str] = ()
+) -> BrowserContext:
+
+    args = browser_config.get("args", []) + list(extra_args)
     headless = browser_config.get("headless", False)
 
     # Ensure user_data_dir is absolute or relative to CWD correctly
@@ -35,12 +83,210 @@ async def launch_browser(p: Playwright) -> BrowserContext:
     logger.info("Launching browser with headless=%s", headless)
     logger.debug("Using user_data_dir: %s", user_data_path)
 
-    context = await p.chromium.launch_persistent_context(
+    return await p.chromium.launch_persistent_context(
         user_data_dir=user_data_path,
         headless=headless,
         args=args,
         user_agent=context_config.get("user_agent"),
     )
 
-    logger.debug("Browser context created successfully")
+
+# ─────────────────────────────────────────────────────────────
+# Browser Daemon (CDP)
+# ─────────────────────────────────────────────────────────────
+
+
+async def serve_browser(p: Playwright, port: int | None = None) -> None:
+    """
+    Keep the persistent browser context running for other scripts to attach to.
+
+    Chromium is launched with a remote-debugging port and its CDP endpoint is
+    written to [browser] endpoint_file, which launch_browser() reads. Runs
+    until the browser is closed or the process is interrupted.
+    """
+    config = load_config()
+    browser_config = config.get("browser", {})
+    port = port or browser_config.get("cdp_port", 9222)
+    endpoint_file = browser_config.get("endpoint_file", DEFAULT_ENDPOINT_FILE)
+
+    context = await _launch_persistent_context(
+        p,
+        browser_config,
+        config.get("context", {}),
+        extra_args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"],
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(endpoint_file)), exist_ok=True)
+    with open(endpoint_file, "w") as f:
+        json.dump({"endpoint": f"http://127.0.0.1:{port}", "pid": os.getpid()}, f)
+    logger.info("Browser serving CDP on port %d (endpoint in %s)", port, endpoint_file)
+
+    try:
+        await context.wait_for_event("close", timeout=0)
+    finally:
+        if os.path.exists(endpoint_file):
+            os.remove(endpoint_file)
+        logger.info("Browser daemon stopped")
+
+
+async def attach_browser(p: Playwright, timeout_ms: int = 5000) -> BrowserContext | None:
+    """
+    Connect to the persistent context of a running `browser.py serve`.
+
+    Returns:
+        The daemon's context, or None when no daemon is running.
+    """
+    endpoint_file = load_config().get("browser", {}).get("endpoint_file", DEFAULT_ENDPOINT_FILE)
+    try:
+        with open(endpoint_file) as f:
+            endpoint = json.load(f)["endpoint"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+    try:
+        browser = await p.chromium.connect_over_cdp(endpoint, timeout=timeout_ms)
+    except Exception as e:
+        logger.warning("Browser daemon at %s not reachable (%s), launching instead", endpoint, e)
+        return None
+
+    if not browser.contexts:
+        logger.warning("Browser daemon at %s has no context, launching instead", endpoint)
+        await browser.close()
+        return None
+
+    context = browser.contexts[0]
+    _attached[context] = list(context.pages)
+    logger.info("Attached to browser daemon at %s", endpoint)
     return context
+
+
+def is_attached(context: BrowserContext) -> bool:
+    """True when context belongs to a browser daemon rather than this process."""
+    return context in _attached
+
+
+async def close_browser(context: BrowserContext) -> None:
+    """
+    Close a context from launch_browser().
+
+    An attached daemon context only loses the tabs opened since attaching
+    and the recorder and cache hooks launch_browser() installed; the daemon
+    keeps running for the next script.
+    """
+    if not is_attached(context):
+        await context.close()
+        return
+
+    api_recorder, http_cache = _hooks.pop(context, (None, None))
+    if api_recorder is not None:
+        api_recorder.detach(context)
+    if http_cache is not None:
+        await http_cache.detach(context)
+
+    kept = _attached.pop(context)
+    for page in context.pages:
+        if page not in kept and not page.is_closed():
+            await page.close()
+    # Disconnects from a connect_over_cdp() browser without closing it
+    await context.browser.close()
+    logger.debug("Detached from browser daemon")
+
+
+async def export_storage_state(p: Playwright, path: str | None = None) -> str:
+    """
+    Save the logged-in session of the persistent profile as a storage state file.
+
+    Cookies and localStorage are all lightweight contexts need to reuse the
+    session; the user-data dir itself is only opened here.
+
+    Returns:
+        Path of the storage state JSON.
+    """
+    context_config = load_config().get("context", {})
+    path = path or context_config.get("storage_state", "./bin/storage_state.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    context = await launch_browser(p)
+    try:
+        await context.storage_state(path=path)
+    finally:
+        await close_browser(context)
+
+    logger.info("Exported storage state to %s", path)
+    return path
+
+
+async def launch_contexts(
+    p: Playwright, count: int, api_recorder=None, http_cache=None
+) -> tuple[Browser, list[BrowserContext]]:
+    """
+    Launch one browser with count isolated contexts sharing the logged-in session.
+
+    Contexts are created from the exported storage state (exported first if
+    missing), so N workers cost one Chromium process plus N renderer sets
+    instead of N persistent browsers with their own user-data dirs.
+    Close the returned browser to close every context.
+
+    Args:
+        p: Running Playwright instance
+        count: Number of contexts
+        api_recorder: Optional capture.ApiResponseRecorder attached to every context
+        http_cache: Optional capture.HttpCache attached to every context
+    """
+    config = load_config()
+    browser_config = config.get("browser", {})
+    context_config = config.get("context", {})
+
+    state_path = context_config.get("storage_state", "./bin/storage_state.json")
+    if not os.path.exists(state_path):
+        logger.info("No storage state at %s, exporting it from the persistent profile", state_path)
+        await export_storage_state(p, state_path)
+
+    headless = browser_config.get("headless", False)
+    logger.info("Launching browser with %d contexts (headless=%s)", count, headless)
+    browser = await p.chromium.launch(headless=headless, args=browser_config.get("args", []))
+
+    contexts = []
+    for _ in range(count):
+        context = await browser.new_context(
+            storage_state=state_path,
+            user_agent=context_config.get("user_agent"),
+        )
+        if api_recorder is not None:
+            api_recorder.attach(context)
+        if http_cache is not None:
+            await http_cache.attach(context)
+        contexts.append(context)
+
+    logger.debug("Created %d browser contexts", len(contexts))
+    return browser, contexts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browser session utilities")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export-state", help="Save the logged-in session for launch_contexts()")
+    export_parser.add_argument("--path", default=None)
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep the persistent browser running; launch_browser() attaches to it over CDP"
+    )
+    serve_parser.add_argument("--port", type=int, default=None, help="Remote-debugging port ([browser] cdp_port)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    async def run():
+        async with async_playwright() as p:
+            if args.command == "serve":
+                await serve_browser(p, args.port)
+            else:
+                await export_storage_state(p, args.path)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        logger.info("Interrupted")
+
+
+if __name__ == "__main__":
+    main()
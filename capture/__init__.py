@@ -0,0 +1,6 @@
+from .api_recorder import ApiResponseRecorder
+from .http_cache import HttpCache, CacheMode
+from .page_pool import PagePool
+from .snapshot import SnapshotMode, capture_snapshot
+
+__all__ = ["ApiResponseRecorder", "HttpCache", "CacheMode", "PagePool", "SnapshotMode", "capture_snapshot"]
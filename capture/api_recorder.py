@@ -0,0 +1,100 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from playwright.async_api import BrowserContext, Page, Response
+
+logger = logging.getLogger(__name__)
+
+
+class ApiResponseRecorder:
+    """
+    Records the JSON API responses a page fetches while it renders.
+
+    Attach it to a context (or page) before navigating; every response whose
+    URL contains one of url_patterns and whose body is JSON is kept, grouped
+    by the page that triggered it.
+
+    Usage:
+        recorder = ApiResponseRecorder(["/voyager/api/"])
+        recorder.attach(context)
+        await page.goto(url)
+        await recorder.flush()
+        recorder.save(page, "bin/profiles/profile9.api.json")
+    """
+
+    def __init__(self, url_patterns: List[str]):
+        self.url_patterns = url_patterns
+        self._responses: Dict[Page, List[Dict[str, Any]]] = {}
+        self._pending: set = set()
+        logger.debug("ApiResponseRecorder watching %d URL patterns", len(url_patterns))
+
+    @classmethod
+    def from_config(cls, capture_config: dict) -> Optional["ApiResponseRecorder"]:
+        """Build a recorder from the [capture] config table, or None if disabled."""
+        if not capture_config.get("api_responses", False):
+            return None
+        return cls(capture_config.get("api_url_patterns", ["/voyager/api/"]))
+
+    # ─────────────────────────────────────────────────────────────
+    # Public Methods
+    # ─────────────────────────────────────────────────────────────
+
+    def attach(self, target: BrowserContext | Page):
+        """Start listening for responses on a context or a single page."""
+        target.on("response", self._on_response)
+        logger.debug("Response listener attached")
+
+    def detach(self, target: BrowserContext | Page):
+        """Stop listening on a target passed to attach()."""
+        target.remove_listener("response", self._on_response)
+        logger.debug("Response listener detached")
+
+    async def flush(self):
+        """Wait until every matched response body has been read."""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def drain(self, page: Page) -> List[Dict[str, Any]]:
+        """Return and forget the responses recorded for a page."""
+        return self._responses.pop(page, [])
+
+    def save(self, page: Page, output_path: str) -> int:
+        """Drain a page's responses into a JSON file. Returns the count saved."""
+        responses = self.drain(page)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(responses, f)
+        logger.info("Saved %d API responses to %s", len(responses), output_path)
+        return len(responses)
+
+    # ─────────────────────────────────────────────────────────────
+    # Private Methods
+    # ─────────────────────────────────────────────────────────────
+
+    def _on_response(self, response: Response):
+        if not any(pattern in response.url for pattern in self.url_patterns):
+            return
+
+        task = asyncio.ensure_future(self._record(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _record(self, response: Response):
+        content_type = response.headers.get("content-type", "")
+        if "json" not in content_type:
+            return
+
+        try:
+            body = await response.json()
+        except Exception as e:
+            logger.debug("Could not read JSON from %s: %s", response.url, e)
+            return
+
+        page = response.frame.page
+        if page not in self._responses:
+            # Forget undrained responses (e.g. detail tabs) once the page closes
+            page.once("close", lambda closed: self._responses.pop(closed, None))
+        self._responses.setdefault(page, []).append(
+            {"url": response.url, "status": response.status, "body": body}
+        )
+        logger.debug("Recorded API response: %s", response.url)
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import uuid
+from enum import Enum
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from playwright.async_api import BrowserContext, Route
+
+logger = logging.getLogger(__name__)
+
+
+class CacheMode(Enum):
+    RECORD = "record"
+    REPLAY = "replay"
+    BYPASS = "bypass"
+
+
+# Query parameters that change per visit without changing the response
+TRACKING_PARAMS = {"trk", "trkInfo", "lipi", "lici", "midToken", "midSig", "trackingId", "_", "cb"}
+
+# Served from the cache even in RECORD mode; documents and XHR are refetched
+STATIC_RESOURCE_TYPES = {"script", "stylesheet", "image", "font", "media"}
+
+# Dropped from stored headers: bodies are stored decoded
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class HttpCache:
+    """
+    Persistent on-disk response cache for a Playwright context.
+
+    Requests are keyed by method, normalized URL and POST body. Modes:
+        RECORD: static assets come from the cache when present; everything
+                else goes to the network and is (re)stored.
+        REPLAY: everything comes from the cache; misses are aborted, so a
+                recorded session replays deterministically with no network.
+        BYPASS: the cache is not consulted or written.
+
+    Usage:
+        cache = HttpCache("bin/http_cache", CacheMode.RECORD)
+        await cache.attach(context)
+    """
+
+    def __init__(self, cache_dir: str, mode: CacheMode):
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+        logger.debug("HttpCache initialized in %s mode at %s", mode.value, cache_dir)
+
+    @classmethod
+    def from_config(cls, capture_config: dict) -> Optional["HttpCache"]:
+        """Build a cache from the [capture] config table, or None when bypassed."""
+        mode = CacheMode(capture_config.get("http_cache", CacheMode.BYPASS.value))
+        if mode == CacheMode.BYPASS:
+            return None
+        return cls(capture_config.get("http_cache_dir", "bin/http_cache"), mode)
+
+    # ─────────────────────────────────────────────────────────────
+    # Public Methods
+    # ─────────────────────────────────────────────────────────────
+
+    async def attach(self, context: BrowserContext):
+        """Route every request of the context through the cache."""
+        if self.mode == CacheMode.BYPASS:
+            return
+        await context.route("**/*", self._handle)
+        logger.info("HTTP cache attached (%s)", self.mode.value)
+
+    async def detach(self, context: BrowserContext):
+        """Remove the route installed by attach()."""
+        if self.mode == CacheMode.BYPASS:
+            return
+        await context.unroute("**/*", self._handle)
+        logger.debug("HTTP cache detached")
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Lowercase scheme/host, drop fragment and tracking params, sort the query."""
+        parts = urlsplit(url)
+        query = sorted(
+            (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in TRACKING_PARAMS
+        )
+        return urlunsplit((
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path or "/",
+            urlencode(query),
+            "",
+        ))
+
+    def key(self, method: str, url: str, post_data: Optional[bytes] = None) -> str:
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode())
+        digest.update(b" ")
+        digest.update(self.normalize_url(url).encode())
+        if post_data:
+            digest.update(b"\n")
+            digest.update(post_data)
+        return digest.hexdigest()
+
+    # ─────────────────────────────────────────────────────────────
+    # Private Methods
+    # ─────────────────────────────────────────────────────────────
+
+    async def _handle(self, route: Route):
+        request = route.request
+        key = self.key(request.method, request.url, request.post_data_buffer)
+
+        use_cache = self.mode == CacheMode.REPLAY or request.resource_type in STATIC_RESOURCE_TYPES
+        if use_cache:
+            entry = self._load(key)
+            if entry is not None:
+                self.stats["hits"] += 1
+                meta, body = entry
+                await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+                return
+
+        self.stats["misses"] += 1
+        if self.mode == CacheMode.REPLAY:
+            logger.debug("Replay miss, aborting: %s", request.url)
+            await route.abort("internetdisconnected")
+            return
+
+        try:
+            response = await route.fetch()
+        except Exception as e:
+            logger.debug("Fetch failed for %s: %s", request.url, e)
+            await route.abort()
+            return
+
+        body = await response.body()
+        self._store(key, request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    def _paths(self, key: str) -> tuple:
+        directory = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(directory, f"{key}.json"), os.path.join(directory, f"{key}.body")
+
+    def _load(self, key: str) -> Optional[tuple]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return meta, body
+
+    def _store(self, key: str, url: str, status: int, headers: dict, body: bytes):
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        meta = {
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in SKIPPED_HEADERS},
+        }
+        # Write-then-rename so concurrent tabs never read half an entry
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode("utf-8"))):
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self.stats["stored"] += 1
@@ -0,0 +1,157 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+from playwright.async_api import BrowserContext, Dialog, Page
+
+logger = logging.getLogger(__name__)
+
+# Chromium-only; 0 elsewhere, which disables the heap check
+HEAP_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+
+
+class PagePool:
+    """
+    Reuses tabs of one context across profiles.
+
+    acquire() hands out an idle tab (or opens one); release() resets it and
+    keeps up to size tabs idle. A tab is closed instead of reused once it
+    has served max_navigations navigations or its JS heap is above
+    max_heap_mb when released, so renderer memory stays flat over long
+    runs. acquire() never blocks; size only bounds the idle tabs.
+
+    Reset = navigate to about:blank (drops LinkedIn modals and page state),
+    dismiss pending JS dialogs, run reset hooks (e.g. draining an API
+    recorder) and clear_cache() on the selector objects passed to release().
+
+    Usage:
+        pool = PagePool(context, size=4)
+        async with pool.page() as page:
+            await page.goto(url)
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        size: int = 1,
+        max_navigations: int = 200,
+        max_heap_mb: Optional[float] = 512,
+        reset_hooks: Iterable[Callable[[Page], object]] = (),
+    ):
+        self.context = context
+        self.size = size
+        self.max_navigations = max_navigations
+        self.max_heap_mb = max_heap_mb
+        self.reset_hooks: List[Callable[[Page], object]] = list(reset_hooks)
+        self._idle: List[Page] = []
+        self._navigations: Dict[Page, int] = {}
+        self.stats = {"opened": 0, "reused": 0, "closed": 0}
+
+    # ─────────────────────────────────────────────────────────────
+    # Public Methods
+    # ─────────────────────────────────────────────────────────────
+
+    async def acquire(self) -> Page:
+        """Return an idle tab, or a new one if none is idle."""
+        while self._idle:
+            page = self._idle.pop()
+            if not page.is_closed():
+                self.stats["reused"] += 1
+                return page
+            self._navigations.pop(page, None)
+        return await self._open()
+
+    async def release(self, page: Page, selectors: Iterable[object] = ()):
+        """
+        Return a tab to the pool.
+
+        Args:
+            page: Tab from acquire()
+            selectors: Objects bound to the tab with a clear_cache() method
+                (e.g. BasePage subclasses), whose cached locators are reset.
+        """
+        for selector in selectors:
+            selector.clear_cache()
+
+        if page.is_closed():
+            self._navigations.pop(page, None)
+            return
+
+        if len(self._idle) >= self.size or self._navigations.get(page, 0) >= self.max_navigations:
+            await self._close(page, "pool full" if len(self._idle) >= self.size else "navigation limit")
+            return
+
+        # Measured on the page that was used: about:blank gets a fresh heap
+        # (and possibly a fresh renderer process)
+        if self.max_heap_mb is not None:
+            try:
+                heap_mb = await page.evaluate(HEAP_SCRIPT) / 2 ** 20
+            except Exception as e:
+                await self._close(page, f"heap check failed: {e}")
+                return
+            if heap_mb > self.max_heap_mb:
+                await self._close(page, f"JS heap {heap_mb:.0f} MB")
+                return
+
+        try:
+            await self._reset(page)
+        except Exception as e:
+            await self._close(page, f"reset failed: {e}")
+            return
+
+        self._idle.append(page)
+
+    @asynccontextmanager
+    async def page(self, selectors: Iterable[object] = ()) -> AsyncIterator[Page]:
+        """Acquire a tab for the duration of the block."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page, selectors)
+
+    async def close(self):
+        """Close every idle tab."""
+        for page in self._idle:
+            if not page.is_closed():
+                await page.close()
+        self._idle.clear()
+        self._navigations.clear()
+
+    # ─────────────────────────────────────────────────────────────
+    # Private Methods
+    # ─────────────────────────────────────────────────────────────
+
+    async def _open(self) -> Page:
+        page = await self.context.new_page()
+        self._navigations[page] = 0
+        page.on("framenavigated", lambda frame: self._count_navigation(page, frame))
+        page.on("dialog", self._dismiss_dialog)
+        self.stats["opened"] += 1
+        logger.debug("Opened pooled tab (%d open)", len(self._navigations))
+        return page
+
+    def _count_navigation(self, page: Page, frame):
+        if frame == page.main_frame and frame.url != "about:blank" and page in self._navigations:
+            self._navigations[page] += 1
+
+    @staticmethod
+    async def _dismiss_dialog(dialog: Dialog):
+        # Any alert/confirm/beforeunload left open would block the reset navigation
+        try:
+            await dialog.dismiss()
+        except Exception:
+            pass
+
+    async def _reset(self, page: Page):
+        await page.goto("about:blank")
+        for hook in self.reset_hooks:
+            hook(page)
+
+    async def _close(self, page: Page, reason: str):
+        logger.debug("Closing pooled tab after %d navigations (%s)", self._navigations.get(page, 0), reason)
+        self._navigations.pop(page, None)
+        self.stats["closed"] += 1
+        for hook in self.reset_hooks:
+            hook(page)
+        if not page.is_closed():
+            await page.close()
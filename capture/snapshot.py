@@ -0,0 +1,68 @@
+import logging
+from enum import Enum
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotMode(Enum):
+    FULL = "full"
+    MINIMAL = "minimal"
+
+
+# Subtrees the extractors read: <main> holds the top card (with the action
+# bar) and every profile section; the right rail holds "People also viewed"
+KEEP_SELECTORS = ["main", "aside"]
+
+# Never read by the extractors; most of a LinkedIn document by size
+STRIPPED_SELECTORS = ["script", "style", "link", "noscript", "template", "svg", "code", "iframe"]
+
+# Serializes the kept subtrees in the page, so only the small result crosses
+# CDP. Profile links outside them (e.g. the navigation bar) are kept as bare
+# <a href> stubs, in document order, so profile_links extracts the same.
+# Returns null when the page has no <main>, so the caller falls back to the
+# full document.
+MINIMAL_SNAPSHOT_SCRIPT = """
+([keepSelectors, strippedSelectors]) => {
+    const roots = [...document.querySelectorAll(keepSelectors.join(","))];
+    const outermost = roots.filter(root => !roots.some(other => other !== root && other.contains(root)));
+    if (!outermost.some(root => root.matches("main"))) return null;
+
+    // querySelectorAll returns document order, which profile_links preserves
+    const parts = [];
+    for (const node of document.querySelectorAll([...keepSelectors, "a[href*='/in/']"].join(","))) {
+        if (outermost.includes(node)) {
+            const clone = node.cloneNode(true);
+            clone.querySelectorAll(strippedSelectors.join(",")).forEach(child => child.remove());
+            clone.querySelectorAll("[style]").forEach(child => child.removeAttribute("style"));
+            parts.push(clone.outerHTML);
+        } else if (node.matches("a") && !outermost.some(root => root.contains(node))) {
+            const stub = document.createElement("a");
+            stub.setAttribute("href", node.getAttribute("href"));
+            parts.push(stub.outerHTML);
+        }
+    }
+
+    const lang = document.documentElement.getAttribute("lang") || "en";
+    const title = document.createElement("title");
+    title.textContent = document.title;
+    return `<!DOCTYPE html><html lang="${lang}"><head><meta charset="utf-8">${title.outerHTML}</head>`
+        + `<body>${parts.join("")}</body></html>`;
+}
+"""
+
+
+async def capture_snapshot(page: Page, mode: SnapshotMode = SnapshotMode.FULL) -> str:
+    """
+    Serialize the page for the extractors.
+
+    FULL is page.content(). MINIMAL keeps only <main> and <aside> with
+    scripts, styles and icons stripped; the extractors produce the same
+    output from it at a fraction of the size.
+    """
+    if mode == SnapshotMode.MINIMAL:
+        html = await page.evaluate(MINIMAL_SNAPSHOT_SCRIPT, [KEEP_SELECTORS, STRIPPED_SELECTORS])
+        if html is not None:
+            return html
+        logger.warning("No <main> on %s; saving the full document", page.url)
+    return await page.content()
@@ -0,0 +1,11 @@
+from .urls import profile_key, canonicalize_profile_url
+from .seen import BloomFilter, SeenSet
+from .frontier import Frontier, FrontierItem
+from .jobs import Job, JobTable
+from .throttle import AccountThrottle, BlockedResponseError, CircuitBreaker, ResponseClass, classify_response
+
+__all__ = [
+    "profile_key", "canonicalize_profile_url", "BloomFilter", "SeenSet",
+    "Frontier", "FrontierItem", "Job", "JobTable",
+    "AccountThrottle", "BlockedResponseError", "CircuitBreaker", "ResponseClass", "classify_response",
+]
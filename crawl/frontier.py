@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional
+from .jobs import default_owner
+from .urls import profile_key, canonicalize_profile_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FrontierItem:
+    key: str
+    url: str
+    depth: int
+    priority: float
+    attempts: int
+
+
+class Frontier:
+    """
+    Disk-backed priority queue of profiles to capture.
+
+    One row per profile key, so a profile is enqueued at most once and
+    finished profiles are never re-crawled, across restarts. Items are
+    handed out by highest priority, then shallowest depth, then age.
+
+    States: queued -> in_progress -> done | failed (or back to queued).
+    Items left in_progress by a crashed run are requeued on open (pass
+    recover=False when other processes are crawling the same file).
+
+    With lease_seconds set, pop() also reclaims items whose lease expired,
+    so crawlers on several hosts can share one file and a dead crawler's
+    profiles are picked up without a restart. Long captures run inside
+    keep_alive(). Status updates check the lease owner, so a crawler whose
+    lease was reassigned cannot overwrite the new holder's state. Use
+    journal_mode="delete" on network volumes.
+
+    Usage:
+        frontier = Frontier("bin/crawl/frontier.sqlite", max_depth=2)
+        frontier.add("https://www.linkedin.com/in/zackspear/")
+        while (item := frontier.pop()):
+            ...
+            frontier.add_many(links, depth=item.depth + 1, source=item.key)
+            frontier.mark_done(item.key)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_depth: Optional[int] = None,
+        recover: bool = True,
+        lease_seconds: Optional[float] = None,
+        journal_mode: str = "wal",
+        owner: Optional[str] = None,
+    ):
+        self.path = path
+        self.max_depth = max_depth
+        self.lease_seconds = lease_seconds
+        self.owner = owner or default_owner()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.db = sqlite3.connect(path, isolation_level=None, timeout=30)
+        self.db.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS frontier (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                priority REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                source TEXT,
+                enqueued_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                lease_expires REAL NOT NULL DEFAULT 0,
+                owner TEXT
+            );
+            CREATE INDEX IF NOT EXISTS frontier_next
+                ON frontier (status, priority DESC, depth, enqueued_at);
+            """
+        )
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(frontier)")}
+        if "lease_expires" not in columns:
+            self.db.execute("ALTER TABLE frontier ADD COLUMN lease_expires REAL NOT NULL DEFAULT 0")
+        if "owner" not in columns:
+            self.db.execute("ALTER TABLE frontier ADD COLUMN owner TEXT")
+        # Finds expired leases without scanning every in-progress row
+        self.db.execute("CREATE INDEX IF NOT EXISTS frontier_leases ON frontier (status, lease_expires)")
+        recovered = self.recover() if recover else 0
+        if recovered:
+            logger.info("Requeued %d profiles left in progress by a previous run", recovered)
+        logger.debug("Frontier opened at %s", path)
+
+    # ─────────────────────────────────────────────────────────────
+    # Enqueue
+    # ─────────────────────────────────────────────────────────────
+
+    def add(self, url: str, depth: int = 0, priority: Optional[float] = None, source: Optional[str] = None) -> bool:
+        """Enqueue a profile URL. Returns True if it was new."""
+        return self.add_many([url], depth, priority, source) == 1
+
+    def add_many(
+        self,
+        urls: Iterable[str],
+        depth: int = 0,
+        priority: Optional[float] = None,
+        source: Optional[str] = None,
+    ) -> int:
+        """
+        Enqueue profile URLs in one transaction.
+
+        Args:
+            urls: Profile URLs in any form; they are canonicalized
+            depth: Link distance from the seeds
+            priority: Higher is crawled first (default: -depth)
+            source: Profile key the links were discovered on
+
+        Returns:
+            Number of profiles that were not already known.
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            return 0
+        if priority is None:
+            priority = -float(depth)
+
+        now = time.time()
+        rows = []
+        for url in urls:
+            key = profile_key(url)
+            if key is not None:
+                rows.append((key, canonicalize_profile_url(url), depth, priority, source, now, now))
+
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.db.total_changes
+            self.db.executemany(
+                "INSERT OR IGNORE INTO frontier (key, url, depth, priority, source, enqueued_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self.db.total_changes - before
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+
+        logger.debug("Enqueued %d new of %d profile URLs at depth %d", added, len(rows), depth)
+        return added
+
+    # ─────────────────────────────────────────────────────────────
+    # Dequeue & Status
+    # ─────────────────────────────────────────────────────────────
+
+    def pop(self) -> Optional[FrontierItem]:
+        """Claim the next queued (or lease-expired) profile, or None when the frontier is empty."""
+        now = time.time()
+        lease_expires = now + self.lease_seconds if self.lease_seconds else 0
+        row = self.db.execute(
+            """
+            UPDATE frontier
+               SET status = 'in_progress', attempts = attempts + 1, updated_at = ?, lease_expires = ?, owner = ?
+             WHERE key = (
+                   -- Best queued row and best expired lease, each from its own index
+                   SELECT key FROM (
+                       SELECT * FROM (
+                           SELECT key, priority, depth, enqueued_at FROM frontier
+                            WHERE status = 'queued'
+                            ORDER BY priority DESC, depth, enqueued_at
+                            LIMIT 1)
+                       UNION ALL
+                       SELECT * FROM (
+                           SELECT key, priority, depth, enqueued_at FROM frontier
+                            WHERE status = 'in_progress' AND lease_expires > 0 AND lease_expires < ?
+                            ORDER BY priority DESC, depth, enqueued_at
+                            LIMIT 1))
+                    ORDER BY priority DESC, depth, enqueued_at
+                    LIMIT 1)
+            RETURNING key, url, depth, priority, attempts
+            """,
+            (now, lease_expires, self.owner, now),
+        ).fetchone()
+        return FrontierItem(*row) if row else None
+
+    def heartbeat(self, key: str) -> bool:
+        """Extend the lease on a profile that is still being captured. False if it was lost."""
+        if not self.lease_seconds:
+            return True
+        now = time.time()
+        held = self.db.execute(
+            "UPDATE frontier SET lease_expires = ?, updated_at = ?"
+            " WHERE key = ? AND status = 'in_progress' AND owner = ?",
+            (now + self.lease_seconds, now, key, self.owner),
+        ).rowcount
+        if not held:
+            logger.warning("Lease on %s was lost during capture", key)
+        return bool(held)
+
+    @asynccontextmanager
+    async def keep_alive(self, key: str, interval: Optional[float] = None) -> AsyncIterator[None]:
+        """Heartbeat a profile from a background task while the block runs."""
+        if not self.lease_seconds:
+            yield
+            return
+
+        interval = interval or self.lease_seconds / 3
+
+        async def run():
+            while True:
+                await asyncio.sleep(interval)
+                self.heartbeat(key)
+
+        task = asyncio.create_task(run())
+        try:
+            yield
+        finally:
+            task.cancel()
+
+    def mark_done(self, key: str) -> bool:
+        """False if the lease was lost to another crawler."""
+        return self._set_status(key, "done")
+
+    def mark_failed(self, key: str, requeue: bool = True, max_attempts: int = 3) -> bool:
+        """Record a failed capture; requeue it unless it ran out of attempts."""
+        attempts = self.db.execute("SELECT attempts FROM frontier WHERE key = ?", (key,)).fetchone()
+        if requeue and attempts and attempts[0] < max_attempts:
+            return self._set_status(key, "queued")
+        return self._set_status(key, "failed")
+
+    def requeue(self, key: str) -> bool:
+        """Put a profile back without counting the attempt (e.g. the account was throttled)."""
+        updated = self.db.execute(
+            "UPDATE frontier SET status = 'queued', attempts = MAX(attempts - 1, 0), updated_at = ?,"
+            " lease_expires = 0, owner = NULL WHERE key = ? AND status = 'in_progress' AND owner = ?",
+            (time.time(), key, self.owner),
+        ).rowcount
+        if not updated:
+            logger.warning("Lease on %s was lost before it finished", key)
+        return bool(updated)
+
+    def recover(self) -> int:
+        """Requeue profiles stuck in progress (e.g. after a crash)."""
+        return self.db.execute(
+            "UPDATE frontier SET status = 'queued', owner = NULL, updated_at = ? WHERE status = 'in_progress'",
+            (time.time(),),
+        ).rowcount
+
+    def stats(self) -> dict:
+        rows = self.db.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall()
+        return dict(rows)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self) -> "Frontier":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _set_status(self, key: str, status: str) -> bool:
+        updated = self.db.execute(
+            "UPDATE frontier SET status = ?, updated_at = ?, lease_expires = 0, owner = NULL"
+            " WHERE key = ? AND status = 'in_progress' AND owner = ?",
+            (status, time.time(), key, self.owner),
+        ).rowcount
+        if not updated:
+            logger.warning("Lease on %s was lost before it finished", key)
+        return bool(updated)
@@ -0,0 +1,266 @@
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    key: str
+    attempts: int
+    lease_expires: float
+
+
+def default_owner() -> str:
+    """Unique per process, readable in the table (host:pid:random)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobTable:
+    """
+    Lease-based work queue in a SQLite file, for splitting a corpus across
+    processes or hosts without an external service.
+
+    A worker leases jobs for lease_seconds and must heartbeat to keep them.
+    Leases of a worker that died simply expire and the jobs are handed to
+    the next caller of lease(). Completing or failing a job checks the
+    owner, so a worker whose lease was reassigned cannot clobber the new
+    owner's result.
+
+    A job can carry a version (e.g. the file's mtime and size). Adding a
+    known key with a different version requeues it, whatever its status,
+    so changed inputs are processed again.
+
+    Args:
+        path: SQLite file (on the shared volume for multi-host runs)
+        queue: Name of the job queue; several queues can share one file
+        owner: Worker id, defaults to host:pid:random
+        lease_seconds: How long a lease lasts without a heartbeat
+        journal_mode: "wal" is fastest but needs all processes on one host.
+            Use "delete" when hosts share the file over a network volume.
+
+    Usage:
+        jobs = JobTable("bin/jobs.sqlite", queue="extract")
+        jobs.add_many(paths)
+        with jobs.keep_alive():
+            while (batch := jobs.lease(8)):
+                for job in batch:
+                    ...
+                    jobs.complete(job.key)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        queue: str = "default",
+        owner: Optional[str] = None,
+        lease_seconds: float = 300,
+        journal_mode: str = "wal",
+    ):
+        self.path = path
+        self.queue = queue
+        self.owner = owner or default_owner()
+        self.lease_seconds = lease_seconds
+        self.journal_mode = journal_mode
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.db = self._connect()
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                queue TEXT NOT NULL,
+                key TEXT NOT NULL,
+                version TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL DEFAULT 'queued',
+                owner TEXT,
+                lease_expires REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (queue, key)
+            );
+            CREATE INDEX IF NOT EXISTS jobs_next ON jobs (queue, status, lease_expires);
+            """
+        )
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(jobs)")}
+        if "version" not in columns:
+            self.db.execute("ALTER TABLE jobs ADD COLUMN version TEXT NOT NULL DEFAULT ''")
+        logger.debug("JobTable %s opened at %s as %s", queue, path, self.owner)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, isolation_level=None, timeout=60)
+        db.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        return db
+
+    # ─────────────────────────────────────────────────────────────
+    # Enqueue
+    # ─────────────────────────────────────────────────────────────
+
+    def add_many(self, keys: Iterable[str], versions: Optional[Dict[str, str]] = None) -> int:
+        """
+        Enqueue keys not already known, and requeue known keys whose version changed.
+
+        Returns:
+            How many jobs were new or requeued.
+        """
+        now = time.time()
+        versions = versions or {}
+        rows = [(self.queue, key, versions.get(key, ""), now) for key in keys]
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.db.total_changes
+            self.db.executemany(
+                """
+                INSERT INTO jobs (queue, key, version, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (queue, key) DO UPDATE
+                   SET version = excluded.version, status = 'queued', owner = NULL, lease_expires = 0,
+                       attempts = 0, error = NULL, updated_at = excluded.updated_at
+                 WHERE version != excluded.version
+                """,
+                rows,
+            )
+            added = self.db.total_changes - before
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        logger.debug("Enqueued %d new or changed of %d jobs on %s", added, len(rows), self.queue)
+        return added
+
+    # ─────────────────────────────────────────────────────────────
+    # Leases
+    # ─────────────────────────────────────────────────────────────
+
+    def lease(self, limit: int = 1, max_attempts: int = 3) -> List[Job]:
+        """
+        Claim up to limit jobs: queued ones, or leased ones whose lease expired.
+
+        Jobs that already used max_attempts leases are marked failed instead.
+        """
+        now = time.time()
+        expires = now + self.lease_seconds
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease expired too often', updated_at = ?"
+                " WHERE queue = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.queue, now, max_attempts),
+            )
+            rows = self.db.execute(
+                """
+                UPDATE jobs
+                   SET status = 'leased', owner = ?, lease_expires = ?,
+                       attempts = attempts + 1, updated_at = ?
+                 WHERE queue = ? AND key IN (
+                       SELECT key FROM jobs
+                        WHERE queue = ?
+                          AND (status = 'queued' OR (status = 'leased' AND lease_expires < ?))
+                        ORDER BY status DESC, updated_at
+                        LIMIT ?)
+                RETURNING key, attempts, lease_expires
+                """,
+                (self.owner, expires, now, self.queue, self.queue, now, limit),
+            ).fetchall()
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+
+        jobs = [Job(*row) for row in rows]
+        if jobs:
+            logger.debug("Leased %d jobs on %s", len(jobs), self.queue)
+        return jobs
+
+    def heartbeat(self) -> int:
+        """Extend every lease this owner holds. Returns how many are still held."""
+        return self._heartbeat(self.db)
+
+    def _heartbeat(self, db: sqlite3.Connection) -> int:
+        now = time.time()
+        return db.execute(
+            "UPDATE jobs SET lease_expires = ?, updated_at = ?"
+            " WHERE queue = ? AND owner = ? AND status = 'leased' AND lease_expires >= ?",
+            (now + self.lease_seconds, now, self.queue, self.owner, now),
+        ).rowcount
+
+    @contextmanager
+    def keep_alive(self, interval: Optional[float] = None) -> Iterator[None]:
+        """Heartbeat from a background thread (own connection) while the block runs."""
+        interval = interval or self.lease_seconds / 3
+        stop = threading.Event()
+
+        def run():
+            db = self._connect()
+            try:
+                while not stop.wait(interval):
+                    try:
+                        self._heartbeat(db)
+                    except sqlite3.Error as e:
+                        logger.warning("Heartbeat failed on %s: %s", self.queue, e)
+            finally:
+                db.close()
+
+        thread = threading.Thread(target=run, name=f"jobs-heartbeat-{self.queue}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    # ─────────────────────────────────────────────────────────────
+    # Results
+    # ─────────────────────────────────────────────────────────────
+
+    def complete(self, key: str) -> bool:
+        """Mark an owned job done. False if the lease was lost to another worker."""
+        return self._finish(key, "done", None)
+
+    def fail(self, key: str, error: str = "", requeue: bool = True, max_attempts: int = 3) -> bool:
+        """Record a failure; requeue it unless it ran out of attempts."""
+        row = self.db.execute(
+            "SELECT attempts FROM jobs WHERE queue = ? AND key = ?", (self.queue, key)
+        ).fetchone()
+        status = "queued" if requeue and row and row[0] < max_attempts else "failed"
+        return self._finish(key, status, error)
+
+    def release(self) -> int:
+        """Hand back every job this owner still holds (e.g. on shutdown)."""
+        return self.db.execute(
+            "UPDATE jobs SET status = 'queued', owner = NULL, lease_expires = 0, attempts = attempts - 1,"
+            " updated_at = ? WHERE queue = ? AND owner = ? AND status = 'leased'",
+            (time.time(), self.queue, self.owner),
+        ).rowcount
+
+    def stats(self) -> dict:
+        rows = self.db.execute(
+            "SELECT status, COUNT(*) FROM jobs WHERE queue = ? GROUP BY status", (self.queue,)
+        ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self) -> "JobTable":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _finish(self, key: str, status: str, error: Optional[str]) -> bool:
+        finished = self.db.execute(
+            "UPDATE jobs SET status = ?, error = ?, owner = NULL, lease_expires = 0, updated_at = ?"
+            " WHERE queue = ? AND key = ? AND owner = ? AND status = 'leased'",
+            (status, error, time.time(), self.queue, key, self.owner),
+        ).rowcount
+        if not finished:
+            logger.warning("Lease on %s/%s was lost before it finished", self.queue, key)
+        return bool(finished)
@@ -0,0 +1,217 @@
+import hashlib
+import logging
+import math
+import os
+import sqlite3
+import time
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds of added_at overlap when pulling in keys written by other processes
+SYNC_MARGIN = 300
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized from the expected item count and target false-positive rate;
+    about 1.2 bytes per item at 1%. Uses double hashing over one blake2b
+    digest per lookup.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def save(self, path: str, stamp: str = ""):
+        """Write the filter; stamp (one token) identifies the data it was built from."""
+        header = f"{self.capacity} {self.error_rate} {stamp}".strip().encode() + b"\n"
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, capacity: int, error_rate: float, stamp: str = "") -> "BloomFilter | None":
+        """
+        Load a saved filter, or None if missing, smaller than capacity, of
+        another error rate or saved with another stamp.
+        """
+        try:
+            with open(path, "rb") as f:
+                header = f.readline().split()
+                bits = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            saved_capacity = int(header[0])
+        except (IndexError, ValueError):
+            return None
+        if saved_capacity < capacity or [token.decode() for token in header[1:]] != f"{error_rate} {stamp}".split():
+            return None
+        bloom = cls(saved_capacity, error_rate)
+        if len(bits) != len(bloom.bits):
+            return None
+        bloom.bits = bytearray(bits)
+        return bloom
+
+
+class SeenSet:
+    """
+    Memory-compact set of already-seen keys (e.g. profile keys).
+
+    A Bloom filter in memory answers most lookups ("definitely new") without
+    touching disk; its rare positives are confirmed against an exact SQLite
+    table, so the set never reports a false duplicate. The filter is saved
+    next to the database on close, stamped with the row count and newest
+    key, and rebuilt from SQLite when missing or stale (a crash, or other
+    processes writing the same file). Keys another connection commits while
+    the set is open are pulled in before a key is reported new.
+
+    The filter starts at capacity and is rebuilt at least twice as large
+    whenever the stored keys outgrow it, so small sets stay small. With
+    max_age, keys older than that many seconds count as unseen again (e.g.
+    actions that may be repeated once a relationship changed).
+
+    Usage:
+        with SeenSet("bin/seen/captured.sqlite") as seen:
+            if seen.add(profile_key(url)):
+                ...  # first time
+    """
+
+    def __init__(
+        self,
+        path: str,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        max_age: Optional[float] = None,
+    ):
+        self.path = path
+        self.bloom_path = path + ".bloom"
+        self.error_rate = error_rate
+        self.max_age = max_age
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY, added_at REAL NOT NULL) WITHOUT ROWID")
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(seen)")}
+        if "added_at" not in columns:
+            # Keys stored before ages were kept count from now
+            self.db.execute("ALTER TABLE seen ADD COLUMN added_at REAL NOT NULL DEFAULT 0")
+            self.db.execute("UPDATE seen SET added_at = ?", (time.time(),))
+        self.db.commit()
+
+        self._data_version = self._get_data_version()
+        self._synced_at = time.time()
+        self.count = self.db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self.bloom = BloomFilter.load(self.bloom_path, max(capacity, self.count), error_rate, self._stamp())
+        if self.bloom is None:
+            self._rebuild(max(capacity, 2 * self.count))
+        logger.debug("SeenSet opened at %s", path)
+
+    def __contains__(self, key: str) -> bool:
+        if key not in self.bloom:
+            self._sync()
+            if key not in self.bloom:
+                return False
+        row = self.db.execute("SELECT added_at FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None and (self.max_age is None or time.time() - row[0] < self.max_age)
+
+    def add(self, key: str) -> bool:
+        """Add a key. Returns True if it was not seen before (or its entry expired)."""
+        if key in self:
+            return False
+        with self.db:
+            self._insert(key)
+        self._grow_if_full()
+        return True
+
+    def update(self, keys: Iterable[str]) -> int:
+        """Add many keys in one transaction. Returns how many were new."""
+        added = 0
+        with self.db:
+            for key in keys:
+                if key in self:
+                    continue
+                self._insert(key)
+                added += 1
+        self._grow_if_full()
+        return added
+
+    def _insert(self, key: str):
+        # An expired entry is already stored; re-adding refreshes its age
+        before = self.db.total_changes
+        self.db.execute("INSERT OR IGNORE INTO seen (key, added_at) VALUES (?, ?)", (key, time.time()))
+        if self.db.total_changes != before:
+            self.count += 1
+        else:
+            self.db.execute("UPDATE seen SET added_at = ? WHERE key = ?", (time.time(), key))
+        self.bloom.add(key)
+
+    def _grow_if_full(self):
+        if self.count > self.bloom.capacity:
+            self._rebuild(max(2 * self.bloom.capacity, 2 * self.count))
+
+    def _rebuild(self, capacity: int):
+        self.bloom = BloomFilter(capacity, self.error_rate)
+        for (key,) in self.db.execute("SELECT key FROM seen"):
+            self.bloom.add(key)
+        logger.info("Rebuilt seen-set filter for %d keys from %d stored keys", capacity, self.count)
+
+    def _stamp(self) -> str:
+        """Changes whenever keys are added or removed (count, newest added_at)."""
+        count, newest = self.db.execute("SELECT COUNT(*), MAX(added_at) FROM seen").fetchone()
+        return f"{count}:{newest or 0!r}"
+
+    def _get_data_version(self) -> int:
+        return self.db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _sync(self):
+        """Add keys committed by other connections since the last sync to the filter."""
+        version = self._get_data_version()
+        if version == self._data_version:
+            return
+        now = time.time()
+        # Margin for clock differences between hosts sharing the file
+        for (key,) in self.db.execute("SELECT key FROM seen WHERE added_at >= ?", (self._synced_at - SYNC_MARGIN,)):
+            self.bloom.add(key)
+        self._data_version = version
+        self._synced_at = now
+        self.count = self.db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self._grow_if_full()
+
+    def discard(self, key: str):
+        """Forget a key (e.g. a capture that failed). The filter keeps its bits."""
+        with self.db:
+            self.count -= self.db.execute("DELETE FROM seen WHERE key = ?", (key,)).rowcount
+
+    def close(self):
+        self.bloom.save(self.bloom_path, self._stamp())
+        self.db.close()
+
+    def __enter__(self) -> "SeenSet":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
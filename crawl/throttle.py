@@ -0,0 +1,178 @@
+import asyncio
+import logging
+import random
+import time
+from enum import Enum
+from typing import Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = {429, 999}
+
+# Where LinkedIn redirects sessions it no longer trusts
+AUTH_WALL_PATHS = ("/authwall", "/login", "/uas/login", "/signup")
+CHALLENGE_PATHS = ("/checkpoint/",)
+
+
+class ResponseClass(Enum):
+    OK = "ok"
+    THROTTLED = "throttled"
+    AUTH_WALL = "auth_wall"
+    CHALLENGE = "challenge"
+    NOT_FOUND = "not_found"
+    SERVER_ERROR = "server_error"
+
+    @property
+    def blocked(self) -> bool:
+        """The account is being pushed back; count it against the session."""
+        return self in (ResponseClass.THROTTLED, ResponseClass.AUTH_WALL, ResponseClass.CHALLENGE)
+
+
+def classify_response(status: Optional[int], url: str) -> ResponseClass:
+    """
+    Classify a navigation from its final status and URL (after redirects).
+
+    Args:
+        status: HTTP status of the main document, None if there was no response
+        url: Final page URL
+    """
+    path = urlparse(url).path
+    if any(path.startswith(prefix) for prefix in CHALLENGE_PATHS):
+        return ResponseClass.CHALLENGE
+    if any(path.startswith(prefix) for prefix in AUTH_WALL_PATHS):
+        return ResponseClass.AUTH_WALL
+    if status in THROTTLE_STATUSES:
+        return ResponseClass.THROTTLED
+    if status == 404:
+        return ResponseClass.NOT_FOUND
+    if status is None or status >= 500:
+        return ResponseClass.SERVER_ERROR
+    return ResponseClass.OK
+
+
+class BlockedResponseError(Exception):
+    """Navigation answered with something other than the requested page."""
+
+    def __init__(self, response_class: ResponseClass, url: str, status: Optional[int] = None):
+        super().__init__(f"{response_class.value} (status {status}) for {url}")
+        self.response_class = response_class
+        self.url = url
+        self.status = status
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and stays open for
+    cooldown seconds; then lets one trial request through (half-open).
+    A failed trial reopens it with the cooldown doubled, up to max_cooldown.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 900, max_cooldown: float = 3 * 3600):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "open" if self.remaining() > 0 else "half_open"
+
+    def remaining(self) -> float:
+        """Seconds until the next trial request is allowed (0 when closed)."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.cooldown = self.base_cooldown
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open":
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self.opened_at = time.monotonic()
+        elif self.opened_at is None and self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class AccountThrottle:
+    """
+    Backoff and circuit breaker for one LinkedIn account.
+
+    Share one instance across every context/tab logged in as the same
+    account: pushback on any of them slows all of them down.
+
+    Delays grow exponentially with consecutive blocked responses, with full
+    jitter (uniform between 0 and the cap) so parallel workers don't retry
+    in lockstep. Usage:
+
+        throttle = AccountThrottle.from_config(config.get("throttle", {}))
+        await throttle.wait()
+        try:
+            ...  # navigate, raise BlockedResponseError on pushback
+            throttle.record(ResponseClass.OK)
+        except BlockedResponseError as e:
+            throttle.record(e.response_class)
+    """
+
+    def __init__(
+        self,
+        account: str = "default",
+        base_delay: float = 30,
+        max_delay: float = 1800,
+        failure_threshold: int = 5,
+        cooldown: float = 1800,
+    ):
+        self.account = account
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = CircuitBreaker(failure_threshold, cooldown)
+        self.consecutive_blocks = 0
+        self._not_before = 0.0
+
+    @classmethod
+    def from_config(cls, throttle_config: dict, account: str = "default") -> "AccountThrottle":
+        return cls(
+            account=account,
+            base_delay=throttle_config.get("base_delay_s", 30),
+            max_delay=throttle_config.get("max_delay_s", 1800),
+            failure_threshold=throttle_config.get("failure_threshold", 5),
+            cooldown=throttle_config.get("cooldown_s", 1800),
+        )
+
+    async def wait(self):
+        """Sleep until this account may send its next navigation."""
+        while True:
+            delay = max(self._not_before - time.monotonic(), self.breaker.remaining())
+            if delay <= 0:
+                return
+            logger.info(
+                "Account %s paused for %.0fs (breaker %s, %d consecutive blocks)",
+                self.account, delay, self.breaker.state, self.consecutive_blocks,
+            )
+            await asyncio.sleep(delay)
+
+    def record(self, response_class: ResponseClass):
+        """Feed back the outcome of a navigation."""
+        if response_class.blocked or response_class == ResponseClass.SERVER_ERROR:
+            self.consecutive_blocks += 1
+            cap = min(self.max_delay, self.base_delay * 2 ** (self.consecutive_blocks - 1))
+            delay = random.uniform(0, cap)
+            self._not_before = max(self._not_before, time.monotonic() + delay)
+            if response_class.blocked:
+                self.breaker.record_failure()
+            logger.warning(
+                "Account %s got %s; backing off %.0fs (breaker %s)",
+                self.account, response_class.value, delay, self.breaker.state,
+            )
+        else:
+            # 404 is a real answer, not pushback
+            self.consecutive_blocks = 0
+            self.breaker.record_success()
@@ -0,0 +1,60 @@
+import unicodedata
+from typing import Optional
+from urllib.parse import urlsplit, unquote, quote
+
+# linkedin.com, www.linkedin.com, m.linkedin.com, in.linkedin.com, ...
+LINKEDIN_DOMAIN = "linkedin.com"
+
+CANONICAL_PREFIX = "https://www.linkedin.com/in/"
+
+
+def profile_key(url: str) -> Optional[str]:
+    """
+    Reduce any LinkedIn profile URL to its profile key (the vanity name).
+
+    Ignores scheme, host variant (www/m/country subdomains), case, trailing
+    slashes, query strings, fragments and any subpath after the vanity name
+    (locale suffixes like /en, /details/experience/, ...). Percent-encoded
+    names are decoded and Unicode-normalized.
+
+    EX: HTTP://uk.LinkedIn.com/in/Zack%20Spear/en/?trk=abc -> "zack spear"
+
+    Returns:
+        The key, or None if the URL is not a profile URL.
+    """
+    if not url:
+        return None
+
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https"):
+        return None
+
+    host = (parts.hostname or "").lower()
+    if host != LINKEDIN_DOMAIN and not host.endswith("." + LINKEDIN_DOMAIN):
+        return None
+
+    paths = [p for p in parts.path.split("/") if p]
+    if len(paths) < 2 or paths[0].lower() != "in":
+        return None
+
+    name = unicodedata.normalize("NFC", unquote(paths[1])).strip().casefold()
+    return name or None
+
+
+def canonicalize_profile_url(url: str) -> Optional[str]:
+    """
+    Return the canonical form of a profile URL.
+
+    EX: https://www.linkedin.com/in/Zack-Spear?trk=x -> https://www.linkedin.com/in/zack-spear/
+
+    Returns:
+        The canonical URL, or None if the URL is not a profile URL.
+    """
+    key = profile_key(url)
+    if key is None:
+        return None
+    return f"{CANONICAL_PREFIX}{quote(key, safe='-_.~')}/"
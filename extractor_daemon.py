@@ -0,0 +1,295 @@
+"""
+Long-running extraction service with warm worker processes.
+
+Workers import Scrapy/lxml and the selector registries once and stay
+resident, so a single page costs only the extraction itself. Requests and
+responses are newline-delimited JSON over a Unix socket or stdin/stdout:
+
+    {"id": 1, "path": "bin/profiles/profile9.html"}
+    {"id": 2, "html": "<html>...</html>"}
+
+Results stream back as they complete, tagged with the request id, in the
+same shape parser_executor writes to profile.json. A request that overruns
+--timeout or crashes its worker gets an error result; the pool is replaced
+and the other requests in flight are retried on the new one.
+
+Usage:
+    python extractor_daemon.py serve --workers 4
+    python extractor_daemon.py serve --stdio
+    python extractor_daemon.py extract bin/profiles/profile9.html
+
+Only the standard library is imported at module level, so the client side
+starts in milliseconds.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = "/tmp/linkedin-extractor.sock"
+
+# Longest request line a stream accepts; {"html": ...} requests carry whole pages
+STREAM_LIMIT = 2 ** 30
+
+# Small page run once per worker so the first real request is already warm
+WARMUP_HTML = "<html><body><main><section class='artdeco-card'><h1>warmup</h1></section></main></body></html>"
+
+# Per-worker section cache, opened by _init_worker
+_section_cache = None
+
+
+# ═══════════════════════════════════════════════════════════════
+# WORKER SIDE
+# ═══════════════════════════════════════════════════════════════
+
+def _init_worker():
+    """Import the extraction stack, open the section cache and run one warm-up extraction."""
+    import parser_executor
+
+    global _section_cache
+    _section_cache = parser_executor.open_section_cache()
+    parser_executor.extract_data_from_html(WARMUP_HTML)
+
+
+def _process(request: dict) -> dict:
+    """Handle one request inside a worker process."""
+    import traceback
+    import parser_executor
+
+    result = {"id": request.get("id")}
+    try:
+        if "path" in request:
+            file_path = request["path"]
+            result["filename"] = os.path.basename(file_path)
+            if file_path.endswith(".api.json"):
+                data = parser_executor.extract_data_from_api_responses(file_path)
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                data = parser_executor.extract_data_from_html(
+                    content, parser_executor.load_detail_pages(file_path), _section_cache
+                )
+        elif "html" in request:
+            data = parser_executor.extract_data_from_html(
+                request["html"], request.get("details"), _section_cache
+            )
+        else:
+            raise ValueError("Request needs a 'path' or 'html' field")
+
+        result.update({"status": "success", "data": data})
+    except Exception as e:
+        result.update({"status": "error", "error": str(e), "traceback": traceback.format_exc()})
+    return result
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+# ═══════════════════════════════════════════════════════════════
+# SERVER SIDE
+# ═══════════════════════════════════════════════════════════════
+
+class ExtractorDaemon:
+    """Dispatches JSON-line requests to a pool of warm extraction workers."""
+
+    def __init__(self, workers: int, timeout: float | None = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.executor = self._new_executor()
+        # Retries after a crash run one at a time so the culprit only takes itself down
+        self._retry_lock = asyncio.Lock()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def _replace_executor(self, broken: ProcessPoolExecutor, reason: str):
+        """Swap in a fresh pool once per failure; kill the old one's (possibly hung) workers."""
+        if broken is not self.executor:
+            return
+        logger.warning("Restarting extractor workers: %s", reason)
+        self.executor = self._new_executor()
+        # ProcessPoolExecutor cannot cancel a running call, so stop its workers directly
+        for process in list((broken._processes or {}).values()):
+            process.kill()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, request: dict) -> dict:
+        """Process one request, turning worker timeouts and crashes into error results."""
+        try:
+            return await self._run_once(request)
+        except BrokenProcessPool:
+            pass
+        # Either this request killed its worker or another one did; retry once
+        async with self._retry_lock:
+            try:
+                return await self._run_once(request)
+            except BrokenProcessPool:
+                return {"id": request.get("id"), "status": "error", "error": "worker crashed"}
+
+    async def _run_once(self, request: dict) -> dict:
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, _process, request), self.timeout)
+        except asyncio.TimeoutError:
+            self._replace_executor(executor, f"request {request.get('id')} exceeded {self.timeout:.0f}s")
+            return {"id": request.get("id"), "status": "error", "error": f"exceeded {self.timeout:.0f}s budget"}
+        except BrokenProcessPool:
+            self._replace_executor(executor, f"worker died during request {request.get('id')}")
+            raise
+
+    async def warm_up(self):
+        """Start every worker before accepting requests."""
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _ping) for _ in range(self.workers)
+        ))
+        logger.info("Extractor workers ready: %s", sorted(set(pids)))
+
+    async def handle_stream(self, reader: asyncio.StreamReader, write):
+        """Read requests until EOF, writing each result as soon as it is ready."""
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(request: dict):
+            result = await self.run(request)
+            async with write_lock:
+                await write((json.dumps(result) + "\n").encode("utf-8"))
+
+        async def reject(error: str):
+            async with write_lock:
+                await write((json.dumps({"status": "error", "error": error}) + "\n").encode())
+
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError as e:
+                # Line over the limit: readline() has discarded it, keep the client
+                await reject(f"Request too large: {e}")
+                continue
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                await reject(f"Bad request: {e}")
+                continue
+            task = asyncio.create_task(respond(request))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+
+    async def serve_socket(self, socket_path: str):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        async def on_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            async def write(data: bytes):
+                writer.write(data)
+                await writer.drain()
+
+            try:
+                await self.handle_stream(reader, write)
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(on_client, path=socket_path, limit=STREAM_LIMIT)
+        logger.info("Extractor daemon listening on %s", socket_path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+    async def serve_stdio(self):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=STREAM_LIMIT)
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        async def write(data: bytes):
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+
+        await self.handle_stream(reader, write)
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+# ═══════════════════════════════════════════════════════════════
+# CLIENT SIDE
+# ═══════════════════════════════════════════════════════════════
+
+def extract_via_daemon(paths: list, socket_path: str = DEFAULT_SOCKET):
+    """Send file paths to a running daemon and yield results as they arrive."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        for i, path in enumerate(paths):
+            request = {"id": i, "path": os.path.abspath(path)}
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+
+        with sock.makefile("r", encoding="utf-8") as stream:
+            for line in stream:
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm LinkedIn extraction daemon")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Run the daemon")
+    serve_parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    serve_parser.add_argument("--stdio", action="store_true", help="Read requests from stdin instead of a socket")
+    serve_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    serve_parser.add_argument("--timeout", type=float, default=60, help="Per-request budget in seconds (0 = none)")
+
+    extract_parser = subparsers.add_parser("extract", help="Extract files through a running daemon")
+    extract_parser.add_argument("paths", nargs="+")
+    extract_parser.add_argument("--socket", default=DEFAULT_SOCKET)
+
+    args = parser.parse_args()
+
+    if args.command == "extract":
+        for result in extract_via_daemon(args.paths, args.socket):
+            print(json.dumps(result))
+        return
+
+    # Logs go to stderr so --stdio output stays pure JSON lines
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+    daemon = ExtractorDaemon(args.workers, args.timeout or None)
+
+    async def run():
+        await daemon.warm_up()
+        if args.stdio:
+            await daemon.serve_stdio()
+        else:
+            await daemon.serve_socket(args.socket)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.shutdown()
+
+
+if __name__ == "__main__":
+    main()
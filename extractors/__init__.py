@@ -1,4 +1,10 @@
-from .linkedin import LinkedInProfileExtractor
+from .linkedin import (
+    LinkedInProfileExtractor, LinkedInLiveProfileExtractor, LinkedInApiProfileExtractor,
+    LinkedInSearchResultsExtractor, EntityTables,
+)
 
-__all__ = ["LinkedInProfileExtractor"]
+__all__ = [
+    "LinkedInProfileExtractor", "LinkedInLiveProfileExtractor", "LinkedInApiProfileExtractor",
+    "LinkedInSearchResultsExtractor", "EntityTables",
+]
 
@@ -1,5 +1,7 @@
 from .base_selector import BaseSelector
+from .profiler import FileProfile, StackSampler
+from .section_cache import SectionCache
 from .utils import clean_text, parse_int
+from .worker_pool import WorkerPool
 
-__all__ = ["BaseSelector", "clean_text", "parse_int"]
-
+__all__ = ["BaseSelector", "FileProfile", "SectionCache", "StackSampler", "WorkerPool", "clean_text", "parse_int"]
@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+
+class StackSampler:
+    """
+    Statistical CPU profiler for the current process.
+
+    A SIGPROF interval timer interrupts the process every `interval` seconds
+    of CPU time; the handler records the interrupted Python stack. Stacks are
+    kept in collapsed form ("outer;inner;leaf" -> count), the input format of
+    flamegraph.pl, speedscope and inferno. Unix only, main thread only.
+
+    Usage:
+        sampler = StackSampler()
+        sampler.start()
+        ...
+        stacks = sampler.stop()
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._root: Optional[FrameType] = None
+        self._previous_handler = None
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def start(self, root: Optional[FrameType] = None):
+        """Start sampling; stacks are cut above root (e.g. the per-file function) when given."""
+        self.stacks = Counter()
+        self._root = root
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> Dict[str, int]:
+        """Stop sampling and return the collapsed stacks recorded since start()."""
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self._root = None
+        return dict(self.stacks)
+
+    def _sample(self, signum, frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            if frame is self._root:
+                break
+            frame = frame.f_back
+        self.stacks[";".join(reversed(names))] += 1
+
+
+class FileProfile:
+    """
+    Per-file timings for a batch: wall time, CPU samples and section timings.
+
+    Workers call begin()/end() around each file and ship the result back
+    with it; the parent merges them with add() and writes the report.
+
+    A worker killed for overrunning its budget ships nothing back. With
+    progress_dir, workers also write the sections finished so far (and the
+    one running) to <progress_dir>/<file>.json as they go, and the parent
+    records the file with add_timeout().
+    """
+
+    def __init__(self, interval: float = 0.005, progress_dir: Optional[str] = None):
+        self.sampler: Optional[StackSampler] = StackSampler(interval) if StackSampler.available() else None
+        if self.sampler is None:
+            logger.warning("CPU sampling needs setitimer/SIGPROF; only wall-clock timings are recorded")
+        self.progress_dir = progress_dir
+        self.files: Dict[str, dict] = {}
+        self.stacks: Counter = Counter()
+        self._start = 0.0
+        self._file_name: Optional[str] = None
+        self._sections: Dict[str, float] = {}
+
+    def begin(self, file_name: Optional[str] = None):
+        """Start timing a file; stacks are rooted at the caller's frame."""
+        self._file_name = file_name
+        self._sections = {}
+        self._start = time.perf_counter()
+        if self.sampler is not None:
+            self.sampler.start(sys._getframe(1))
+
+    def section(self, name: str, ms: Optional[float]):
+        """Section progress of the current file (ms is None when it starts); an on_section callback."""
+        if ms is not None:
+            self._sections[name] = round(ms, 3)
+        if self.progress_dir and self._file_name:
+            path = self._progress_path(self._file_name)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"sections": self._sections, "running": None if ms is not None else name}, f)
+            os.replace(tmp_path, path)
+
+    def end(self, sections: Optional[Dict[str, float]] = None) -> dict:
+        """Stop timing the current file; returns a picklable record for add()."""
+        stacks = self.sampler.stop() if self.sampler is not None else {}
+        if self.progress_dir and self._file_name:
+            try:
+                os.remove(self._progress_path(self._file_name))
+            except FileNotFoundError:
+                pass
+        self._file_name = None
+        return {
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 3),
+            "sections": {name: round(ms, 3) for name, ms in (sections or {}).items()},
+            "stacks": stacks,
+        }
+
+    def add(self, file_name: str, record: dict):
+        self.stacks.update(record["stacks"])
+        self.files[file_name] = {"total_ms": record["total_ms"], "sections": record["sections"]}
+
+    def add_timeout(self, file_name: str, timeout_ms: float):
+        """Record a file whose worker was killed, with the sections it got through."""
+        progress = {}
+        if self.progress_dir:
+            try:
+                with open(self._progress_path(file_name), "r", encoding="utf-8") as f:
+                    progress = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                pass
+        self.files[file_name] = {
+            "total_ms": round(timeout_ms, 3),
+            "sections": progress.get("sections", {}),
+            "timed_out": True,
+            "running": progress.get("running"),
+        }
+
+    def slowest(self, n: int) -> list:
+        ranked = sorted(self.files.items(), key=lambda item: -item[1]["total_ms"])[:n]
+        return [{"filename": name, **timings} for name, timings in ranked]
+
+    def _progress_path(self, file_name: str) -> str:
+        return os.path.join(self.progress_dir, quote(file_name, safe="") + ".json")
+
+    def write_collapsed(self, path: str):
+        """Write the merged stacks, one "frame;frame;frame count" line each."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
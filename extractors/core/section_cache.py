@@ -0,0 +1,103 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Attributes that change on every render without changing the content
+VOLATILE_ATTRS = re.compile(r'\s(?:id|for|aria-labelledby|aria-describedby|aria-controls)="ember\d+[^"]*"')
+
+
+class SectionCache:
+    """
+    Memoizes extraction results per section subtree.
+
+    Sections are keyed by a hash of their HTML with per-render attributes
+    (Ember ids) stripped, so a byte-identical section in a recaptured
+    profile is served from the cache instead of being re-queried.
+
+    Args:
+        path: Optional SQLite file that keeps results across runs;
+            in memory only when omitted
+        salt: Mixed into every key. Pass something that changes with the
+            extraction logic (e.g. the item XPaths) so stale results are
+            never reused.
+        max_entries: Size of the in-memory LRU in front of SQLite (the
+            whole cache when path is omitted); least recently used
+            sections are evicted beyond it.
+
+    Usage:
+        cache = SectionCache("bin/cache/sections.sqlite", salt=fingerprint)
+        key = cache.key(section.get())
+        items = cache.get(key)
+        if items is None:
+            items = ...
+            cache.put(key, items)
+    """
+
+    def __init__(self, path: Optional[str] = None, salt: str = "", max_entries: int = 10000):
+        self.path = path
+        self.salt = salt.encode("utf-8")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self.db = None
+
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self.db = sqlite3.connect(path, isolation_level=None, timeout=30)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS sections (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        logger.debug("SectionCache opened (%s)", path or "memory")
+
+    def key(self, html: str) -> str:
+        """Hash a section's HTML, ignoring per-render attributes."""
+        normalized = VOLATILE_ATTRS.sub("", html)
+        return hashlib.blake2b(self.salt + normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(self._memory[key])
+
+        if self.db is not None:
+            row = self.db.execute("SELECT value FROM sections WHERE key = ?", (key,)).fetchone()
+            if row:
+                self._remember(key, row[0])
+                self.hits += 1
+                return json.loads(row[0])
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, value: Any):
+        # Stored as JSON so callers can't mutate cached results
+        encoded = json.dumps(value)
+        self._remember(key, encoded)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO sections (key, value) VALUES (?, ?)", (key, encoded))
+
+    def _remember(self, key: str, encoded: str):
+        self._memory[key] = encoded
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def close(self):
+        logger.debug("SectionCache closed: %d hits, %d misses", self.hits, self.misses)
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def __enter__(self) -> "SectionCache":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
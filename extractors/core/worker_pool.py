@@ -0,0 +1,179 @@
+import logging
+import multiprocessing
+import os
+import resource
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_mb() -> float:
+    """Current resident set size of this process in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current, but still bounds growth (KB on Linux)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _worker_main(conn, task: Callable, initializer: Optional[Callable]):
+    if initializer is not None:
+        initializer()
+    while True:
+        item = conn.recv()
+        if item is None:
+            break
+        try:
+            result = task(item)
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        conn.send((result, _rss_mb()))
+    conn.close()
+
+
+class _Worker:
+    def __init__(self, ctx, task: Callable, initializer: Optional[Callable]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, task, initializer), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.item = None
+        self.deadline = None
+
+    def submit(self, item: Any, timeout: Optional[float]):
+        self.item = item
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.tasks += 1
+        self.conn.send(item)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    Process pool for batch extraction with hard per-item limits.
+
+    Unlike ProcessPoolExecutor, a worker that overruns its time budget is
+    killed and replaced, so one pathological file cannot stall the batch.
+    Workers are also recycled after a number of items or once their RSS
+    grows past a threshold (lxml tends to fragment the heap over long runs).
+
+    Args:
+        task: Top-level function run in the worker for each item
+        workers: Number of worker processes
+        timeout: Wall-clock budget per item in seconds (None = unlimited)
+        max_tasks: Recycle a worker after this many items (None = never)
+        max_rss_mb: Recycle a worker once its RSS exceeds this (None = never)
+        initializer: Run once in every new worker (warm-up, caches)
+
+    Usage:
+        pool = WorkerPool(process_file, workers=4, timeout=30)
+        for path, status, result in pool.map(paths):
+            ...  # status is "done" or "timeout"
+    """
+
+    def __init__(
+        self,
+        task: Callable[[Any], Any],
+        workers: int = 1,
+        timeout: Optional[float] = None,
+        max_tasks: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        self.task = task
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_tasks = max_tasks
+        self.max_rss_mb = max_rss_mb
+        self.initializer = initializer
+        self.recycled = 0
+        # Items after which a worker was over max_rss_mb
+        self.memory_exceeded = []
+        self._ctx = multiprocessing.get_context()
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._ctx, self.task, self.initializer)
+
+    def map(self, items: Iterable[Any]) -> Iterator[Tuple[Any, str, Any]]:
+        """Run task over items, yielding (item, status, result) in completion order."""
+        pending = list(items)
+        pending.reverse()
+        idle = [self._spawn() for _ in range(min(self.workers, len(pending)))]
+        busy = {}
+
+        try:
+            while pending or busy:
+                while idle and pending:
+                    worker = idle.pop()
+                    worker.submit(pending.pop(), self.timeout)
+                    busy[worker.conn] = worker
+
+                deadlines = [w.deadline for w in busy.values() if w.deadline is not None]
+                wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                ready = wait(list(busy), timeout=wait_for)
+
+                for conn in ready:
+                    worker = busy.pop(conn)
+                    try:
+                        result, rss_mb = conn.recv()
+                    except EOFError:
+                        # Worker died (e.g. OOM killer) - report and replace it
+                        logger.error("Worker %d exited while processing %s", worker.process.pid, worker.item)
+                        yield worker.item, "crashed", None
+                        worker.kill()
+                        if pending:
+                            idle.append(self._spawn())
+                        continue
+
+                    yield worker.item, "done", result
+                    if self._should_recycle(worker, rss_mb):
+                        worker.stop()
+                        self.recycled += 1
+                        if not pending:
+                            continue
+                        worker = self._spawn()
+                    idle.append(worker)
+
+                now = time.monotonic()
+                for conn, worker in list(busy.items()):
+                    if worker.deadline is not None and worker.deadline <= now:
+                        logger.warning("Killing worker %d: %s exceeded %.0fs", worker.process.pid, worker.item, self.timeout)
+                        del busy[conn]
+                        worker.kill()
+                        yield worker.item, "timeout", None
+                        if pending:
+                            idle.append(self._spawn())
+        finally:
+            for worker in busy.values():
+                worker.kill()
+            for worker in idle:
+                worker.stop()
+
+    def _should_recycle(self, worker: _Worker, rss_mb: float) -> bool:
+        if self.max_tasks is not None and worker.tasks >= self.max_tasks:
+            logger.debug("Recycling worker %d after %d items", worker.process.pid, worker.tasks)
+            return True
+        if self.max_rss_mb is not None and rss_mb > self.max_rss_mb:
+            self.memory_exceeded.append((worker.item, rss_mb))
+            logger.info("Recycling worker %d at %.0f MB RSS", worker.process.pid, rss_mb)
+            return True
+        return False
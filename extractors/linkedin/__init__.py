@@ -1,4 +1,11 @@
 from .profile_extractor import LinkedInProfileExtractor
+from .live_profile_extractor import LinkedInLiveProfileExtractor
+from .api_profile_extractor import LinkedInApiProfileExtractor
+from .search_results_extractor import LinkedInSearchResultsExtractor
+from .entities import EntityTables
 
-__all__ = ["LinkedInProfileExtractor"]
+__all__ = [
+    "LinkedInProfileExtractor", "LinkedInLiveProfileExtractor", "LinkedInApiProfileExtractor",
+    "LinkedInSearchResultsExtractor", "EntityTables",
+]
 
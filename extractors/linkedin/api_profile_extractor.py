@@ -0,0 +1,270 @@
+import logging
+from typing import Optional, List, Dict, Any
+from extractors.core.utils import clean_text
+from .profile_extractor import LinkedInProfileExtractor, LINKEDIN_ORIGIN
+
+logger = logging.getLogger(__name__)
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# API Entity Registry
+#
+# Maps the last segment of an entity's "$type" (shared by the legacy and dash
+# Voyager models) to the output field and the attributes that fill an item's
+# title / subtitle / meta values. Each attribute slot lists fallbacks in order,
+# same idea as the XPath registries.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+API_SECTIONS = {
+    "Position": {
+        "field": "experience",
+        "title": ["title"],
+        "subtitle": ["companyName"],
+        "meta": [["dateRange", "timePeriod"], ["locationName", "geoLocationName"]],
+    },
+    "Education": {
+        "field": "education",
+        "title": ["schoolName"],
+        "subtitle": ["degreeName", "fieldOfStudy"],
+        "meta": [["dateRange", "timePeriod"]],
+    },
+    "Skill": {
+        "field": "skills",
+        "title": ["name"],
+        "subtitle": [],
+        "meta": [],
+    },
+    "Certification": {
+        "field": "licenses_and_certifications",
+        "title": ["name"],
+        "subtitle": ["authority"],
+        "meta": [["dateRange", "timePeriod"]],
+    },
+    "VolunteerExperience": {
+        "field": "volunteering",
+        "title": ["role"],
+        "subtitle": ["companyName"],
+        "meta": [["dateRange", "timePeriod"], ["cause"]],
+    },
+    "Project": {
+        "field": "projects",
+        "title": ["title"],
+        "subtitle": ["description"],
+        "meta": [["dateRange", "timePeriod"]],
+    },
+    "Honor": {
+        "field": "honors_and_awards",
+        "title": ["title"],
+        "subtitle": ["issuer"],
+        "meta": [["issuedOn"]],
+    },
+    "Language": {
+        "field": "languages",
+        "title": ["name"],
+        "subtitle": ["proficiency"],
+        "meta": [],
+    },
+    "Publication": {
+        "field": "publications",
+        "title": ["name"],
+        "subtitle": ["publisher"],
+        "meta": [["publishedOn"]],
+    },
+    "Recommendation": {
+        "field": "recommendations",
+        "title": ["recommenderName"],
+        "subtitle": ["recommendationText"],
+        "meta": [],
+    },
+}
+
+PROFILE_TYPES = ["Profile"]
+METRIC_TYPES = ["ProfileNetworkInfo", "FollowingInfo", "FollowingState"]
+
+
+class LinkedInApiProfileExtractor:
+    """
+    Maps captured Voyager API responses into the extractor output schema.
+
+    Reads the normalized "included" entities from the JSON that
+    ApiResponseRecorder saved during page load. Much cheaper than building
+    and querying the DOM, and returns the same keys as
+    LinkedInProfileExtractor.extract().
+
+    Args:
+        responses: Recorded responses ([{"url", "status", "body"}, ...])
+        public_identifier: Vanity name of the profile (e.g. "zackspear").
+            Picks the right Profile entity when several are present.
+    """
+
+    def __init__(self, responses: List[Dict[str, Any]], public_identifier: Optional[str] = None):
+        self.public_identifier = public_identifier
+        self.entities = self._collect_entities(responses)
+        logger.debug("Initialized LinkedInApiProfileExtractor with %d entities", len(self.entities))
+
+    # ═══════════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════════
+
+    def extract(self) -> Dict[str, Any]:
+        """Extract complete profile data."""
+        logger.info("Starting API profile extraction")
+        profile = self._find_profile()
+        profile_id = self._urn_id(profile) if profile else ""
+
+        data = {
+            "name": clean_text(" ".join(
+                filter(None, [self._first(profile, ["firstName"]), self._first(profile, ["lastName"])])
+            )) if profile else "",
+            "headline": clean_text(self._first(profile, ["headline", "occupation"])) if profile else "",
+            "location": clean_text(self._first(profile, ["locationName", "geoLocationName"])) if profile else "",
+            "about": clean_text(self._first(profile, ["summary"])) if profile else "",
+        }
+        data.update(self._extract_metrics(profile_id))
+
+        sections: Dict[str, List[Dict[str, Any]]] = {
+            spec["field"]: [] for spec in API_SECTIONS.values()
+        }
+        for entity in self.entities:
+            spec = API_SECTIONS.get(self._type_name(entity))
+            if spec is None or not self._belongs_to(entity, profile_id):
+                continue
+            sections[spec["field"]].append(self._build_item(entity, spec))
+
+        for field in [
+            "experience", "education", "skills", "licenses_and_certifications",
+            "volunteering", "projects", "honors_and_awards", "languages",
+            "publications", "recommendations",
+        ]:
+            items = sections[field]
+            if field == "skills":
+                data[field] = [item["title"] for item in items if item.get("title")]
+            else:
+                data[field] = items
+
+        data["profile_links"] = self._extract_profile_links(profile)
+
+        sections_with_data = sum(1 for key, val in data.items() if val)
+        logger.info("API extraction complete - found %d sections with data", sections_with_data)
+        return data
+
+    # ═══════════════════════════════════════════════════════════════
+    # PRIVATE HELPERS
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _collect_entities(responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Flatten "included" (and top-level "data") entities from every response."""
+        entities = []
+        for response in responses:
+            body = response.get("body")
+            if not isinstance(body, dict):
+                continue
+            for entity in body.get("included", []):
+                if isinstance(entity, dict):
+                    entities.append(entity)
+            data = body.get("data")
+            if isinstance(data, dict) and "$type" in data:
+                entities.append(data)
+        return entities
+
+    @staticmethod
+    def _type_name(entity: Dict[str, Any]) -> str:
+        return entity.get("$type", "").rsplit(".", 1)[-1]
+
+    @staticmethod
+    def _urn_id(entity: Dict[str, Any]) -> str:
+        """urn:li:fsd_profile:ACoAAB... -> ACoAAB..."""
+        return entity.get("entityUrn", "").rsplit(":", 1)[-1]
+
+    @staticmethod
+    def _belongs_to(entity: Dict[str, Any], profile_id: str) -> bool:
+        """Section entities embed the owning profile id in their URN; without one, ownership is unknown."""
+        if not profile_id:
+            return True
+        return profile_id in entity.get("entityUrn", "")
+
+    def _find_profile(self) -> Optional[Dict[str, Any]]:
+        profiles = [e for e in self.entities if self._type_name(e) in PROFILE_TYPES]
+        if self.public_identifier:
+            wanted = self.public_identifier.lower()
+            for profile in profiles:
+                if str(profile.get("publicIdentifier", "")).lower() == wanted:
+                    return profile
+        # Mini profiles (e.g. "People also viewed") carry no headline/summary
+        profiles.sort(key=lambda e: sum(1 for k in ("headline", "summary", "locationName") if e.get(k)), reverse=True)
+        return profiles[0] if profiles else None
+
+    def _extract_profile_links(self, profile: Optional[Dict[str, Any]]) -> List[str]:
+        """Other profiles referenced by the responses (e.g. "People also viewed")."""
+        hrefs = [
+            f"{LINKEDIN_ORIGIN}/in/{entity['publicIdentifier']}/"
+            for entity in self.entities
+            if self._type_name(entity) in PROFILE_TYPES
+            and entity.get("publicIdentifier")
+            and entity is not profile
+        ]
+        return LinkedInProfileExtractor.normalize_profile_links(hrefs)
+
+    def _extract_metrics(self, profile_id: str) -> Dict[str, int]:
+        """Follower and connection counts from the metric entities of profile_id only."""
+        followers = connections = 0
+        for entity in self.entities:
+            if self._type_name(entity) not in METRIC_TYPES or not self._belongs_to(entity, profile_id):
+                continue
+            followers = followers or self._as_int(self._first(entity, ["followersCount", "followerCount"]))
+            connections = connections or self._as_int(self._first(entity, ["connectionsCount"]))
+        return {"followers": followers, "connections": connections}
+
+    def _build_item(self, entity: Dict[str, Any], spec: Dict[str, Any]) -> Dict[str, Any]:
+        meta_vals = []
+        for attrs in spec["meta"]:
+            val = clean_text(self._format(self._first(entity, attrs)))
+            if val:
+                meta_vals.append(val)
+        return LinkedInProfileExtractor.build_item(
+            clean_text(self._format(self._first(entity, spec["title"]))),
+            clean_text(self._format(self._first(entity, spec["subtitle"]))),
+            meta_vals,
+        )
+
+    @staticmethod
+    def _first(entity: Optional[Dict[str, Any]], attrs: List[str]) -> Any:
+        """Return the first present attribute value, unwrapping localized text."""
+        if not entity:
+            return ""
+        for attr in attrs:
+            val = entity.get(attr)
+            if isinstance(val, dict) and "text" in val:
+                val = val["text"]
+            if val not in (None, "", [], {}):
+                return val
+        return ""
+
+    @classmethod
+    def _format(cls, val: Any) -> str:
+        """Render dates and date ranges the way the profile page shows them."""
+        if isinstance(val, dict):
+            if "start" in val or "end" in val or "startDate" in val:
+                start = cls._format_date(val.get("start") or val.get("startDate"))
+                end = cls._format_date(val.get("end") or val.get("endDate")) or "Present"
+                return f"{start} - {end}" if start else ""
+            return cls._format_date(val)
+        return "" if val is None else str(val)
+
+    @staticmethod
+    def _format_date(date: Optional[Dict[str, Any]]) -> str:
+        if not date or "year" not in date:
+            return ""
+        month = date.get("month")
+        if month and 1 <= month <= 12:
+            return f"{MONTHS[month - 1]} {date['year']}"
+        return str(date["year"])
+
+    @staticmethod
+    def _as_int(val: Any) -> int:
+        try:
+            return int(val)
+        except (TypeError, ValueError):
+            return 0
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Optional
+
+from .meta import SEPARATOR, is_fully_typed
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Entity Tables
+#
+# Companies, schools, skills and locations repeat across a corpus as full
+# strings. EntityTables interns each distinct value once and encoded profiles
+# reference it by integer id:
+#   {"experience": [{"title": "Engineer", "company_id": 3, "location_id": 0}]}
+#   entities.json: {"companies": [..., "Acme", ...], "locations": [...]}
+# An id is the value's index in its table.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+TABLES = ("companies", "schools", "skills", "locations")
+
+
+class EntityTables:
+    """
+    Interns entity strings into integer ids.
+
+    Usage:
+        entities = EntityTables()
+        encoded = [entities.encode_profile(data) for data in profiles]
+        json.dump(entities.to_dict(), f)
+
+        entities = EntityTables.from_dict(json.load(f))
+        data = entities.decode_profile(encoded[0])
+    """
+
+    def __init__(self):
+        self.values: Dict[str, List[str]] = {table: [] for table in TABLES}
+        self._ids: Dict[str, Dict[str, int]] = {table: {} for table in TABLES}
+
+    @classmethod
+    def from_dict(cls, tables: Dict[str, List[str]]) -> "EntityTables":
+        entities = cls()
+        for table in TABLES:
+            for value in tables.get(table, []):
+                entities.intern(table, value)
+        return entities
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        return {table: list(values) for table, values in self.values.items()}
+
+    def intern(self, table: str, value: str) -> int:
+        """Return the id of value in table, adding it if new."""
+        ids = self._ids[table]
+        entity_id = ids.get(value)
+        if entity_id is None:
+            entity_id = ids[value] = len(self.values[table])
+            self.values[table].append(value)
+        return entity_id
+
+    def lookup(self, table: str, entity_id: Optional[int]) -> Optional[str]:
+        return None if entity_id is None else self.values[table][entity_id]
+
+    # ═══════════════════════════════════════════════════════════════
+    # ENCODE
+    # ═══════════════════════════════════════════════════════════════
+
+    def encode_profile(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of extract() output with entity strings replaced by ids."""
+        encoded = {}
+        for field, value in data.items():
+            if field == "location":
+                encoded["location_id"] = self._intern_optional("locations", value)
+            elif field == "skills":
+                encoded["skill_ids"] = [self.intern("skills", skill) for skill in value]
+            elif field == "experience":
+                encoded[field] = [
+                    self._encode_item(item, "company_id", "companies", company_name(item)) for item in value
+                ]
+            elif field == "education":
+                encoded[field] = [
+                    self._encode_item(item, "school_id", "schools", item.get("title", ""), "title") for item in value
+                ]
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                encoded[field] = [self._encode_item(item) for item in value]
+            else:
+                encoded[field] = value
+        return encoded
+
+    def _encode_item(
+        self,
+        item: Dict[str, Any],
+        id_field: Optional[str] = None,
+        table: str = "",
+        value: str = "",
+        source_field: str = "subtitle",
+    ) -> Dict[str, Any]:
+        encoded = {}
+        for field, val in item.items():
+            # Meta strings already covered by the typed fields and the entity's
+            # source string are replaced by the typed fields and the id
+            if field.startswith("meta_") and is_fully_typed(val) or (id_field and field == source_field):
+                continue
+            if field == "location":
+                encoded["location_id"] = self.intern("locations", val)
+            else:
+                encoded[field] = val
+        if id_field:
+            encoded[id_field] = self._intern_optional(table, value)
+        return encoded
+
+    def _intern_optional(self, table: str, value: str) -> Optional[int]:
+        return self.intern(table, value) if value else None
+
+    # ═══════════════════════════════════════════════════════════════
+    # DECODE
+    # ═══════════════════════════════════════════════════════════════
+
+    def decode_profile(self, encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve ids back to strings.
+
+        Entity fields come back under their names (location, company,
+        school, skills); meta_N strings dropped as fully typed are not restored.
+        """
+        data = {}
+        for field, value in encoded.items():
+            if field == "location_id":
+                data["location"] = self.lookup("locations", value) or ""
+            elif field == "skill_ids":
+                data["skills"] = [self.lookup("skills", skill_id) for skill_id in value]
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                data[field] = [self._decode_item(item) for item in value]
+            else:
+                data[field] = value
+        return data
+
+    def _decode_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        decoded = {}
+        for field, val in item.items():
+            if field == "location_id":
+                decoded["location"] = self.lookup("locations", val)
+            elif field == "company_id":
+                decoded["company"] = self.lookup("companies", val)
+            elif field == "school_id":
+                decoded["title"] = self.lookup("schools", val)
+            else:
+                decoded[field] = val
+        return decoded
+
+
+def company_name(item: Dict[str, Any]) -> str:
+    """Company of an experience item: its subtitle without the employment type ("Acme · Full-time")."""
+    return SEPARATOR.split(item.get("subtitle", ""))[0].strip()
@@ -0,0 +1,264 @@
+import logging
+from typing import List, Dict, Any, TYPE_CHECKING
+from extractors.core.utils import parse_int
+from .profile_extractor import LinkedInProfileExtractor, GLOBAL_ABOUT_XPATHS
+from .selectors.core.keys import ProfileKey
+from .selectors.core.registry import PROFILE_REGISTRY
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+# Output key -> section key, in the order extract() emits them
+SECTION_KEYS = [
+    ("experience", ProfileKey.EXPERIENCE_SECTION),
+    ("education", ProfileKey.EDUCATION_SECTION),
+    ("skills", ProfileKey.SKILLS_SECTION),
+    ("licenses_and_certifications", ProfileKey.CERTIFICATIONS_SECTION),
+    ("volunteering", ProfileKey.VOLUNTEERING_SECTION),
+    ("projects", ProfileKey.PROJECTS_SECTION),
+    ("honors_and_awards", ProfileKey.HONORS_SECTION),
+    ("languages", ProfileKey.LANGUAGES_SECTION),
+    ("publications", ProfileKey.PUBLICATIONS_SECTION),
+    ("recommendations", ProfileKey.RECOMMENDATIONS_SECTION),
+]
+
+
+# In-page port of BaseSelector.resolve() and the LinkedInProfileExtractor
+# helpers. Only cleaned strings leave the page. The whitespace class matches
+# Python's str.isspace() so clean() agrees with extractors.core.utils.clean_text.
+EXTRACT_SCRIPT = """
+(plan) => {
+    const registry = plan.registry;
+    const cache = {};
+    const WS = /[\\t\\n\\v\\f\\r\\x1c-\\x20\\x85\\xa0\\u1680\\u2000-\\u200a\\u2028\\u2029\\u202f\\u205f\\u3000]+/g;
+    const clean = (text) => (text || '').replace(WS, ' ').replace(/^ | $/g, '');
+
+    const query = (xpath, context) => {
+        const result = document.evaluate(
+            xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const found = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            found.push(result.snapshotItem(i));
+        }
+        return found;
+    };
+    // Same string value Selector.get() returns for each node type
+    const valueOf = (node) => {
+        if (node.nodeType === Node.ELEMENT_NODE) {
+            return node.outerHTML;
+        }
+        if (node.nodeType === Node.ATTRIBUTE_NODE) {
+            return node.value;
+        }
+        return node.nodeValue || '';
+    };
+    const resolve = (name) => {
+        if (name in cache) {
+            return cache[name];
+        }
+        const entry = registry[name];
+        let base = document;
+        if (entry.parent !== null) {
+            base = resolve(entry.parent);
+            if (base === null) {
+                return null;
+            }
+        }
+        for (const xpath of entry.selectors) {
+            const found = query(xpath, base);
+            if (found.length) {
+                cache[name] = found[0];
+                return found[0];
+            }
+        }
+        return null;
+    };
+    const extractFirst = (xpaths, context) => {
+        for (const xpath of xpaths) {
+            const found = query(xpath, context);
+            const val = found.length ? valueOf(found[0]) : '';
+            if (val) {
+                const cleaned = clean(val);
+                if (cleaned) {
+                    return cleaned;
+                }
+            }
+        }
+        return '';
+    };
+    const extractAll = (xpaths, context) => {
+        for (const xpath of xpaths) {
+            const found = query(xpath, context);
+            if (found.length) {
+                return found.map((node) => clean(valueOf(node))).filter((v) => v);
+            }
+        }
+        return [];
+    };
+    const selectors = (name) => registry[name].selectors;
+    const keys = plan.keys;
+
+    const header = resolve(keys.header);
+    const result = {
+        name: header ? extractFirst(selectors(keys.name), header) : '',
+        headline: header ? extractFirst(selectors(keys.headline), header) : '',
+        location: header ? extractFirst(selectors(keys.location), header) : '',
+        about: '',
+        followers: extractFirst(selectors(keys.followers), document),
+        connections: extractFirst(selectors(keys.connections), document),
+        profileLinks: extractAll(selectors(keys.profileLink), document),
+        sections: {},
+    };
+
+    const about = resolve(keys.about);
+    if (about) {
+        result.about = extractFirst(selectors(keys.aboutText), about);
+    }
+    if (!result.about) {
+        result.about = extractFirst(plan.globalAbout, document);
+    }
+
+    for (const [field, name] of plan.sections) {
+        const section = resolve(name);
+        const items = [];
+        if (section !== null) {
+            let nodes = [];
+            for (const xpath of selectors(keys.listItem)) {
+                nodes = query(xpath, section);
+                if (nodes.length) {
+                    break;
+                }
+            }
+            for (const node of nodes) {
+                items.push([
+                    extractFirst(selectors(keys.itemTitle), node),
+                    extractFirst(selectors(keys.itemSubtitle), node),
+                    extractAll(selectors(keys.itemMeta), node),
+                ]);
+            }
+        }
+        result.sections[field] = items;
+    }
+    return result;
+}
+"""
+
+
+# Attribute/text values of every node matched by the first matching XPath
+LINKS_SCRIPT = """
+(xpaths) => {
+    for (const xpath of xpaths) {
+        const result = document.evaluate(
+            xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        if (result.snapshotLength) {
+            const values = [];
+            for (let i = 0; i < result.snapshotLength; i++) {
+                const node = result.snapshotItem(i);
+                values.push((node.nodeType === Node.ATTRIBUTE_NODE ? node.value : node.nodeValue) || '');
+            }
+            return values.map((v) => v.trim()).filter((v) => v);
+        }
+    }
+    return [];
+}
+"""
+
+
+class LinkedInLiveProfileExtractor:
+    """
+    Extracts a profile from a live Playwright page without page.content().
+
+    PROFILE_REGISTRY is evaluated inside the page with document.evaluate(),
+    using the same parent hierarchy and first-match fallbacks as
+    BaseSelector.resolve(). Only the compact result crosses CDP.
+    Output has the same shape as LinkedInProfileExtractor.extract().
+
+    Usage:
+        data = await LinkedInLiveProfileExtractor(page).extract()
+    """
+
+    def __init__(self, page: "Page"):
+        self.page = page
+
+    # ═══════════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════════
+
+    async def extract(self) -> Dict[str, Any]:
+        """Extract complete profile data in a single page evaluation."""
+        logger.info("Starting live profile extraction")
+        raw = await self.page.evaluate(EXTRACT_SCRIPT, self._build_plan())
+
+        data = {
+            "name": raw["name"],
+            "headline": raw["headline"],
+            "location": raw["location"],
+            "about": raw["about"],
+            "followers": parse_int(raw["followers"]),
+            "connections": parse_int(raw["connections"]),
+        }
+        for field, _ in SECTION_KEYS:
+            items = [
+                LinkedInProfileExtractor.build_item(title, subtitle, meta_vals)
+                for title, subtitle, meta_vals in raw["sections"][field]
+            ]
+            if field == "skills":
+                data[field] = [item["title"] for item in items if item.get("title")]
+            else:
+                data[field] = items
+
+        data["profile_links"] = LinkedInProfileExtractor.normalize_profile_links(raw["profileLinks"])
+
+        sections_with_data = sum(1 for key, val in data.items() if val)
+        logger.info("Live extraction complete - found %d sections with data", sections_with_data)
+        return data
+
+    async def extract_profile_links(self) -> List[str]:
+        """Extract outbound /in/ profile links without a full extraction."""
+        hrefs = await self.page.evaluate(LINKS_SCRIPT, PROFILE_REGISTRY[ProfileKey.PROFILE_LINK]["selectors"])
+        return LinkedInProfileExtractor.normalize_profile_links(hrefs)
+
+    # ═══════════════════════════════════════════════════════════════
+    # PRIVATE HELPERS
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _build_plan() -> Dict[str, Any]:
+        """Serialize the registry and key names for EXTRACT_SCRIPT."""
+        registry = {}
+        for key, entry in PROFILE_REGISTRY.items():
+            selectors = entry.get("selectors", [])
+            parent = entry.get("parent")
+            registry[key.value] = {
+                "selectors": [selectors] if isinstance(selectors, str) else list(selectors),
+                "parent": parent.value if parent is not None else None,
+            }
+
+        keys = {
+            "header": ProfileKey.HEADER_SECTION,
+            "name": ProfileKey.NAME,
+            "headline": ProfileKey.HEADLINE,
+            "location": ProfileKey.LOCATION,
+            "about": ProfileKey.ABOUT_SECTION,
+            "aboutText": ProfileKey.ABOUT_TEXT,
+            "followers": ProfileKey.FOLLOWERS,
+            "connections": ProfileKey.CONNECTIONS,
+            "listItem": ProfileKey.LIST_ITEM,
+            "itemTitle": ProfileKey.ITEM_TITLE,
+            "itemSubtitle": ProfileKey.ITEM_SUBTITLE,
+            "itemMeta": ProfileKey.ITEM_META,
+            "profileLink": ProfileKey.PROFILE_LINK,
+        }
+        sections: List[List[str]] = [[field, key.value] for field, key in SECTION_KEYS]
+
+        return {
+            "registry": registry,
+            "keys": {name: key.value for name, key in keys.items()},
+            "sections": sections,
+            "globalAbout": GLOBAL_ABOUT_XPATHS,
+        }
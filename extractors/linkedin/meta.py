@@ -0,0 +1,131 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Meta String Parsing
+#
+# List items carry their details as "·"-separated meta strings, e.g.
+#   "Apr 2023 - Present · 2 yrs 9 mos"
+#   "Jaipur, Rajasthan, India · On-site"
+# parse_meta() turns one string into typed fields. Results are memoized:
+# the same strings repeat across a corpus, so enrichment is mostly cache hits.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+MONTHS = {
+    name: i + 1
+    for i, name in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])
+}
+
+EMPLOYMENT_TYPES = {
+    "full-time": "full_time",
+    "part-time": "part_time",
+    "self-employed": "self_employed",
+    "freelance": "freelance",
+    "contract": "contract",
+    "internship": "internship",
+    "apprenticeship": "apprenticeship",
+    "seasonal": "seasonal",
+}
+
+WORKPLACE_TYPES = {"on-site": "on_site", "remote": "remote", "hybrid": "hybrid"}
+
+SEPARATOR = re.compile(r"\s+[·•]\s+")
+DATE = r"(?:(?P<{0}m>[A-Za-z]{{3}})[a-z]*\.?\s+)?(?P<{0}y>\d{{4}})"
+DATE_RANGE = re.compile(
+    r"^(?:Issued\s+)?" + DATE.format("s") + r"(?:\s*[-–—]\s*(?:(?P<present>Present)|" + DATE.format("e") + r"))?$",
+    re.IGNORECASE,
+)
+DURATION = re.compile(
+    r"^(?:(?P<years>\d+)\s+yrs?)?\s*(?:(?P<months>\d+)\s+mos?)?$",
+    re.IGNORECASE,
+)
+LOCATION_SUFFIX = re.compile(r"\b(?:Area|Region|Metropolitan|Metroplex)$")
+
+
+def _date(month: Optional[str], year: str) -> str:
+    """("Apr", "2023") -> "2023-04"; unknown month -> "2023"."""
+    month_num = MONTHS.get(month.lower()[:3]) if month else None
+    return f"{year}-{month_num:02d}" if month_num else year
+
+
+def _months_between(start: str, end: str) -> Optional[int]:
+    """Inclusive month count for "YYYY-MM" dates, as LinkedIn shows it."""
+    if len(start) != 7 or len(end) != 7:
+        return None
+    return (int(end[:4]) - int(start[:4])) * 12 + int(end[5:]) - int(start[5:]) + 1
+
+
+def _parse_segment(segment: str) -> Dict[str, Any]:
+    lowered = segment.lower()
+    if lowered in EMPLOYMENT_TYPES:
+        return {"employment_type": EMPLOYMENT_TYPES[lowered]}
+    if lowered in WORKPLACE_TYPES:
+        return {"workplace_type": WORKPLACE_TYPES[lowered]}
+
+    match = DATE_RANGE.match(segment)
+    if match:
+        fields: Dict[str, Any] = {"start_date": _date(match["sm"], match["sy"])}
+        if match["present"]:
+            fields["end_date"] = None
+            fields["current"] = True
+        elif match["ey"]:
+            fields["end_date"] = _date(match["em"], match["ey"])
+            fields["current"] = False
+        return fields
+
+    match = DURATION.match(segment)
+    if match and (match["years"] or match["months"]):
+        return {"duration_months": int(match["years"] or 0) * 12 + int(match["months"] or 0)}
+
+    # Locations: "City, Region, Country" or "... Area"; never digits
+    if not any(ch.isdigit() for ch in segment) and ("," in segment or LOCATION_SUFFIX.search(segment)):
+        return {"location": segment}
+    return {}
+
+
+@lru_cache(maxsize=65536)
+def parse_meta(value: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Parse one meta string into typed (field, value) pairs.
+
+    Fields: start_date / end_date ("YYYY-MM" or "YYYY", end_date None when
+    current), current, duration_months, location, employment_type,
+    workplace_type. Returns a tuple so the memoized result is immutable.
+    """
+    fields: Dict[str, Any] = {}
+    for segment in SEPARATOR.split(value.strip()):
+        for field, val in _parse_segment(segment).items():
+            fields.setdefault(field, val)
+
+    # Closed ranges without an explicit "2 yrs 9 mos"
+    if "duration_months" not in fields and fields.get("end_date"):
+        duration = _months_between(fields["start_date"], fields["end_date"])
+        if duration is not None:
+            fields["duration_months"] = duration
+    return tuple(fields.items())
+
+
+@lru_cache(maxsize=65536)
+def is_fully_typed(value: str) -> bool:
+    """True when every segment of value maps to a typed field, so the raw string adds nothing."""
+    return all(_parse_segment(segment) for segment in SEPARATOR.split(value.strip()))
+
+
+def parse_meta_values(meta_vals: List[str], subtitle: str = "") -> Dict[str, Any]:
+    """
+    Merge the typed fields of an item's meta values (first value wins).
+
+    The subtitle is consulted for the employment type only
+    (e.g. "Google · Full-time").
+    """
+    fields: Dict[str, Any] = {}
+    for value in meta_vals:
+        for field, val in parse_meta(value):
+            fields.setdefault(field, val)
+
+    if subtitle and "employment_type" not in fields:
+        for field, val in parse_meta(subtitle):
+            if field == "employment_type":
+                fields[field] = val
+    return fields
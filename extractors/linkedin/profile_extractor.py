@@ -1,22 +1,76 @@
+import json
 import logging
+import time
+from contextlib import contextmanager
+from urllib.parse import urljoin, urlsplit
 from scrapy import Selector
-from typing import Optional, List, Dict, Any
+from typing import Callable, Iterator, Optional, List, Dict, Any
+from extractors.core.section_cache import SectionCache
 from extractors.core.utils import clean_text, parse_int
+from .meta import parse_meta_values
 from .selectors.profile import ProfileSelectors
 
 logger = logging.getLogger(__name__)
 
+# Bump when build_item() output changes, so cached sections are re-extracted
+ITEM_FORMAT = 2
+
+# Document-wide about XPaths, used when ABOUT_SECTION yields nothing
+GLOBAL_ABOUT_XPATHS = [
+    './/div[contains(@class, "inline-show-more-text")]//span[@aria-hidden="true"]/text()',
+    '//div[contains(@class, "pv-about__summary-text")]//text()',
+    '//*[@id="about"]//following-sibling::div//span[@aria-hidden="true"]/text()',
+]
+
+LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+# "Show all" detail page slug (/in/<id>/details/<slug>/) -> output field
+DETAIL_SECTIONS = {
+    "experience": "experience",
+    "education": "education",
+    "skills": "skills",
+    "certifications": "licenses_and_certifications",
+    "volunteering-experiences": "volunteering",
+    "projects": "projects",
+    "honors": "honors_and_awards",
+    "languages": "languages",
+    "publications": "publications",
+    "recommendations": "recommendations",
+}
+
 
 class LinkedInProfileExtractor:
     """
     Single extractor class for LinkedIn profiles.
     Same pattern as automation's ProfilePage - one class, multiple methods.
+
+    Args:
+        html: Main profile page HTML
+        details: Optional "Show all" detail pages, keyed by URL slug
+            (e.g. {"experience": html}). Their items are merged into the
+            truncated sections of the main page.
+        section_cache: Optional SectionCache shared across extractions.
+            Sections whose HTML was seen before reuse the cached items.
+        on_section: Optional callback, called as (section, None) when a
+            timed section starts and (section, ms) when it ends.
     """
 
-    def __init__(self, html: str):
+    def __init__(
+        self,
+        html: str,
+        details: Optional[Dict[str, str]] = None,
+        section_cache: Optional[SectionCache] = None,
+        on_section: Optional[Callable[[str, Optional[float]], None]] = None,
+    ):
         logger.debug("Initializing LinkedInProfileExtractor with %d bytes of HTML", len(html))
-        self.selector = Selector(text=html)
+        # Milliseconds spent parsing and per section of the last extract()
+        self.timings: Dict[str, float] = {}
+        self.on_section = on_section
+        with self._timed("parse"):
+            self.selector = Selector(text=html)
         self.selectors = ProfileSelectors(self.selector)
+        self.details = details or {}
+        self.section_cache = section_cache
 
     # ═══════════════════════════════════════════════════════════════
     # PUBLIC API
@@ -28,31 +82,48 @@ class LinkedInProfileExtractor:
         data = {}
 
         # Header (name, headline, location)
-        data.update(self.extract_header())
+        with self._timed("header"):
+            data.update(self.extract_header())
 
         # About
-        data["about"] = self.extract_about()
+        with self._timed("about"):
+            data["about"] = self.extract_about()
 
         # Metrics (followers, connections)
-        data.update(self.extract_metrics())
+        with self._timed("metrics"):
+            data.update(self.extract_metrics())
 
         # Experience
-        data["experience"] = self.extract_experience()
+        with self._timed("experience"):
+            data["experience"] = self.extract_experience()
 
         # Education
-        data["education"] = self.extract_education()
+        with self._timed("education"):
+            data["education"] = self.extract_education()
 
         # Skills (just titles)
-        data["skills"] = self.extract_skills()
+        with self._timed("skills"):
+            data["skills"] = self.extract_skills()
 
         # Other sections
-        data["licenses_and_certifications"] = self.extract_certifications()
-        data["volunteering"] = self.extract_volunteering()
-        data["projects"] = self.extract_projects()
-        data["honors_and_awards"] = self.extract_honors()
-        data["languages"] = self.extract_languages()
-        data["publications"] = self.extract_publications()
-        data["recommendations"] = self.extract_recommendations()
+        with self._timed("licenses_and_certifications"):
+            data["licenses_and_certifications"] = self.extract_certifications()
+        with self._timed("volunteering"):
+            data["volunteering"] = self.extract_volunteering()
+        with self._timed("projects"):
+            data["projects"] = self.extract_projects()
+        with self._timed("honors_and_awards"):
+            data["honors_and_awards"] = self.extract_honors()
+        with self._timed("languages"):
+            data["languages"] = self.extract_languages()
+        with self._timed("publications"):
+            data["publications"] = self.extract_publications()
+        with self._timed("recommendations"):
+            data["recommendations"] = self.extract_recommendations()
+
+        # Outbound profile links (crawl frontier input)
+        with self._timed("profile_links"):
+            data["profile_links"] = self.extract_profile_links()
 
         # Count sections with data
         sections_with_data = sum(1 for key, val in data.items() if val)
@@ -97,12 +168,7 @@ class LinkedInProfileExtractor:
 
         # Fallback: global search using original XPaths
         logger.debug("Using global fallback for about section")
-        global_about_xpaths = [
-            './/div[contains(@class, "inline-show-more-text")]//span[@aria-hidden="true"]/text()',
-            '//div[contains(@class, "pv-about__summary-text")]//text()',
-            '//*[@id="about"]//following-sibling::div//span[@aria-hidden="true"]/text()',
-        ]
-        result = self._extract_first(global_about_xpaths, self.selector)
+        result = self._extract_first(GLOBAL_ABOUT_XPATHS, self.selector)
         if result:
             logger.debug("About text extracted from global fallback (%d chars)", len(result))
         return result
@@ -137,7 +203,7 @@ class LinkedInProfileExtractor:
         """Extract work experience."""
         logger.debug("Extracting experience section")
         section = self.selectors.experience_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("experience", self._extract_section_items(section))
         logger.debug("Experience section - found %d items", len(items))
         return items
 
@@ -145,7 +211,7 @@ class LinkedInProfileExtractor:
         """Extract education history."""
         logger.debug("Extracting education section")
         section = self.selectors.education_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("education", self._extract_section_items(section))
         logger.debug("Education section - found %d items", len(items))
         return items
 
@@ -153,7 +219,7 @@ class LinkedInProfileExtractor:
         """Extract skills as a flat list of titles."""
         logger.debug("Extracting skills section")
         section = self.selectors.skills_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("skills", self._extract_section_items(section))
         skills = [item["title"] for item in items if item.get("title")]
         logger.debug("Skills section - found %d skills", len(skills))
         return skills
@@ -162,7 +228,7 @@ class LinkedInProfileExtractor:
         """Extract licenses and certifications."""
         logger.debug("Extracting certifications section")
         section = self.selectors.certifications_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("licenses_and_certifications", self._extract_section_items(section))
         logger.debug("Certifications section - found %d items", len(items))
         return items
 
@@ -170,7 +236,7 @@ class LinkedInProfileExtractor:
         """Extract volunteering experience."""
         logger.debug("Extracting volunteering section")
         section = self.selectors.volunteering_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("volunteering", self._extract_section_items(section))
         logger.debug("Volunteering section - found %d items", len(items))
         return items
 
@@ -178,7 +244,7 @@ class LinkedInProfileExtractor:
         """Extract projects."""
         logger.debug("Extracting projects section")
         section = self.selectors.projects_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("projects", self._extract_section_items(section))
         logger.debug("Projects section - found %d items", len(items))
         return items
 
@@ -186,7 +252,7 @@ class LinkedInProfileExtractor:
         """Extract honors and awards."""
         logger.debug("Extracting honors section")
         section = self.selectors.honors_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("honors_and_awards", self._extract_section_items(section))
         logger.debug("Honors section - found %d items", len(items))
         return items
 
@@ -194,7 +260,7 @@ class LinkedInProfileExtractor:
         """Extract languages."""
         logger.debug("Extracting languages section")
         section = self.selectors.languages_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("languages", self._extract_section_items(section))
         logger.debug("Languages section - found %d items", len(items))
         return items
 
@@ -202,7 +268,7 @@ class LinkedInProfileExtractor:
         """Extract publications."""
         logger.debug("Extracting publications section")
         section = self.selectors.publications_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("publications", self._extract_section_items(section))
         logger.debug("Publications section - found %d items", len(items))
         return items
 
@@ -210,22 +276,89 @@ class LinkedInProfileExtractor:
         """Extract recommendations."""
         logger.debug("Extracting recommendations section")
         section = self.selectors.recommendations_section()
-        items = self._extract_section_items(section)
+        items = self._merge_detail_items("recommendations", self._extract_section_items(section))
         logger.debug("Recommendations section - found %d items", len(items))
         return items
 
+    # ═══════════════════════════════════════════════════════════════
+    # LINK EXTRACTION
+    # ═══════════════════════════════════════════════════════════════
+
+    def extract_profile_links(self) -> List[str]:
+        """Extract outbound /in/ profile links (absolute, unique, in page order)."""
+        logger.debug("Extracting profile links")
+        hrefs = self._extract_all(self.selectors.profile_link_xpaths(), self.selector)
+        links = self.normalize_profile_links(hrefs)
+        logger.debug("Found %d profile links", len(links))
+        return links
+
+    @staticmethod
+    def normalize_profile_links(hrefs: List[str]) -> List[str]:
+        """Reduce hrefs to absolute /in/<name>/ profile URLs, unique and in order."""
+        links = []
+        seen = set()
+        for href in hrefs:
+            parts = urlsplit(urljoin(LINKEDIN_ORIGIN, href))
+            paths = [p for p in parts.path.split("/") if p]
+            if parts.scheme not in ("http", "https") or len(paths) < 2 or paths[0] != "in":
+                continue
+            # Drops query, fragment and subpaths such as /details/experience/
+            link = f"{parts.scheme}://{parts.netloc}/in/{paths[1]}/"
+            if link not in seen:
+                seen.add(link)
+                links.append(link)
+        return links
+
+    @staticmethod
+    def section_cache_salt() -> str:
+        """Fingerprint of the item XPaths and shape; changes invalidate cached sections."""
+        selectors = ProfileSelectors(Selector(text=""))
+        return json.dumps([
+            ITEM_FORMAT,
+            selectors.list_item_xpaths(),
+            selectors.item_title_xpaths(),
+            selectors.item_subtitle_xpaths(),
+            selectors.item_meta_xpaths(),
+        ])
+
     # ═══════════════════════════════════════════════════════════════
     # PRIVATE HELPERS
     # ═══════════════════════════════════════════════════════════════
 
+    @contextmanager
+    def _timed(self, section: str) -> Iterator[None]:
+        if self.on_section is not None:
+            self.on_section(section, None)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[section] = (time.perf_counter() - start) * 1000
+            if self.on_section is not None:
+                self.on_section(section, self.timings[section])
+
     def _extract_section_items(
         self, section: Optional[Selector]
     ) -> List[Dict[str, Any]]:
-        """Extract list items from a section."""
+        """Extract list items from a section, memoized by its HTML when cached."""
         if section is None:
             logger.debug("Section is None, returning empty list")
             return []
 
+        if self.section_cache is None:
+            return self._extract_items(section)
+
+        key = self.section_cache.key(section.get())
+        items = self.section_cache.get(key)
+        if items is None:
+            items = self._extract_items(section)
+            self.section_cache.put(key, items)
+        else:
+            logger.debug("Section cache hit - reusing %d items", len(items))
+        return items
+
+    def _extract_items(self, section: Selector) -> List[Dict[str, Any]]:
+        """Extract list items from a section."""
         items = []
         list_item_xpaths = self.selectors.list_item_xpaths()
 
@@ -242,25 +375,53 @@ class LinkedInProfileExtractor:
 
         return items
 
+    def _merge_detail_items(
+        self, field: str, items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Merge items from the field's "Show all" detail page, if captured."""
+        slugs = [slug for slug, name in DETAIL_SECTIONS.items() if name == field]
+        html = next((self.details[slug] for slug in slugs if slug in self.details), None)
+        if not html:
+            return items
+
+        detail = ProfileSelectors(Selector(text=html))
+        detail_items = self._extract_section_items(detail.details_section())
+        logger.debug("Detail page for %s - found %d items", field, len(detail_items))
+
+        # Detail page is the complete list; keep main-page items it lacks
+        seen = {(item["title"], item["subtitle"]) for item in detail_items}
+        merged = list(detail_items)
+        for item in items:
+            if (item["title"], item["subtitle"]) not in seen:
+                merged.append(item)
+        return merged
+
     def _extract_item(self, item: Selector) -> Dict[str, Any]:
         """Extract fields from a list item."""
+        return self.build_item(
+            self._extract_first(self.selectors.item_title_xpaths(), item),
+            self._extract_first(self.selectors.item_subtitle_xpaths(), item),
+            self._extract_all(self.selectors.item_meta_xpaths(), item),
+        )
+
+    @staticmethod
+    def build_item(title: str, subtitle: str, meta_vals: List[str]) -> Dict[str, Any]:
+        """Build the output dict for one list item from its cleaned values."""
         entry = {}
 
         # Title
-        entry["title"] = self._extract_first(
-            self.selectors.item_title_xpaths(), item
-        )
+        entry["title"] = title
 
         # Subtitle
-        entry["subtitle"] = self._extract_first(
-            self.selectors.item_subtitle_xpaths(), item
-        )
+        entry["subtitle"] = subtitle
 
         # Meta fields (dates, locations, etc.)
-        meta_vals = self._extract_all(self.selectors.item_meta_xpaths(), item)
         for i, val in enumerate(meta_vals):
             entry[f"meta_{i + 1}"] = val
 
+        # Typed fields parsed from the meta values (start_date, location, ...)
+        entry.update(parse_meta_values(meta_vals, subtitle))
+
         return entry
 
     def _extract_first(self, xpaths: List[str], context: Selector) -> str:
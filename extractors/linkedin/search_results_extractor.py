@@ -0,0 +1,89 @@
+import logging
+from scrapy import Selector
+from typing import List, Dict, Any
+from extractors.core.utils import clean_text, parse_int
+from .profile_extractor import LinkedInProfileExtractor
+from .selectors.search_results import SearchResultsSelectors
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedInSearchResultsExtractor:
+    """
+    Extractor for a saved people search results page.
+    Same pattern as LinkedInProfileExtractor - one class, multiple methods.
+
+    One page lists about 10 profiles with name, headline, location and URL,
+    so a first pass over search pages covers many profiles per navigation.
+
+    Usage:
+        data = LinkedInSearchResultsExtractor(html).extract()
+        urls = [result["profile_url"] for result in data["results"]]
+    """
+
+    def __init__(self, html: str):
+        logger.debug("Initializing LinkedInSearchResultsExtractor with %d bytes of HTML", len(html))
+        self.selector = Selector(text=html)
+        self.selectors = SearchResultsSelectors(self.selector)
+
+    # ═══════════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════════
+
+    def extract(self) -> Dict[str, Any]:
+        """Extract every result card plus page-level info."""
+        logger.info("Starting search results extraction")
+        data = {
+            "results": self.extract_results(),
+            "total_results": self.extract_total_results(),
+            "has_next_page": self.selectors.next_page() is not None,
+        }
+        logger.info("Extraction complete - found %d results", len(data["results"]))
+        return data
+
+    def extract_results(self) -> List[Dict[str, Any]]:
+        """
+        Extract one entry per result card.
+
+        Cards without a /in/ link (out-of-network "LinkedIn Member" results)
+        are skipped: they can't be visited or deduplicated.
+        """
+        results = []
+        for card in self.selectors.result_cards():
+            result = self._extract_card(card)
+            if result["profile_url"]:
+                results.append(result)
+            else:
+                logger.debug("Skipping result card without a profile URL")
+        return results
+
+    def extract_total_results(self) -> int:
+        """Result count from the "About 1,200 results" header (0 if absent)."""
+        return parse_int(self._extract_first(self.selectors.results_count_xpaths(), self.selector))
+
+    # ═══════════════════════════════════════════════════════════════
+    # PRIVATE HELPERS
+    # ═══════════════════════════════════════════════════════════════
+
+    def _extract_card(self, card: Selector) -> Dict[str, Any]:
+        """Extract fields from a result card."""
+        hrefs = [card.xpath(xpath).get() or "" for xpath in self.selectors.card_profile_url_xpaths()]
+        links = LinkedInProfileExtractor.normalize_profile_links(hrefs)
+        return {
+            "profile_url": links[0] if links else "",
+            "name": self._extract_first(self.selectors.card_name_xpaths(), card),
+            "headline": self._extract_first(self.selectors.card_headline_xpaths(), card),
+            "location": self._extract_first(self.selectors.card_location_xpaths(), card),
+            # "• 2nd" -> 2; 0 when the badge is missing
+            "connection_degree": parse_int(self._extract_first(self.selectors.card_degree_xpaths(), card)),
+        }
+
+    def _extract_first(self, xpaths: List[str], context: Selector) -> str:
+        """Try XPaths, return first match."""
+        for xpath in xpaths:
+            val = context.xpath(xpath).get()
+            if val:
+                cleaned = clean_text(val)
+                if cleaned:
+                    return cleaned
+        return ""
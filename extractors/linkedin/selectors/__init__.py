@@ -1,4 +1,4 @@
 from .profile import ProfileSelectors
+from .search_results import SearchResultsSelectors
 
-__all__ = ["ProfileSelectors"]
-
+__all__ = ["ProfileSelectors", "SearchResultsSelectors"]
@@ -1,5 +1,6 @@
 from .keys import ProfileKey
 from .registry import PROFILE_REGISTRY
+from .search_keys import SearchResultsKey
+from .search_registry import SEARCH_RESULTS_REGISTRY
 
-__all__ = ["ProfileKey", "PROFILE_REGISTRY"]
-
+__all__ = ["ProfileKey", "PROFILE_REGISTRY", "SearchResultsKey", "SEARCH_RESULTS_REGISTRY"]
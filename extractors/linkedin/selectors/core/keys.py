@@ -17,6 +17,7 @@ class ProfileKey(Enum):
     LANGUAGES_SECTION = "languages_section"
     PUBLICATIONS_SECTION = "publications_section"
     RECOMMENDATIONS_SECTION = "recommendations_section"
+    DETAILS_SECTION = "details_section"
 
     # ═══════════════════════════════════════════════════════════════
     # Header Fields
@@ -36,6 +37,11 @@ class ProfileKey(Enum):
     FOLLOWERS = "followers"
     CONNECTIONS = "connections"
 
+    # ═══════════════════════════════════════════════════════════════
+    # Links
+    # ═══════════════════════════════════════════════════════════════
+    PROFILE_LINK = "profile_link"
+
     # ═══════════════════════════════════════════════════════════════
     # Section Items (used with parent context)
     # ═══════════════════════════════════════════════════════════════
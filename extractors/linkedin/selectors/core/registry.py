@@ -99,6 +99,14 @@ PROFILE_REGISTRY = {
         ],
         "parent": None,
     },
+    # "Show all" detail page (/in/<id>/details/<section>/) list container
+    ProfileKey.DETAILS_SECTION: {
+        "selectors": [
+            "//main//section[.//li[contains(@class, 'pvs-list__paged-list-item')]]",
+            "//main//section[1]",
+        ],
+        "parent": None,
+    },
     # ═══════════════════════════════════════════════════════════════
     # HEADER FIELDS (scoped to HEADER_SECTION)
     # ═══════════════════════════════════════════════════════════════
@@ -152,6 +160,15 @@ PROFILE_REGISTRY = {
         "parent": None,
     },
     # ═══════════════════════════════════════════════════════════════
+    # LINKS (global - "People also viewed", recommendations, ...)
+    # ═══════════════════════════════════════════════════════════════
+    ProfileKey.PROFILE_LINK: {
+        "selectors": [
+            "//a[contains(@href, '/in/')]/@href",
+        ],
+        "parent": None,
+    },
+    # ═══════════════════════════════════════════════════════════════
     # SECTION ITEMS (no fixed parent - applied dynamically to section context)
     # ═══════════════════════════════════════════════════════════════
     ProfileKey.LIST_ITEM: {
@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class SearchResultsKey(Enum):
+    # ═══════════════════════════════════════════════════════════════
+    # Root Sections
+    # ═══════════════════════════════════════════════════════════════
+    RESULTS_LIST = "results_list"
+    RESULTS_COUNT = "results_count"
+    NEXT_PAGE = "next_page"
+
+    # ═══════════════════════════════════════════════════════════════
+    # Result Cards (used with parent context)
+    # ═══════════════════════════════════════════════════════════════
+    RESULT_CARD = "result_card"
+
+    # ═══════════════════════════════════════════════════════════════
+    # Card Fields (used with card context)
+    # ═══════════════════════════════════════════════════════════════
+    CARD_PROFILE_URL = "card_profile_url"
+    CARD_NAME = "card_name"
+    CARD_HEADLINE = "card_headline"
+    CARD_LOCATION = "card_location"
+    CARD_DEGREE = "card_degree"
@@ -0,0 +1,86 @@
+from .search_keys import SearchResultsKey
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# LinkedIn People Search Results Selector Registry
+#
+# Strategy:
+# - Same parent hierarchy as PROFILE_REGISTRY: list -> card -> fields
+# - Named entity-result classes first, structural fallbacks for the
+#   obfuscated class names of newer layouts
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SEARCH_RESULTS_REGISTRY = {
+    # ═══════════════════════════════════════════════════════════════
+    # ROOT SECTIONS (no parent - searched from document root)
+    # ═══════════════════════════════════════════════════════════════
+    SearchResultsKey.RESULTS_LIST: {
+        "selectors": [
+            "//ul[contains(@class, 'reusable-search__entity-result-list')]",
+            "//main//div[contains(@class, 'search-results-container')]//ul[@role='list']",
+            "//main//ul[li//a[contains(@href, '/in/')]]",
+        ],
+        "parent": None,
+    },
+    SearchResultsKey.RESULTS_COUNT: {
+        "selectors": [
+            "//div[contains(@class, 'search-results__cluster-title-suffix')]//text()",
+            "//main//h2[contains(., 'results')]//text()",
+        ],
+        "parent": None,
+    },
+    SearchResultsKey.NEXT_PAGE: {
+        "selectors": [
+            "//button[contains(@class, 'artdeco-pagination__button--next') and not(@disabled)]",
+            "//button[@aria-label='Next' and not(@disabled)]",
+        ],
+        "parent": None,
+    },
+    # ═══════════════════════════════════════════════════════════════
+    # RESULT CARDS (children of RESULTS_LIST)
+    # ═══════════════════════════════════════════════════════════════
+    SearchResultsKey.RESULT_CARD: {
+        "selectors": [
+            "./li[contains(@class, 'reusable-search__result-container')]",
+            "./li",
+        ],
+        "parent": SearchResultsKey.RESULTS_LIST,
+    },
+    # ═══════════════════════════════════════════════════════════════
+    # CARD FIELDS (no fixed parent - applied dynamically to card context)
+    # ═══════════════════════════════════════════════════════════════
+    SearchResultsKey.CARD_PROFILE_URL: {
+        "selectors": [
+            ".//span[contains(@class, 'entity-result__title-text')]//a[contains(@href, '/in/')]/@href",
+            ".//a[contains(@href, '/in/')]/@href",
+        ],
+        "parent": None,  # Applied dynamically to card context
+    },
+    SearchResultsKey.CARD_NAME: {
+        "selectors": [
+            ".//span[contains(@class, 'entity-result__title-text')]//span[@aria-hidden='true']/text()",
+            ".//a[contains(@href, '/in/')]//span[@aria-hidden='true']/text()",
+        ],
+        "parent": None,  # Applied dynamically to card context
+    },
+    SearchResultsKey.CARD_HEADLINE: {
+        "selectors": [
+            ".//div[contains(@class, 'entity-result__primary-subtitle')]/text()",
+            ".//div[contains(@class, 't-14') and contains(@class, 't-black') and contains(@class, 't-normal')]/text()",
+        ],
+        "parent": None,  # Applied dynamically to card context
+    },
+    SearchResultsKey.CARD_LOCATION: {
+        "selectors": [
+            ".//div[contains(@class, 'entity-result__secondary-subtitle')]/text()",
+            ".//div[contains(@class, 't-14') and contains(@class, 't-normal') and not(contains(@class, 't-black'))]/text()",
+        ],
+        "parent": None,  # Applied dynamically to card context
+    },
+    SearchResultsKey.CARD_DEGREE: {
+        "selectors": [
+            ".//span[contains(@class, 'entity-result__badge-text')]//span[@aria-hidden='true']/text()",
+            ".//span[contains(@class, 'dist-value')]/text()",
+        ],
+        "parent": None,  # Applied dynamically to card context
+    },
+}
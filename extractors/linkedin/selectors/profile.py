@@ -66,6 +66,10 @@ class ProfileSelectors(BaseSelector):
         """Resolve recommendations section."""
         return self.resolve(ProfileKey.RECOMMENDATIONS_SECTION)
 
+    def details_section(self) -> Optional[Selector]:
+        """Resolve the list section of a "Show all" detail page."""
+        return self.resolve(ProfileKey.DETAILS_SECTION)
+
     # ═══════════════════════════════════════════════════════════════
     # Field XPaths (return XPath lists for extraction)
     # ═══════════════════════════════════════════════════════════════
@@ -88,6 +92,9 @@ class ProfileSelectors(BaseSelector):
     def connections_xpaths(self) -> List[str]:
         return self.get(ProfileKey.CONNECTIONS)
 
+    def profile_link_xpaths(self) -> List[str]:
+        return self.get(ProfileKey.PROFILE_LINK)
+
     # ═══════════════════════════════════════════════════════════════
     # Item XPaths (for list items within sections)
     # ═══════════════════════════════════════════════════════════════
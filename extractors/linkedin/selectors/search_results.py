@@ -0,0 +1,53 @@
+from scrapy import Selector
+from typing import Optional, List
+from extractors.core.base_selector import BaseSelector
+from .core.search_keys import SearchResultsKey
+from .core.search_registry import SEARCH_RESULTS_REGISTRY
+
+
+class SearchResultsSelectors(BaseSelector):
+    """
+    Typed selector accessor for LinkedIn people search results.
+    Same pattern as ProfileSelectors.
+    """
+
+    def __init__(self, selector: Selector):
+        super().__init__(selector, SEARCH_RESULTS_REGISTRY)
+
+    # ═══════════════════════════════════════════════════════════════
+    # Section Resolvers (return Selector objects)
+    # ═══════════════════════════════════════════════════════════════
+
+    def results_list(self) -> Optional[Selector]:
+        """Resolve the list holding the result cards."""
+        return self.resolve(SearchResultsKey.RESULTS_LIST)
+
+    def result_cards(self) -> List[Selector]:
+        """Resolve every result card of the list."""
+        return self.resolve_all(SearchResultsKey.RESULT_CARD)
+
+    def next_page(self) -> Optional[Selector]:
+        """Resolve the enabled "Next" pagination button."""
+        return self.resolve(SearchResultsKey.NEXT_PAGE)
+
+    # ═══════════════════════════════════════════════════════════════
+    # Field XPaths (return XPath lists for extraction)
+    # ═══════════════════════════════════════════════════════════════
+
+    def results_count_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.RESULTS_COUNT)
+
+    def card_profile_url_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.CARD_PROFILE_URL)
+
+    def card_name_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.CARD_NAME)
+
+    def card_headline_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.CARD_HEADLINE)
+
+    def card_location_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.CARD_LOCATION)
+
+    def card_degree_xpaths(self) -> List[str]:
+        return self.get(SearchResultsKey.CARD_DEGREE)
@@ -1,10 +1,17 @@
+import argparse
+import functools
 import json
 import os
 import glob
+import shutil
+import tempfile
 import traceback
 import logging
+from urllib.parse import quote, unquote
 
-from extractors import LinkedInProfileExtractor
+from extractors import LinkedInProfileExtractor, LinkedInApiProfileExtractor, EntityTables
+from extractors.core import FileProfile, SectionCache, WorkerPool
+from crawl import JobTable
 
 # Configure logging
 logging.basicConfig(
@@ -13,18 +20,289 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Extracted items per section subtree, reused when a recaptured profile has identical sections
+SECTION_CACHE_PATH = "bin/cache/sections.sqlite"
 
-def extract_data_from_html(html_content: str) -> dict:
+
+def extract_data_from_html(
+    html_content: str,
+    details: dict | None = None,
+    section_cache: SectionCache | None = None,
+    timings: dict | None = None,
+    on_section=None,
+) -> dict:
     """
     Extract profile data from HTML content.
     Uses the new unified LinkedInProfileExtractor.
+    Per-section milliseconds are added to timings when given; on_section
+    is passed to the extractor to follow sections as they run.
     """
     logger.debug("Extracting data from HTML content (%d bytes)", len(html_content))
-    extractor = LinkedInProfileExtractor(html_content)
-    return extractor.extract()
+    extractor = LinkedInProfileExtractor(
+        html_content, details=details, section_cache=section_cache, on_section=on_section
+    )
+    data = extractor.extract()
+    if timings is not None:
+        timings.update(extractor.timings)
+    return data
+
+
+def open_section_cache(path: str = SECTION_CACHE_PATH) -> SectionCache:
+    """Open the persistent section cache, salted with the current item XPaths."""
+    return SectionCache(path, salt=LinkedInProfileExtractor.section_cache_salt())
+
+
+def extract_data_from_api_responses(file_path: str, public_identifier: str | None = None) -> dict:
+    """
+    Extract profile data from API responses saved as <key>.api.json.
+
+    Captures are named by profile key, so the target profile's vanity name
+    comes from the file name unless given; it picks the right profile when
+    the responses also hold others ("People also viewed").
+    """
+    logger.debug("Extracting data from API responses: %s", file_path)
+    if public_identifier is None:
+        public_identifier = unquote(os.path.basename(file_path).removesuffix(".api.json"))
+    with open(file_path, "r", encoding="utf-8") as f:
+        responses = json.load(f)
+    return LinkedInApiProfileExtractor(responses, public_identifier=public_identifier).extract()
+
+
+def load_detail_pages(file_path: str) -> dict:
+    """Read "Show all" detail pages saved next to a profile as <name>.details/<section>.html."""
+    details_dir = os.path.splitext(file_path)[0] + ".details"
+    details = {}
+    for detail_path in glob.glob(os.path.join(details_dir, "*.html")):
+        section = os.path.splitext(os.path.basename(detail_path))[0]
+        with open(detail_path, "r", encoding="utf-8") as f:
+            details[section] = f.read()
+    return details
+
+
+# Set in each batch worker by _init_worker
+_section_cache: SectionCache | None = None
+_profile: FileProfile | None = None
+
+
+def _init_worker(profile_interval: float | None = None, progress_dir: str | None = None):
+    global _section_cache, _profile
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    _section_cache = open_section_cache(os.path.join(base_dir, SECTION_CACHE_PATH))
+    if profile_interval:
+        _profile = FileProfile(profile_interval, progress_dir)
+
+
+def process_file(file_path: str) -> dict:
+    """
+    Extract one captured file into a profile.json entry.
+
+    When the worker profiles (--profile), the entry also carries a "profile"
+    record (wall time, section timings, CPU stacks) for the parent to merge.
+    """
+    file_name = os.path.basename(file_path)
+    logger.debug("Processing file: %s", file_name)
+    timings = {}
+    if _profile is not None:
+        _profile.begin(file_name)
+    try:
+        if file_path.endswith(".api.json"):
+            extracted_data = extract_data_from_api_responses(file_path)
+        else:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+
+            extracted_data = extract_data_from_html(
+                content,
+                load_detail_pages(file_path),
+                _section_cache,
+                timings,
+                on_section=_profile.section if _profile is not None else None,
+            )
+        logger.info("Successfully processed %s", file_name)
+        entry = {"filename": file_name, "status": "success", "data": extracted_data}
+    except Exception as e:
+        # Capture traceback for debugging
+        tb = traceback.format_exc()
+        logger.error("Failed to process %s: %s", file_name, e)
+        entry = {
+            "filename": file_name,
+            "status": "error",
+            "error": str(e),
+            "traceback": tb,
+        }
+
+    if _profile is not None:
+        entry["profile"] = _profile.end(timings)
+    return entry
+
+
+def run_batch(pool: WorkerPool, files: list, args, report: dict, profile: FileProfile | None = None) -> dict:
+    """
+    Extract files through the pool, skipping oversized ones. Returns {path: entry}.
+
+    Profiling records returned by the workers are moved into profile;
+    files that hit the timeout are added with the timeout as their time.
+    """
+    results = {}
+    batch = []
+    for file_path in files:
+        size_mb = os.path.getsize(file_path) / 2 ** 20
+        if size_mb > args.max_file_mb:
+            file_name = os.path.basename(file_path)
+            logger.warning("Skipping %s: %.1f MB exceeds %.0f MB", file_name, size_mb, args.max_file_mb)
+            report["oversized"].append({"filename": file_name, "size_mb": round(size_mb, 1)})
+            results[file_path] = {"filename": file_name, "status": "skipped", "error": "file too large"}
+        else:
+            batch.append(file_path)
+
+    for file_path, status, result in pool.map(batch):
+        file_name = os.path.basename(file_path)
+        if status == "done":
+            if "profile" in result:
+                record = result.pop("profile")
+                if profile is not None:
+                    profile.add(file_name, record)
+            results[file_path] = result
+            continue
+
+        if status == "timeout" and profile is not None:
+            profile.add_timeout(file_name, args.timeout * 1000)
+        error = f"exceeded {args.timeout:.0f}s budget" if status == "timeout" else "worker crashed"
+        logger.error("Failed to process %s: %s", file_name, error)
+        report["timed_out" if status == "timeout" else "crashed"].append(file_name)
+        results[file_path] = {"filename": file_name, "status": status, "error": error}
+
+    return results
+
+
+def file_version(file_path: str) -> str:
+    """Changes when a capture (or its detail pages) is rewritten, so its job is requeued."""
+    stat = os.stat(file_path)
+    version = f"{stat.st_mtime_ns}:{stat.st_size}"
+    details_dir = os.path.splitext(file_path)[0] + ".details"
+    if os.path.isdir(details_dir):
+        version += f":{os.stat(details_dir).st_mtime_ns}"
+    return version
+
+
+def run_jobs(
+    pool: WorkerPool, files: list, profiles_dir: str, args, report: dict, profile: FileProfile | None = None
+):
+    """
+    Split the corpus with other processes/hosts through a shared job table.
+
+    Each result is written to bin/extracted/<key>.json as soon as it is done;
+    whichever process finds the queue drained combines the results of files
+    into profile.json. A file rewritten since its job finished is requeued.
+    """
+    output_dir = os.path.join(os.path.dirname(profiles_dir), "extracted")
+    os.makedirs(output_dir, exist_ok=True)
+
+    def output_path(key: str) -> str:
+        # Keys may contain subdirectories; quoting keeps same-named files apart
+        return os.path.join(output_dir, quote(key, safe="") + ".json")
+
+    # Keys are relative to the profiles dir so hosts may mount the volume anywhere
+    keys = [os.path.relpath(path, profiles_dir) for path in files]
+    jobs = JobTable(args.jobs, queue="extract", lease_seconds=args.lease_seconds, journal_mode=args.journal_mode)
+    jobs.add_many(keys, versions={key: file_version(path) for key, path in zip(keys, files)})
+
+    with jobs.keep_alive():
+        while batch := jobs.lease(args.workers * 4):
+            paths = {os.path.join(profiles_dir, job.key): job.key for job in batch}
+            for file_path, entry in run_batch(pool, list(paths), args, report, profile).items():
+                write_json_atomic(output_path(paths[file_path]), entry)
+
+                if entry["status"] in ("success", "error", "skipped"):
+                    jobs.complete(paths[file_path])
+                else:
+                    jobs.fail(paths[file_path], entry["error"])
+
+    stats = jobs.stats()
+    jobs.close()
+    logger.info("Job table status: %s", stats)
+    if stats.get("queued") or stats.get("leased"):
+        logger.info("Other workers still hold jobs; leaving profile.json to them")
+        return
+
+    # Only this corpus: outputs of deleted captures stay out of profile.json
+    results = []
+    for key in keys:
+        try:
+            with open(output_path(key), "r", encoding="utf-8") as f:
+                results.append(json.load(f))
+        except FileNotFoundError:
+            logger.warning("No extraction result for %s", key)
+    write_profiles(results, args.entities)
+
+
+def write_json_atomic(path: str, data):
+    """Write through a temp file so concurrent writers and readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def write_profiles(results: list, entities_path: str | None = None):
+    """
+    Write profile.json; with entities_path, interned into entity tables.
+
+    Encoded profiles reference companies, schools, skills and locations by id;
+    the tables (id = index) are written to entities_path.
+    """
+    if entities_path:
+        entities = EntityTables()
+        results = [
+            {**entry, "data": entities.encode_profile(entry["data"])} if entry.get("data") else entry
+            for entry in results
+        ]
+        write_json_atomic(entities_path, entities.to_dict())
+        logger.info(
+            "Entity tables: %s",
+            ", ".join(f"{len(values)} {table}" for table, values in entities.values.items()),
+        )
+
+    write_json_atomic("profile.json", results)
+
+
+def print_slowest(slowest: list, sections_shown: int = 4):
+    """Print the slowest files with their costliest sections."""
+    print(f"\nSlowest {len(slowest)} files (wall ms, costliest sections):")
+    for entry in slowest:
+        sections = sorted(entry["sections"].items(), key=lambda item: -item[1])[:sections_shown]
+        breakdown = ", ".join(f"{name} {ms:.1f}" for name, ms in sections)
+        if entry.get("timed_out"):
+            breakdown = f"TIMED OUT in {entry.get('running') or '?'}; {breakdown}"
+        print(f"  {entry['total_ms']:10.1f}  {entry['filename']:<40} {breakdown}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Extract captured LinkedIn profiles into profile.json")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--timeout", type=float, default=60, help="Per-file wall-clock budget in seconds (0 = none)")
+    parser.add_argument("--max-files-per-worker", type=int, default=200, help="Recycle a worker after N files")
+    parser.add_argument("--max-rss-mb", type=float, default=1024, help="Recycle a worker above this RSS")
+    parser.add_argument("--max-file-mb", type=float, default=50, help="Skip captures larger than this")
+    parser.add_argument("--jobs", metavar="PATH", help="Shared job table (SQLite) to split work with other processes")
+    parser.add_argument("--lease-seconds", type=float, default=300)
+    parser.add_argument("--journal-mode", default="wal", help='Use "delete" when hosts share the job table over a network volume')
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Sample CPU per file; write collapsed stacks and report the slowest files (timed-out ones included). "
+        "SIGPROF samples land only between bytecodes, so time inside lxml/C calls is undercounted",
+    )
+    parser.add_argument(
+        "--profile-output", default="bin/profile/stacks.folded", help="Collapsed stacks (flamegraph.pl, speedscope)"
+    )
+    parser.add_argument("--profile-interval", type=float, default=0.005, help="Seconds of CPU time between samples")
+    parser.add_argument("--profile-top", type=int, default=10, help="Slowest files to report")
+    parser.add_argument(
+        "--entities", metavar="PATH", nargs="?", const="entities.json",
+        help="Intern companies, schools, skills and locations into entity tables written to PATH",
+    )
+    args = parser.parse_args()
+
     logger.info("Starting profile extraction")
 
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,40 +310,58 @@ def main():
     pattern = os.path.join(profiles_dir, "*.html")
     files = glob.glob(pattern)
 
+    # API-only captures (save_html = false) have no HTML sibling
+    for api_path in glob.glob(os.path.join(profiles_dir, "*.api.json")):
+        if not os.path.exists(api_path[: -len(".api.json")] + ".html"):
+            files.append(api_path)
+
     # Sort files to ensure deterministic order
     files.sort()
 
-    results = []
+    report = {"timed_out": [], "crashed": [], "oversized": [], "memory_exceeded": []}
+    # The sampler only runs in the workers; this instance merges their records.
+    # Workers leave section progress in progress_dir for files that time out
+    progress_dir = tempfile.mkdtemp(prefix="profile-progress-") if args.profile else None
+    profile = FileProfile(args.profile_interval, progress_dir) if args.profile else None
+    pool = WorkerPool(
+        process_file,
+        workers=args.workers,
+        timeout=args.timeout or None,
+        max_tasks=args.max_files_per_worker,
+        max_rss_mb=args.max_rss_mb,
+        initializer=functools.partial(
+            _init_worker, args.profile_interval if args.profile else None, progress_dir
+        ),
+    )
 
-    for file_path in files:
-        file_name = os.path.basename(file_path)
-        logger.debug("Processing file: %s", file_name)
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+    try:
+        if args.jobs:
+            run_jobs(pool, files, profiles_dir, args, report, profile)
+        else:
+            results = run_batch(pool, files, args, report, profile)
+            write_profiles([results[path] for path in files], args.entities)
+    finally:
+        if progress_dir:
+            shutil.rmtree(progress_dir, ignore_errors=True)
 
-            extracted_data = extract_data_from_html(content)
-            results.append(
-                {"filename": file_name, "status": "success", "data": extracted_data}
-            )
-            logger.info("Successfully processed %s", file_name)
-        except Exception as e:
-            # Capture traceback for debugging
-            tb = traceback.format_exc()
-            logger.error("Failed to process %s: %s", file_name, e)
-            results.append(
-                {
-                    "filename": file_name,
-                    "status": "error",
-                    "error": str(e),
-                    "traceback": tb,
-                }
-            )
+    report["memory_exceeded"] = [
+        {"filename": os.path.basename(path), "rss_mb": round(rss_mb)} for path, rss_mb in pool.memory_exceeded
+    ]
+    report["workers_recycled"] = pool.recycled
+
+    if profile is not None:
+        profile.write_collapsed(args.profile_output)
+        report["slowest"] = profile.slowest(args.profile_top)
+        print_slowest(report["slowest"])
+        logger.info("CPU samples (%d stacks) written to %s", len(profile.stacks), args.profile_output)
 
-    with open("profile.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    with open("extraction_report.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
 
-    logger.info("Extraction complete. Results saved to profile.json")
+    logger.info(
+        "Extraction complete. Results saved to profile.json (%d timed out, %d crashed, %d oversized)",
+        len(report["timed_out"]), len(report["crashed"]), len(report["oversized"]),
+    )
 
 
 if __name__ == "__main__":
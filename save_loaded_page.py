@@ -1,44 +1,441 @@
 import asyncio
+import json
 import logging
-from playwright.async_api import async_playwright, BrowserContext
-from browser import launch_browser
+import os
+import argparse
+from urllib.parse import quote
+from playwright.async_api import async_playwright, BrowserContext, Page
+from browser import close_browser, is_attached, launch_browser, launch_contexts, load_config
+from automation import tracing
+from automation.linkedin.profile_page import ProfilePage
+from automation.linkedin.search_results_page import SearchResultsPage
+from capture import ApiResponseRecorder, HttpCache, PagePool, SnapshotMode, capture_snapshot
+from crawl import SeenSet, Frontier, AccountThrottle, BlockedResponseError, ResponseClass, classify_response
+from extractors import LinkedInLiveProfileExtractor, LinkedInSearchResultsExtractor
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROFILE_URLS = ["https://www.linkedin.com/in/roshan-yadav-4631272a8/"]
+PROFILES_DIR = "bin/profiles"
+SEARCH_DIR = "bin/search"
 
-async def parse_linkedin_profile(context: BrowserContext):
-    profile_url = "https://www.linkedin.com/in/roshan-yadav-4631272a8/"
-    output_path = "bin/profiles/profile9.html"
 
+async def goto_checked(page: Page, url: str):
+    """
+    Navigate and classify the result before spending any settle time on it.
+
+    Raises:
+        BlockedResponseError: Throttled (429/999), auth wall, challenge,
+            404 or server error instead of the requested page.
+    """
+    response = await page.goto(url)
+    status = response.status if response is not None else None
+    response_class = classify_response(status, page.url)
+    if response_class != ResponseClass.OK:
+        raise BlockedResponseError(response_class, url, status)
+
+
+async def fetch_detail_page(
+    context: BrowserContext,
+    section: str,
+    url: str,
+    output_path: str,
+    settle_ms: int = 5000,
+    page_pool: PagePool | None = None,
+    snapshot: SnapshotMode = SnapshotMode.FULL,
+):
+    """Load one "Show all" detail page in its own tab and save its HTML."""
+    page = await page_pool.acquire() if page_pool else await context.new_page()
+    try:
+        logger.debug("Fetching detail page '%s': %s", section, url)
+        await goto_checked(page, url)
+        await page.wait_for_timeout(settle_ms)
+
+        page_html = await capture_snapshot(page, snapshot)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(page_html)
+        logger.debug("Detail page saved to %s", output_path)
+    finally:
+        if page_pool:
+            await page_pool.release(page)
+        else:
+            await page.close()
+
+
+async def parse_linkedin_profile(
+    context: BrowserContext,
+    profile_url: str = "https://www.linkedin.com/in/roshan-yadav-4631272a8/",
+    output_path: str = "bin/profiles/profile9.html",
+    api_recorder: ApiResponseRecorder | None = None,
+    save_html: bool = True,
+    settle_ms: int = 5000,
+    page_pool: PagePool | None = None,
+    snapshot: SnapshotMode = SnapshotMode.FULL,
+) -> Page:
+    """
+    Load a profile, save its HTML/API responses and detail pages.
+
+    Returns the still-open profile page; the caller closes it, or releases
+    it to page_pool when tabs come from a pool.
+
+    Raises:
+        BlockedResponseError: The profile (or a detail page) was not served;
+            nothing is saved for it.
+    """
     logger.debug("Creating new page for profile parsing")
-    page1 = await context.new_page()
+    page1 = await page_pool.acquire() if page_pool else await context.new_page()
 
     logger.debug("Navigating to profile: %s", profile_url)
-    await page1.goto(profile_url)
-    await page1.wait_for_timeout(5000)
+    try:
+        await goto_checked(page1, profile_url)
+        await page1.wait_for_timeout(settle_ms)
+
+        if api_recorder is not None:
+            await api_recorder.flush()
+            api_recorder.save(page1, os.path.splitext(output_path)[0] + ".api.json")
+
+        if save_html:
+            page_html = await capture_snapshot(page1, snapshot)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(page_html)
+
+            logger.info("Page saved to %s (%d KB)", output_path, len(page_html) // 1024)
+
+        # Truncated sections continue on /details/<section>/ pages; fetch them
+        # all at once in extra tabs. Saved as <profile>.details/<section>.html
+        detail_urls = await ProfilePage(page1, profile_url).get_detail_page_urls()
+        if detail_urls:
+            details_dir = os.path.splitext(output_path)[0] + ".details"
+            os.makedirs(details_dir, exist_ok=True)
+            await asyncio.gather(*(
+                fetch_detail_page(
+                    context, section, url, os.path.join(details_dir, f"{section}.html"), settle_ms, page_pool, snapshot
+                )
+                for section, url in detail_urls.items()
+            ))
+            logger.info("Saved %d detail pages to %s", len(detail_urls), details_dir)
+    except BaseException:
+        # Nothing recorded for a page that wasn't saved may leak into the next one
+        if api_recorder is not None:
+            api_recorder.drain(page1)
+        if page_pool:
+            await page_pool.release(page1)
+        else:
+            await page1.close()
+        raise
+
+    return page1
+
+
+async def crawl_frontier(
+    context: BrowserContext,
+    frontier: Frontier,
+    seen: SeenSet,
+    api_recorder: ApiResponseRecorder | None = None,
+    save_html: bool = True,
+    snapshot: SnapshotMode = SnapshotMode.FULL,
+    max_profiles: int | None = None,
+    in_flight: dict | None = None,
+    page_pool_options: dict | None = None,
+    throttle: AccountThrottle | None = None,
+):
+    """
+    Capture profiles pulled from the frontier, feeding discovered links back in.
+
+    Profiles whose key was already captured are marked done without loading.
+    Crawlers sharing a frontier in one process pass the same in_flight dict,
+    so an idle crawler waits for links its peers may still discover, and
+    crawlers of one account share its throttle.
+    """
+    os.makedirs(PROFILES_DIR, exist_ok=True)
+    captured = 0
+    # Late API responses of a reused tab must not leak into the next profile
+    page_pool = PagePool(
+        context, **(page_pool_options or {}),
+        reset_hooks=[api_recorder.drain] if api_recorder is not None else [],
+    )
+    in_flight = in_flight if in_flight is not None else {"count": 0}
+    throttle = throttle or AccountThrottle()
+
+    while max_profiles is None or captured < max_profiles:
+        await throttle.wait()
+        item = frontier.pop()
+        if item is None:
+            if in_flight["count"]:
+                await asyncio.sleep(1)
+                continue
+            logger.info("Frontier is empty")
+            break
+        if item.key in seen:
+            logger.info("Skipping already captured profile: %s", item.key)
+            frontier.mark_done(item.key)
+            continue
+
+        output_path = os.path.join(PROFILES_DIR, f"{quote(item.key, safe='-_.~')}.html")
+        in_flight["count"] += 1
+        try:
+            # Detail pages can take longer than a lease; keep it while capturing
+            async with frontier.keep_alive(item.key):
+                with tracing.span("capture.profile", depth=item.depth):
+                    page = await parse_linkedin_profile(
+                        context,
+                        profile_url=item.url,
+                        output_path=output_path,
+                        api_recorder=api_recorder,
+                        save_html=save_html,
+                        page_pool=page_pool,
+                        snapshot=snapshot,
+                    )
+                try:
+                    links = await LinkedInLiveProfileExtractor(page).extract_profile_links()
+                finally:
+                    await page_pool.release(page)
+        except BlockedResponseError as e:
+            throttle.record(e.response_class)
+            if e.response_class.blocked:
+                # Not the profile's fault: retry later without using up its attempts
+                frontier.requeue(item.key)
+            else:
+                frontier.mark_failed(item.key, requeue=e.response_class != ResponseClass.NOT_FOUND)
+            logger.warning("Capture of %s not saved: %s", item.url, e)
+            continue
+        except Exception as e:
+            logger.error("Capture failed for %s: %s", item.url, e)
+            frontier.mark_failed(item.key)
+            continue
+        finally:
+            in_flight["count"] -= 1
+
+        throttle.record(ResponseClass.OK)
+        added = frontier.add_many(links, depth=item.depth + 1, source=item.key)
+        logger.info("Captured %s (depth %d), queued %d new profiles", item.key, item.depth, added)
+        seen.add(item.key)
+        frontier.mark_done(item.key)
+        captured += 1
 
-    page_html = await page1.content()
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(page_html)
+    logger.info("Tab pool: %s", page_pool.stats)
+    await page_pool.close()
 
-    logger.info("Page saved to %s", output_path)
+
+async def harvest_search(
+    context: BrowserContext,
+    query: str,
+    filters: dict | None = None,
+    max_pages: int = 10,
+    concurrency: int = 3,
+    output_dir: str = SEARCH_DIR,
+    throttle: AccountThrottle | None = None,
+    snapshot: SnapshotMode = SnapshotMode.FULL,
+) -> list[dict]:
+    """
+    Capture the result pages of a people search, several pages at a time.
+
+    Page 1 is loaded first to learn the result count; the remaining pages
+    are fetched concurrently in up to `concurrency` tabs. Each page is saved
+    as <output_dir>/<query>/page-NNN.html and the extracted results as
+    results.json next to them.
+
+    Returns:
+        Unique results (profile_url, name, headline, ...) in page order.
+    """
+    search_dir = os.path.join(output_dir, quote(query, safe=""))
+    os.makedirs(search_dir, exist_ok=True)
+    throttle = throttle or AccountThrottle()
+    page_pool = PagePool(context, size=concurrency)
+    pages: dict[int, list[dict]] = {}
+    last_page = 1
+
+    async def fetch(page_index: int):
+        nonlocal last_page
+        if page_index > last_page:
+            return  # An earlier page came back empty
+        await throttle.wait()
+        page = await page_pool.acquire()
+        search = SearchResultsPage(page, query, filters, page_index)
+        try:
+            await goto_checked(page, search.url)
+            throttle.record(ResponseClass.OK)
+            if not await search.wait_for_results():
+                last_page = min(last_page, page_index - 1)
+                return
+            if page_index == 1:
+                last_page = await search.last_page_index(max_pages)
+
+            page_html = await capture_snapshot(page, snapshot)
+            with open(os.path.join(search_dir, f"page-{page_index:03d}.html"), "w", encoding="utf-8") as f:
+                f.write(page_html)
+            pages[page_index] = LinkedInSearchResultsExtractor(page_html).extract_results()
+        except BlockedResponseError as e:
+            throttle.record(e.response_class)
+            logger.warning("Search page %d not saved: %s", page_index, e)
+        except Exception as e:
+            logger.error("Search page %d failed: %s", page_index, e)
+        finally:
+            await page_pool.release(page, [search.results])
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_bounded(page_index: int):
+        async with semaphore:
+            await fetch(page_index)
+
+    try:
+        with tracing.span("capture.search", query=query):
+            await fetch(1)
+            logger.info("Search '%s': fetching pages 2-%d", query, last_page)
+            await asyncio.gather(*(fetch_bounded(index) for index in range(2, last_page + 1)))
+    finally:
+        await page_pool.close()
+
+    results = []
+    seen_urls = set()
+    for page_index in sorted(pages):
+        for result in pages[page_index]:
+            if result["profile_url"] not in seen_urls:
+                seen_urls.add(result["profile_url"])
+                results.append(result)
+    with open(os.path.join(search_dir, "results.json"), "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    logger.info("Search '%s': %d results from %d pages saved to %s", query, len(results), len(pages), search_dir)
+    return results
+
+
+def parse_search_filters(values: list[str]) -> dict:
+    """["network=F,S", "geoUrn=102713980"] -> {"network": ["F", "S"], "geoUrn": ["102713980"]}"""
+    filters = {}
+    for value in values:
+        name, _, items = value.partition("=")
+        filters.setdefault(name, []).extend(item for item in items.split(",") if item)
+    return filters
 
 
 async def main():
-    async with async_playwright() as p:
-        context = await launch_browser(p)
+    config = load_config()
+    tracing.configure_from_config(config)
+    capture_config = config.get("capture", {})
+    crawl_config = config.get("crawl", {})
+    api_recorder = ApiResponseRecorder.from_config(capture_config)
+    http_cache = HttpCache.from_config(capture_config)
+    snapshot = SnapshotMode(capture_config.get("snapshot", SnapshotMode.FULL.value))
+
+    parser = argparse.ArgumentParser(description="Capture LinkedIn profiles from the crawl frontier")
+    parser.add_argument("urls", nargs="*", help="Seed profile URLs (depth 0)")
+    parser.add_argument("--max-profiles", type=int, default=None)
+    parser.add_argument("--search", metavar="QUERY", help="Harvest a people search into the frontier first")
+    parser.add_argument(
+        "--search-filter", action="append", default=[], metavar="NAME=V1,V2",
+        help="Search facet, e.g. network=F,S (repeatable)",
+    )
+    parser.add_argument(
+        "--contexts", type=int, default=1,
+        help="Crawl with N lightweight contexts in one browser, sharing the exported session",
+    )
+    args = parser.parse_args()
 
-        logger.info("Running LinkedIn profile parser")
-        await parse_linkedin_profile(context)
-        logger.info("Browser ready for manual interaction")
+    # With leases, several capture processes (or hosts) can share the frontier
+    lease_seconds = crawl_config.get("lease_seconds") or None
+    frontier = Frontier(
+        crawl_config.get("frontier_path", "./bin/crawl/frontier.sqlite"),
+        max_depth=crawl_config.get("max_depth", 1),
+        recover=lease_seconds is None,
+        lease_seconds=lease_seconds,
+        journal_mode=crawl_config.get("journal_mode", "wal"),
+    )
+    if args.urls or not (frontier.stats() or args.search):
+        frontier.add_many(args.urls or DEFAULT_PROFILE_URLS, depth=0)
 
+    # One account per session, so every context shares one throttle
+    throttle = AccountThrottle.from_config(
+        config.get("throttle", {}), account=config.get("context", {}).get("user_data_dir", "default")
+    )
+    page_pool_options = {
+        "size": capture_config.get("tab_pool_size", 4),
+        "max_navigations": capture_config.get("tab_max_navigations", 200),
+        "max_heap_mb": capture_config.get("tab_max_heap_mb", 512),
+    }
+
+    async def queue_search(context: BrowserContext):
+        """Seed the frontier with the profiles of --search (depth 0)."""
+        search_config = config.get("search", {})
+        results = await harvest_search(
+            context,
+            args.search,
+            parse_search_filters(args.search_filter),
+            max_pages=search_config.get("max_pages", 10),
+            concurrency=search_config.get("concurrency", 3),
+            output_dir=search_config.get("output_dir", SEARCH_DIR),
+            throttle=throttle,
+            snapshot=snapshot,
+        )
+        urls = [result["profile_url"] for result in results]
+        added = frontier.add_many(urls, depth=0, source=f"search:{args.search}")
+        logger.info("Queued %d new profiles from search '%s'", added, args.search)
+
+    async with async_playwright() as p:
+        if args.contexts > 1:
+            browser, contexts = await launch_contexts(
+                p, args.contexts, api_recorder=api_recorder, http_cache=http_cache
+            )
+            logger.info("Running LinkedIn profile parser with %d contexts", len(contexts))
+            if args.search:
+                await queue_search(contexts[0])
+            with SeenSet(crawl_config.get("captured_seen_path", "./bin/seen/captured.sqlite")) as seen:
+                # Split the profile budget; pop() never hands one profile to two contexts
+                in_flight = {"count": 0}
+                budgets = [None] * len(contexts)
+                if args.max_profiles is not None:
+                    share, extra = divmod(args.max_profiles, len(contexts))
+                    budgets = [share + (i < extra) for i in range(len(contexts))]
+                await asyncio.gather(*(
+                    crawl_frontier(
+                        context,
+                        frontier,
+                        seen,
+                        api_recorder=api_recorder,
+                        save_html=capture_config.get("save_html", True),
+                        snapshot=snapshot,
+                        max_profiles=budget,
+                        in_flight=in_flight,
+                        page_pool_options=page_pool_options,
+                        throttle=throttle,
+                    )
+                    for context, budget in zip(contexts, budgets)
+                ))
+            frontier.close()
+            await browser.close()
+            return
+
+        context = await launch_browser(p, api_recorder=api_recorder, http_cache=http_cache)
         try:
-            await context.wait_for_event("close", timeout=0)
-        except KeyboardInterrupt:
-            logger.warning("Script interrupted by user")
+            logger.info("Running LinkedIn profile parser")
+            if args.search:
+                await queue_search(context)
+            with SeenSet(crawl_config.get("captured_seen_path", "./bin/seen/captured.sqlite")) as seen:
+                await crawl_frontier(
+                    context,
+                    frontier,
+                    seen,
+                    api_recorder=api_recorder,
+                    save_html=capture_config.get("save_html", True),
+                    snapshot=snapshot,
+                    max_profiles=args.max_profiles,
+                    page_pool_options=page_pool_options,
+                    throttle=throttle,
+                )
+            frontier.close()
+
+            # An attached daemon stays open on its own
+            if not is_attached(context):
+                logger.info("Browser ready for manual interaction")
+                try:
+                    await context.wait_for_event("close", timeout=0)
+                except KeyboardInterrupt:
+                    logger.warning("Script interrupted by user")
         finally:
+            # Also on errors, so tabs of this run don't pile up in an attached daemon
             logger.debug("Closing browser context")
-            await context.close()
+            await close_browser(context)
 
 
 if __name__ == "__main__":
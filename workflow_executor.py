@@ -1,37 +1,92 @@
 import asyncio
 import sys
 import logging
+from contextlib import nullcontext
 from playwright.async_api import async_playwright
 
-from browser import launch_browser
+from browser import close_browser, is_attached, launch_browser, load_config
+from automation import tracing
 from automation.linkedin.profile_page import ProfilePage
+from automation.linkedin.status_store import RelationshipStatusStore
+from capture import PagePool
+from crawl import SeenSet, profile_key, canonicalize_profile_url
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROFILE_URLS = ["https://www.linkedin.com/in/roshanyadavevilgenius/"]
+ACTION = "unfollow"
+
 
 async def main():
+    config = load_config()
+    crawl_config = config.get("crawl", {})
+    capture_config = config.get("capture", {})
+    tracing.configure_from_config(config)
+    profile_urls = sys.argv[1:] or DEFAULT_PROFILE_URLS
+
     async with async_playwright() as p:
         context = await launch_browser(p)
 
-        # Create a new page or use the first one if available (persistent context often has one)
-        page = await context.new_page()
-        profile_url = "https://www.linkedin.com/in/roshanyadavevilgenius/"
+        try:
+            # One tab reused across profiles, replaced after too many navigations or heap growth
+            page_pool = PagePool(
+                context,
+                size=1,
+                max_navigations=capture_config.get("tab_max_navigations", 200),
+                max_heap_mb=capture_config.get("tab_max_heap_mb", 512),
+            )
+
+            with (
+                RelationshipStatusStore.from_config(crawl_config) or nullcontext() as status_store,
+                SeenSet(
+                    crawl_config.get("actions_seen_path", "./bin/seen/actions.sqlite"),
+                    max_age=crawl_config.get("actions_seen_ttl_hours", 168) * 3600 or None,
+                ) as seen,
+            ):
+                for url in profile_urls:
+                    key = profile_key(url)
+                    if key is None:
+                        logger.warning("Skipping non-profile URL: %s", url)
+                        continue
+
+                    # Same profile reached through a different URL form is a duplicate
+                    seen_key = f"{ACTION}:{key}"
+                    if seen_key in seen:
+                        logger.info("Skipping duplicate %s for profile: %s", ACTION, key)
+                        continue
+
+                    profile_url = canonicalize_profile_url(url)
+
+                    # Known no-op (e.g. unfollowing a profile not followed) - don't navigate.
+                    # Not added to seen: the status is only trusted for its TTL
+                    if status_store is not None and status_store.is_no_op(profile_url, ACTION):
+                        continue
 
-        logger.info("Starting workflow for profile: %s", profile_url)
+                    logger.info("Starting workflow for profile: %s", profile_url)
 
-        user_profile = ProfilePage(page=page, profile_url=profile_url)
-        await user_profile.load()
-        # await user_profile.send_connection_request(note="")
-        await user_profile.unfollow_profile()
-        # await user_profile.withdraw_connection_request()
-        # await user_profile.follow_profile()
+                    page = await page_pool.acquire()
+                    user_profile = ProfilePage(page=page, profile_url=profile_url, status_store=status_store)
+                    try:
+                        await user_profile.load()
+                        # await user_profile.send_connection_request(note="")
+                        await user_profile.unfollow_profile()
+                        # await user_profile.withdraw_connection_request()
+                        # await user_profile.follow_profile()
+                    finally:
+                        await page_pool.release(page, [user_profile.profile])
+                    seen.add(seen_key)
 
-        logger.info("Workflow completed successfully")
+            logger.info("Workflow completed successfully")
 
-        # Keep open for manual interaction as requested in the original script
-        await page.wait_for_event("close", timeout=0)
-        logger.debug("Closing browser context")
-        await context.close()
+            # Keep open for manual interaction as requested in the original script
+            # (an attached daemon stays open on its own)
+            if not is_attached(context):
+                page = await page_pool.acquire()
+                await page.wait_for_event("close", timeout=0)
+        finally:
+            # Also on errors, so tabs of this run don't pile up in an attached daemon
+            logger.debug("Closing browser context")
+            await close_browser(context)
 
 
 if __name__ == "__main__":